@@ -0,0 +1,63 @@
+import os
+import sys
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_utils import timeit
+import utils.cache_catalog as cache_catalog
+import utils.ticker_meta as ticker_meta
+import services.favorite_stocks.price_store as price_store
+import services.analysis.report as report
+from services.market_data.provider import set_provider
+from services.market_data.replay_provider import ReplayProvider
+
+# ETF/주식 페이지 한 번 그리기에 필요한 조회+계산(보고서 생성)과, 같은 날 다시 열 때의
+# 메모리 캐시/디스크(.npz) 보고서 로드 시간을 비교한다. 재사용 시 시세 제공자 호출 수가 0인지도 확인한다.
+# 사용법: python benchmarks/analysis_report_bench.py --fixtures data/fixtures [--ticker SCHD]
+
+class CountingProvider(ReplayProvider):
+    calls = 0
+
+    def _simulate(self, ticker):
+        CountingProvider.calls += 1
+        super()._simulate(ticker)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fixtures", required=True, help="replay 픽스처 디렉터리 (history.csv)")
+    parser.add_argument("--ticker", default=None)
+    args = parser.parse_args()
+    ticker = args.ticker or sorted(os.listdir(args.fixtures))[0]
+
+    root = tempfile.mkdtemp(prefix="report_bench_")
+    price_store.STOCK_DATA_DIR = root
+    cache_catalog.CACHE_CATALOG_FILE = os.path.join(root, "catalog.sqlite")
+    ticker_meta.TICKER_META_FILE = os.path.join(root, "ticker_meta.json")
+    report.ANALYSIS_REPORT_DIR = root
+    set_provider(CountingProvider(args.fixtures))
+
+    cold_time, first = timeit(lambda: report.get_analysis_report(ticker))
+    if first is None:
+        raise SystemExit(f"No price fixture for {ticker}")
+    warm_time, _ = timeit(lambda: report.build_report(ticker), repeat=5)
+
+    fetches = CountingProvider.calls
+    memory_time, cached = timeit(lambda: report.get_analysis_report(ticker), repeat=5)
+
+    def from_disk():
+        report._reports.clear()
+        return report.get_analysis_report(ticker)
+    disk_time, loaded = timeit(from_disk, repeat=5)
+    if cached is not first or loaded.series.keys() != first.series.keys() or loaded.current_price != first.current_price:
+        raise SystemExit("cached report differs from the built report")
+    if CountingProvider.calls != fetches:
+        raise SystemExit(f"reopening the report called the provider {CountingProvider.calls - fetches} times")
+
+    print(f"{ticker} ({len(first.dates)} bars): first open {cold_time * 1000:.1f} ms, "
+          f"rebuild with warm price cache {warm_time * 1000:.1f} ms, "
+          f"memory hit {memory_time * 1e6:.0f} us, disk hit {disk_time * 1000:.2f} ms, 0 provider calls on reuse")
+
+if __name__ == "__main__":
+    main()
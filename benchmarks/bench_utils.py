@@ -0,0 +1,13 @@
+import time
+
+# 벤치마크 스크립트가 함께 쓰는 측정 도구.
+# 스크립트를 직접 실행하면 benchmarks 디렉터리가 sys.path에 들어가므로 `from bench_utils import timeit`로 가져온다.
+
+def timeit(fn, repeat=1):
+    """fn()을 repeat번 실행해 (가장 빠른 실행 시간(초), 마지막 결과)를 반환한다."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
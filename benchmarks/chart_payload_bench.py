@@ -0,0 +1,92 @@
+import os
+import sys
+import argparse
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_utils import timeit
+from services.technical.engine import indicator_frame
+from services.technical.extrema import price_range, fibonacci_levels, FIB_LEVELS
+from components.charts import (
+    chart_positions, build_line_chart, build_panel_chart, level_lines, fibonacci_overlay, add_overlays
+)
+
+# ETF/주식 페이지 차트(가격 + 6개 선, 3행 보조지표, 피보나치 레벨) 생성 시간과 브라우저로 보내는 JSON 크기를
+# 이전 방식(px.line + add_scatter/add_trace + add_hline 반복, 전체 봉 SVG)과 공용 차트 빌더로 비교한다.
+# 사용법: python benchmarks/chart_payload_bench.py [--years 1 3 10]
+
+SPECS = [("ma", 10), ("ma", 50), ("ma", 200), ("bollinger", 20, 2), ("macd", 12, 26, 9), ("rsi", 28), ("stoch", 14, 3)]
+
+def synthetic_close(bars, seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range(end="2025-06-30", periods=bars, name="Date")
+    return pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.015, bars))), index=index, name="Close")
+
+def old_figures(close, ind, high, low):
+    fig = px.line(close.to_frame(), x=close.index, y="Close")
+    for name in ["MA10", "MA50", "MA200", "BB20_UPPER", "BB20_LOWER", "BB20_MID"]:
+        fig.add_scatter(x=close.index, y=ind[name], mode="lines", name=name)
+    for level, price in zip(FIB_LEVELS, fibonacci_levels(low, high)):
+        fig.add_hline(y=price, line_dash="dot", line_color="gray", annotation_text=f"Fib {level:.3f}",
+                      annotation_position="top left", opacity=0.5)
+    fig_ind = make_subplots(rows=3, cols=1, shared_xaxes=True, vertical_spacing=0.05)
+    fig_ind.add_trace(go.Scatter(x=close.index, y=ind["MACD"], mode="lines"), row=1, col=1)
+    fig_ind.add_trace(go.Scatter(x=close.index, y=ind["MACD_SIGNAL"], mode="lines"), row=1, col=1)
+    fig_ind.add_trace(go.Bar(x=close.index, y=ind["MACD_HIST"]), row=1, col=1)
+    fig_ind.add_trace(go.Scatter(x=close.index, y=ind["RSI28"], mode="lines"), row=2, col=1)
+    fig_ind.add_hline(y=70, line_dash="dot", line_color="red", row=2, col=1)
+    fig_ind.add_hline(y=30, line_dash="dot", line_color="green", row=2, col=1)
+    fig_ind.add_trace(go.Scatter(x=close.index, y=ind["STOCH14"], mode="lines"), row=3, col=1)
+    fig_ind.add_trace(go.Scatter(x=close.index, y=ind["STOCH14_D3"], mode="lines"), row=3, col=1)
+    fig_ind.add_hline(y=80, line_dash="dot", line_color="red", row=3, col=1)
+    fig_ind.add_hline(y=20, line_dash="dot", line_color="green", row=3, col=1)
+    return fig, fig_ind
+
+def new_figures(close, ind, high, low):
+    positions = chart_positions(close)
+    fig = build_line_chart(close.index, [("Close", close, {})] + [
+        (name, ind[name], {}) for name in ["MA10", "MA50", "MA200", "BB20_UPPER", "BB20_LOWER", "BB20_MID"]
+    ], positions)
+    add_overlays(fig, *fibonacci_overlay(high, low, close.iloc[-1], opacity=0.5))
+    fig_ind = build_panel_chart(close.index, [
+        [("MACD", ind["MACD"], {}), ("Signal", ind["MACD_SIGNAL"], {}), ("Histogram", ind["MACD_HIST"], {"kind": "bar"})],
+        [("RSI(28)", ind["RSI28"], {})],
+        [("Stoch %K", ind["STOCH14"], {}), ("Stoch %D", ind["STOCH14_D3"], {})],
+    ], positions, ["MACD", "RSI", "Stoch"])
+    rsi_lines, _ = level_lines([(70, "red"), (30, "green")], row=2)
+    stoch_lines, _ = level_lines([(80, "red"), (20, "green")], row=3)
+    add_overlays(fig_ind, rsi_lines + stoch_lines)
+    return fig, fig_ind
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--years", type=int, nargs="+", default=[1, 3, 10])
+    args = parser.parse_args()
+
+    for years in args.years:
+        close = synthetic_close(252 * years)
+        ind = indicator_frame(close, SPECS)
+        week52 = price_range(close)
+        high, low = week52["high"], week52["low"]
+
+        positions = chart_positions(close)
+        for pos in (0, len(close) - 1, week52["high_pos"], week52["low_pos"]):
+            if pos not in positions:
+                raise SystemExit(f"{years}y: downsampled chart lost bar {pos} (first/last/high/low)")
+
+        old_time, old = timeit(lambda: old_figures(close, ind, high, low), repeat=3)
+        new_time, new = timeit(lambda: new_figures(close, ind, high, low), repeat=3)
+        old_bytes = sum(len(f.to_json()) for f in old)
+        new_bytes = sum(len(f.to_json()) for f in new)
+        trace_type = new[0].data[1].type
+        print(f"{years:>2}y ({len(close)} bars -> {len(positions)} points, {trace_type}): "
+              f"build {old_time * 1000:.0f} ms -> {new_time * 1000:.0f} ms, "
+              f"payload {old_bytes / 1024:.0f} KiB -> {new_bytes / 1024:.0f} KiB")
+
+if __name__ == "__main__":
+    main()
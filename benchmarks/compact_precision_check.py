@@ -0,0 +1,167 @@
+import os
+import sys
+import argparse
+import tempfile
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.favorite_stocks.price_store import write_prices, read_prices, read_events, EVENT_COLUMNS
+from services.favorite_stocks.indicators import calculate_indicators, calculate_group_indicators
+from services.favorite_stocks.stock_data import merge_delta
+from services.market_data.replay_provider import ReplayProvider
+from services.technical.engine import compute
+from utils.memory_cache import frame_nbytes
+
+# 가격 저장소 압축 모드(float32 + 희소 이벤트)로 저장/로드한 프레임의 지표가 float64 결과와
+# 아래 허용 오차 안에서 같은지, 티커당 메모리가 절반 이하로 줄었는지, 이벤트(배당/분할/자본이득)가
+# 압축 저장 → 로드 → 증분 병합 → 저장을 거쳐도 남는지 확인한다. 하나라도 어긋나면 종료 코드 1.
+# 사용법: python benchmarks/compact_precision_check.py [--tickers 50] [--bars 756] [--fixtures data/fixtures]
+
+# 허용 오차 |압축 - 원본| <= atol + rtol * |원본|
+#   가격 단위 지표(MA/EMA/볼린저/요약 MA): float32 반올림(상대 6e-8)이 평균되어 그대로 남는다
+#   MACD: 두 EMA의 차이라 가격 수준 대비 절대 오차로 본다
+#   0~100 지표(RSI/Stoch)와 % 단위 지표(이격도/수익률/표준편차)는 절대 오차로 본다
+TOLERANCES = {
+    "price": (1e-6, 0.0),
+    "macd": (0.0, 1e-6),  # 가격 수준(중앙값)을 곱해 쓴다
+    "oscillator": (0.0, 0.01),
+    "percent": (0.0, 1e-4),
+}
+CHECK_SPECS = [
+    ("ma", 20), ("ma", 200), ("ema", 12), ("rsi", 14), ("macd", 12, 26, 9),
+    ("stoch", 14, 3), ("bollinger", 20, 2), ("returns",), ("sigma",),
+]
+
+def family(key):
+    if key.startswith("MACD") or key.endswith("_STD"):
+        return "macd"
+    if key.startswith(("MA", "EMA", "BB")):
+        return "price"
+    if key.startswith(("RSI", "STOCH", "Stoch")):
+        return "oscillator"
+    return "percent"
+
+def max_violation(full, compact, key, price_level):
+    rtol, atol = TOLERANCES[family(key)]
+    if family(key) == "macd":
+        atol *= price_level
+    full, compact = np.asarray(full, dtype=float), np.asarray(compact, dtype=float)
+    if key == "RETURN":
+        full, compact = full * 100, compact * 100
+    both = ~np.isnan(full) & ~np.isnan(compact)
+    if not np.array_equal(np.isnan(full), np.isnan(compact)):
+        return np.inf, 0.0
+    if not both.any():
+        return 0.0, 0.0
+    error = np.abs(full[both] - compact[both])
+    limit = atol + rtol * np.abs(full[both])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(error == 0, 0.0, error / limit)
+    return ratio.max(), error.max()
+
+def check_event_round_trip(ticker, df, root, new_bars=5, overlap=5):
+    # 마지막 new_bars개 봉을 뺀 프레임을 압축 저장해 캐시로 읽고, 겹치는 구간을 포함한 델타를 병합해 다시 저장한다.
+    # 새 봉에 이벤트가 있으면 merge_delta가 전체 재수집으로 넘기므로 델타의 새 봉 이벤트는 0으로 둔다.
+    expected = df.copy()
+    expected.iloc[-new_bars:, [expected.columns.get_loc(col) for col in EVENT_COLUMNS]] = 0.0
+    path = os.path.join(root, f"{ticker}.merge.ohlcv")
+    write_prices(path, expected.iloc[:-new_bars], fetched="check", compact=True)
+    cached, _ = read_prices(path)
+    if list(cached.columns) != list(df.columns):
+        raise SystemExit(f"{ticker}: compact store returned columns {list(cached.columns)}, expected {list(df.columns)}")
+    merged = merge_delta(ticker, cached, expected.iloc[-(new_bars + overlap):])
+    if merged is None:
+        raise SystemExit(f"{ticker}: merging the delta into the compact frame asked for a full backfill")
+    write_prices(path, merged, fetched="check", compact=True)
+    stored, _ = read_prices(path)
+    want = expected.loc[stored.index, list(EVENT_COLUMNS)].to_numpy(dtype=float)
+    if not np.array_equal(stored[list(EVENT_COLUMNS)].to_numpy(dtype=float), want):
+        raise SystemExit(f"{ticker}: events lost in compact write -> read -> merge -> write")
+
+def synthetic_frames(count, bars, seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range(end="2025-06-30", periods=bars, tz="America/New_York", name="Date")
+    for i in range(count):
+        level = 10 ** rng.uniform(0, 3.5)  # $1 ~ $3000
+        close = level * np.exp(np.cumsum(rng.normal(0, 0.015, bars)))
+        spread = np.abs(rng.normal(0, 0.008, bars)) * close
+        dividends = np.zeros(bars)
+        dividends[rng.choice(bars, size=bars // 63, replace=False)] = np.round(close.mean() * 0.008, 4)
+        yield f"S{i:03d}", pd.DataFrame({
+            "Open": close + rng.normal(0, 0.3, bars) * spread, "High": close + spread, "Low": close - spread,
+            "Close": close, "Volume": rng.integers(1e4, 5e8, bars).astype(float),
+            "Dividends": dividends, "Stock Splits": 0.0, "Capital Gains": 0.0,
+        }, index=index)
+
+def fixture_frames(root):
+    provider = ReplayProvider(root)
+    for ticker in sorted(os.listdir(root)):
+        df = provider.history(ticker, period="10y")
+        if not df.empty:
+            yield ticker, df
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tickers", type=int, default=50)
+    parser.add_argument("--bars", type=int, default=756)
+    parser.add_argument("--fixtures", default=None, help="replay 픽스처 디렉터리 (history.csv)")
+    args = parser.parse_args()
+
+    frames = dict(synthetic_frames(args.tickers, args.bars))
+    if args.fixtures:
+        frames.update(fixture_frames(args.fixtures))
+
+    root = tempfile.mkdtemp(prefix="compact_check_")
+    worst = {}
+    full_bytes = compact_bytes = 0
+    full_frames, compact_frames = {}, {}
+    for ticker, df in frames.items():
+        full_path, compact_path = os.path.join(root, f"{ticker}.f8.ohlcv"), os.path.join(root, f"{ticker}.f4.ohlcv")
+        write_prices(full_path, df, fetched="check", compact=False)
+        write_prices(compact_path, df, fetched="check", compact=True)
+        full, _ = read_prices(full_path)
+        compact, _ = read_prices(compact_path)
+        full_frames[ticker], compact_frames[ticker] = full, compact
+        full_bytes += frame_nbytes(full)
+        compact_bytes += frame_nbytes(compact)
+
+        expected_events = df[list(EVENT_COLUMNS)].loc[(df[list(EVENT_COLUMNS)] != 0).any(axis=1)]
+        events = read_events(compact_path)
+        if not np.allclose(events.reindex(columns=list(EVENT_COLUMNS), fill_value=0.0).to_numpy(), expected_events.to_numpy()) \
+                or not events.index.equals(expected_events.index):
+            raise SystemExit(f"{ticker}: sparse event table differs from the original columns")
+        check_event_round_trip(ticker, df, root)
+
+        price_level = float(np.nanmedian(full["Close"]))
+        outputs = [
+            (compute(full["Close"], CHECK_SPECS, full["High"], full["Low"]),
+             compute(compact["Close"], CHECK_SPECS, compact["High"], compact["Low"])),
+            (calculate_indicators(full), calculate_indicators(compact)),
+        ]
+        for expected, result in outputs:
+            for key in expected:
+                ratio, error = max_violation(expected[key], result[key], key, price_level)
+                if ratio > worst.get(key, (0, 0, ""))[0]:
+                    worst[key] = (ratio, error, ticker)
+
+    group_full = calculate_group_indicators(full_frames)
+    group_compact = calculate_group_indicators(compact_frames)
+    for key in group_full.columns:
+        ratio, error = max_violation(group_full[key].to_numpy(), group_compact[key].to_numpy(), key, 1.0)
+        if ratio > worst.get(key, (0, 0, ""))[0]:
+            worst[key] = (ratio, error, "group")
+
+    failed = [key for key, (ratio, _, _) in worst.items() if ratio > 1]
+    for key, (ratio, error, ticker) in sorted(worst.items()):
+        print(f"{key:>12}: max error {error:.3g} ({ratio * 100:.1f}% of {family(key)} tolerance, {ticker})")
+    saving = 1 - compact_bytes / full_bytes
+    print(f"{len(frames)} tickers: {full_bytes / len(frames) / 1024:.1f} KiB -> {compact_bytes / len(frames) / 1024:.1f} KiB "
+          f"per ticker ({saving * 100:.0f}% smaller)")
+    if failed or saving <= 0.5:
+        raise SystemExit(f"FAILED: out of tolerance {failed}, memory saving {saving * 100:.0f}%")
+    print("OK")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import os
+import sys
+import argparse
+import pandas as pd
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_utils import timeit
+from services.dividends.table_parser import COLUMNS, iter_dividend_rows, to_dividend_frame
+from utils.constants import REPLAY_FIXTURE_DIR
+
+# 저장된 stockanalysis.com 배당 페이지로 기존 BeautifulSoup(html.parser) 방식과 구간 파서의 속도를 비교한다.
+# 사용법: python benchmarks/dividend_parser_bench.py [페이지.html ...]
+#   파일을 주지 않으면 REPLAY_FIXTURE_DIR/*/dividend_page.html, 그것도 없으면 합성 페이지를 쓴다.
+
+def soup_rows(html):
+    # 변경 전 get_etf_dividend_data의 추출 방식
+    soup = BeautifulSoup(html, "html.parser")
+    tbody = soup.find("div", attrs={"data-test": "dividend-table"}).find("table").find("tbody")
+    rows = []
+    for tr in tbody.find_all("tr"):
+        cells = tr.find_all("td")
+        if len(cells) < 5:
+            continue
+        rows.append(dict(zip(COLUMNS, (cell.get_text(strip=True) for cell in cells[:5]))))
+    return rows
+
+def synthetic_page(n_rows=400, padding_kb=600):
+    # 실제 페이지처럼 표 앞뒤로 스크립트/마크업이 큰 문서를 만든다
+    filler = "<div class='nav'><a href='/x'>link</a><span>text &amp; more</span></div>\n" * (padding_kb * 1024 // 70)
+    dates = pd.bdate_range(end="2025-06-30", periods=n_rows * 20)[::-20][:n_rows]
+    body = "".join(
+        f"<tr class='row'><td>{d:%b %d, %Y}</td><td class='num'>${0.2 + i % 7 / 100:.4f}</td>"
+        f"<td>{d - pd.Timedelta(days=10):%b %d, %Y}</td><td>{d:%b %d, %Y}</td><td>{d + pd.Timedelta(days=5):%b %d, %Y}</td></tr>\n"
+        for i, d in enumerate(dates)
+    )
+    return (
+        f"<html><head><script>{'var a=1;' * 5000}</script></head><body>{filler}"
+        f"<div data-test=\"dividend-table\"><table><thead><tr><th>Ex-Dividend Date</th></tr></thead>"
+        f"<tbody>{body}</tbody></table></div>{filler}</body></html>"
+    )
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("pages", nargs="*")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    pages = args.pages
+    if not pages and os.path.isdir(REPLAY_FIXTURE_DIR):
+        pages = [
+            os.path.join(REPLAY_FIXTURE_DIR, name, "dividend_page.html")
+            for name in sorted(os.listdir(REPLAY_FIXTURE_DIR))
+            if os.path.exists(os.path.join(REPLAY_FIXTURE_DIR, name, "dividend_page.html"))
+        ]
+    sources = [(path, open(path, encoding="utf-8").read()) for path in pages] or [("synthetic", synthetic_page())]
+
+    for name, html in sources:
+        soup_time, expected = timeit(lambda: soup_rows(html), args.repeat)
+        fast_time, rows = timeit(lambda: list(iter_dividend_rows(html)), args.repeat)
+        if rows != expected:
+            raise SystemExit(f"{name}: parsed rows differ from BeautifulSoup output")
+        frame_time, _ = timeit(lambda: to_dividend_frame(iter_dividend_rows(html)), args.repeat)
+        print(
+            f"{name}: {len(html) / 1024:.0f} KB, {len(rows)} rows | "
+            f"soup {soup_time * 1000:.1f} ms, slice+regex {fast_time * 1000:.2f} ms "
+            f"({soup_time / fast_time:.0f}x), with DataFrame {frame_time * 1000:.2f} ms"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import os
+import sys
+import argparse
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_utils import timeit
+from services.favorite_stocks.indicators import calculate_indicators, calculate_group_indicators
+
+# 종목별 calculate_indicators 반복과 그룹 일괄 계산(calculate_group_indicators)의 결과/속도를 비교한다.
+# 이력 길이가 서로 다른 종목(신규 상장 등)을 섞어 봉 위치 정렬도 함께 확인한다.
+# 사용법: python benchmarks/group_indicator_bench.py [--tickers 200] [--bars 756]
+
+def synthetic_group(tickers, bars, seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range(end="2025-06-30", periods=bars, tz="America/New_York", name="Date")
+    frames = {}
+    for i in range(tickers):
+        length = bars if i % 10 else int(rng.integers(30, bars))
+        close = 50 * np.exp(np.cumsum(rng.normal(0, 0.015, length)))
+        spread = np.abs(rng.normal(0, 0.008, length)) * close
+        frames[f"T{i:03d}"] = pd.DataFrame(
+            {"Open": close, "High": close + spread, "Low": close - spread, "Close": close},
+            index=index[-length:],
+        )
+    return frames
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tickers", type=int, default=200)
+    parser.add_argument("--bars", type=int, default=756)
+    args = parser.parse_args()
+
+    frames = synthetic_group(args.tickers, args.bars)
+
+    loop_time, expected = timeit(
+        lambda: pd.DataFrame({ticker: calculate_indicators(df.copy(deep=False)) for ticker, df in frames.items()}).T
+    )
+    batch_time, table = timeit(lambda: calculate_group_indicators(frames))
+
+    expected = expected[table.columns].astype(float)
+    close = np.isclose(table.to_numpy(), expected.to_numpy(), rtol=1e-9, atol=1e-9, equal_nan=True)
+    if not close.all():
+        rows, cols = np.nonzero(~close)
+        raise SystemExit(f"Mismatch at {[(table.index[r], table.columns[c]) for r, c in zip(rows[:5], cols[:5])]}")
+    print(f"{args.tickers} tickers x {args.bars} bars: per-ticker loop {loop_time * 1000:.1f} ms, "
+          f"group batch {batch_time * 1000:.1f} ms ({loop_time / batch_time:.1f}x)")
+
+if __name__ == "__main__":
+    main()
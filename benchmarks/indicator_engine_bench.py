@@ -0,0 +1,74 @@
+import os
+import sys
+import argparse
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_utils import timeit
+from services.technical.engine import compute
+
+# 변경 전 pandas 체인(페이지별 calculate_rsi/macd/stochastic, calculate_indicators, 볼린저 인사이트)과
+# 지표 엔진의 결과/속도를 비교한다.
+# 사용법: python benchmarks/indicator_engine_bench.py [--rows 756] [--tickers 200]
+
+SPECS = [
+    ("ma", 10), ("ma", 20), ("ma", 50), ("ma", 125), ("ma", 200), ("bollinger", 20, 2),
+    ("macd", 12, 26, 9), ("rsi", 14), ("rsi", 28), ("stoch", 14, 3), ("returns",), ("sigma",),
+]
+
+def pandas_chains(close):
+    out = {}
+    for window in (10, 20, 50, 125, 200):
+        out[f"MA{window}"] = close.rolling(window=window).mean()
+    std20 = close.rolling(window=20).std()
+    out["BB20_UPPER"] = out["MA20"] + 2 * std20
+    out["BB20_LOWER"] = out["MA20"] - 2 * std20
+    ema_fast = close.ewm(span=12, adjust=False).mean()
+    ema_slow = close.ewm(span=26, adjust=False).mean()
+    out["MACD"] = ema_fast - ema_slow
+    out["MACD_SIGNAL"] = out["MACD"].ewm(span=9, adjust=False).mean()
+    out["MACD_HIST"] = out["MACD"] - out["MACD_SIGNAL"]
+    for period in (14, 28):
+        delta = close.diff()
+        up = delta.clip(lower=0).rolling(window=period).mean()
+        down = -delta.clip(upper=0).rolling(window=period).mean()
+        out[f"RSI{period}"] = 100 - 100 / (1 + up / down)
+    low_min = close.rolling(window=14).min()
+    high_max = close.rolling(window=14).max()
+    out["STOCH14"] = (close - low_min) / (high_max - low_min) * 100
+    out["STOCH14_D3"] = out["STOCH14"].rolling(window=3).mean()
+    out["RETURN"] = close.pct_change()
+    out["SIGMA"] = out["RETURN"].std() * 100
+    return out
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=756)
+    parser.add_argument("--tickers", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.012, (args.rows, args.tickers)), axis=0))
+    index = pd.bdate_range(end="2025-06-30", periods=args.rows)
+    close = pd.Series(prices[:, 0], index=index)
+    matrix = pd.DataFrame(prices, index=index)
+
+    pandas_time, expected = timeit(lambda: pandas_chains(close), args.repeat)
+    engine_time, result = timeit(lambda: compute(close, SPECS), args.repeat)
+    for key, values in expected.items():
+        if not np.allclose(result[key], values, rtol=1e-9, atol=1e-9, equal_nan=True):
+            raise SystemExit(f"{key}: engine result differs from pandas")
+    print(f"1 ticker x {args.rows} bars: pandas {pandas_time * 1000:.2f} ms, engine {engine_time * 1000:.2f} ms "
+          f"({pandas_time / engine_time:.1f}x)")
+
+    repeat = max(1, args.repeat // 5)
+    pandas_time, _ = timeit(lambda: [pandas_chains(matrix[col]) for col in matrix.columns], repeat)
+    engine_time, _ = timeit(lambda: compute(prices, SPECS), repeat)
+    print(f"{args.tickers} tickers x {args.rows} bars: pandas {pandas_time * 1000:.1f} ms, engine {engine_time * 1000:.1f} ms "
+          f"({pandas_time / engine_time:.1f}x)")
+
+if __name__ == "__main__":
+    main()
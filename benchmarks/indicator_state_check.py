@@ -0,0 +1,78 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import services.favorite_stocks.indicator_state as indicator_state
+from services.favorite_stocks.indicators import calculate_indicators
+
+# 하루 한 봉씩 추가(보관 기간을 넘은 앞쪽 봉은 잘라냄)하면서 증분 지표가 전체 재계산과 같은지 확인하고
+# 봉 하나를 추가하는 비용을 비교한다.
+# 사용법: python benchmarks/indicator_state_check.py [--bars 756] [--steps 300]
+
+def synthetic_prices(n, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.012, n)))
+    spread = np.abs(rng.normal(0, 0.006, n)) * close
+    index = pd.bdate_range(end="2025-06-30", periods=n, tz="America/New_York", name="Date")
+    return pd.DataFrame({"Open": close, "High": close + spread, "Low": close - spread, "Close": close}, index=index)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bars", type=int, default=756)
+    parser.add_argument("--steps", type=int, default=300)
+    args = parser.parse_args()
+
+    indicator_state.INDICATOR_STATE_DIR = tempfile.mkdtemp(prefix="indicator_state_")
+    prices = synthetic_prices(args.bars + args.steps)
+
+    incremental_time, full_time, mismatches = 0.0, 0.0, 0
+    for step in range(args.steps + 1):
+        # 보관 기간은 일정하게 유지: 새 봉 하나가 들어오면 가장 오래된 봉 하나가 빠진다
+        frame = prices.iloc[step:args.bars + step]
+        if step == args.steps // 2:
+            # 재시작을 흉내 내어 메모리 상태를 버리고 디스크에 저장된 상태에서 이어서 갱신
+            indicator_state._states.clear()
+
+        started = time.perf_counter()
+        incremental = indicator_state.incremental_indicators("CHECK", frame)
+        if step > 0:
+            incremental_time += time.perf_counter() - started
+
+        started = time.perf_counter()
+        full = calculate_indicators(frame.copy(deep=False))
+        if step > 0:
+            full_time += time.perf_counter() - started
+
+        diff = {
+            key: (incremental[key], full[key]) for key in full
+            if not np.isclose(incremental[key], full[key], rtol=1e-9, atol=1e-9, equal_nan=True)
+        }
+        if diff:
+            mismatches += 1
+            print(f"step {step}: {diff}")
+
+    # 저장(npz 쓰기)을 뺀 상태 갱신 자체의 비용
+    state = indicator_state.build_state(prices.iloc[:args.bars])
+    frames = [prices.iloc[step:args.bars + step] for step in range(1, args.steps + 1)]
+    started = time.perf_counter()
+    for frame in frames:
+        indicator_state.advance_state(state, frame)
+    update_time = time.perf_counter() - started
+
+    print(
+        f"{args.steps} appends over {args.bars} bars: {mismatches} mismatches | "
+        f"state update {update_time / args.steps * 1e6:.0f} us/bar, "
+        f"incremental incl. save {incremental_time / args.steps * 1e6:.0f} us/bar, "
+        f"full recompute {full_time / args.steps * 1e6:.0f} us/bar"
+    )
+    if mismatches:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import os
+import sys
+import argparse
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_utils import timeit
+from services.technical.extrema import rolling_extrema, rolling_min, rolling_max
+
+# pandas rolling().min()/max() (+ rolling().apply(argmin/argmax)), 이전 엔진의 sliding_window_view 방식과
+# extrema 모듈 이동창 최솟값/최댓값 커널의 결과/속도를 비교한다.
+# 사용법: python benchmarks/rolling_extrema_bench.py [--rows 3024] [--tickers 200]
+
+def pandas_extrema(close, window):
+    rolling = close.rolling(window=window)
+    return rolling.min(), rolling.max(), rolling.apply(np.argmin, raw=True), rolling.apply(np.argmax, raw=True)
+
+def pandas_min_max(close, window):
+    rolling = close.rolling(window=window)
+    return rolling.min(), rolling.max()
+
+def window_view_min_max(values, window):
+    low = np.full(values.shape, np.nan)
+    high = np.full(values.shape, np.nan)
+    view = sliding_window_view(values, window, axis=0)
+    low[window - 1:] = view.min(axis=-1)
+    high[window - 1:] = view.max(axis=-1)
+    return low, high
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=3024)  # 약 12년치 일봉
+    parser.add_argument("--tickers", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.012, (args.rows, args.tickers)), axis=0))
+    close = pd.Series(prices[:, 0], index=pd.bdate_range(end="2025-06-30", periods=args.rows))
+
+    for window in (14, 20, 252):
+        expected_low, expected_high, expected_argmin, expected_argmax = pandas_extrema(close, window)
+        low, high, low_pos, high_pos = rolling_extrema(close, window)
+        offsets = np.arange(args.rows) - window + 1
+        for name, values, expected in (
+            ("min", low, expected_low), ("max", high, expected_high),
+            ("argmin", np.where(low_pos < 0, np.nan, low_pos - offsets), expected_argmin),
+            ("argmax", np.where(high_pos < 0, np.nan, high_pos - offsets), expected_argmax),
+        ):
+            if not np.allclose(values, expected.to_numpy(), equal_nan=True):
+                raise SystemExit(f"window {window} {name}: kernel result differs from pandas")
+
+        pandas_time, _ = timeit(lambda: pandas_min_max(close, window), args.repeat)
+        pandas_arg_time, _ = timeit(lambda: pandas_extrema(close, window), 1)
+        view_time, _ = timeit(lambda: window_view_min_max(prices[:, 0], window), args.repeat)
+        kernel_time, _ = timeit(lambda: (rolling_min(close, window), rolling_max(close, window)), args.repeat)
+        extrema_time, _ = timeit(lambda: rolling_extrema(close, window), args.repeat)
+        print(f"1 ticker x {args.rows} bars, window {window}: "
+              f"min/max - pandas {pandas_time * 1000:.2f} ms, window view {view_time * 1000:.2f} ms, kernel {kernel_time * 1000:.2f} ms | "
+              f"+argmin/argmax - pandas {pandas_arg_time * 1000:.1f} ms, kernel {extrema_time * 1000:.2f} ms "
+              f"({pandas_arg_time / extrema_time:.0f}x)")
+
+        repeat = max(1, args.repeat // 5)
+        matrix = pd.DataFrame(prices)
+        pandas_time, _ = timeit(lambda: pandas_min_max(matrix, window), repeat)
+        view_time, _ = timeit(lambda: window_view_min_max(prices, window), repeat)
+        kernel_time, _ = timeit(lambda: (rolling_min(prices, window), rolling_max(prices, window)), repeat)
+        extrema_time, _ = timeit(lambda: rolling_extrema(prices, window), repeat)
+        print(f"{args.tickers} tickers x {args.rows} bars, window {window}: "
+              f"min/max - pandas {pandas_time * 1000:.1f} ms, window view {view_time * 1000:.1f} ms, kernel {kernel_time * 1000:.1f} ms | "
+              f"+argmin/argmax - kernel {extrema_time * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    main()
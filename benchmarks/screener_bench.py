@@ -0,0 +1,67 @@
+import os
+import sys
+import argparse
+import tempfile
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_utils import timeit
+import utils.cache_catalog as cache_catalog
+import services.favorite_stocks.price_store as price_store
+from services.favorite_stocks.stock_data import load_cached_prices
+from services.favorite_stocks.indicators import calculate_indicators
+from services.screener.screener import run_screener, screen
+
+# 임시 캐시 디렉터리에 합성 가격 저장소를 만들어 두고, 종목별 로드+calculate_indicators 반복과
+# 스크리너(병렬 로드 + 묶음 행렬 계산 + 신호)의 전체 유니버스 처리 시간을 비교한다.
+# 사용법: python benchmarks/screener_bench.py [--tickers 3000] [--bars 756]
+
+def write_universe(count, bars, seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range(end="2025-06-30", periods=bars, tz="America/New_York", name="Date")
+    tickers = [f"T{i:05d}" for i in range(count)]
+    for ticker in tickers:
+        # 상장 기간이 다른 종목도 섞는다
+        n = bars if rng.random() < 0.8 else int(rng.integers(30, bars))
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, n)))
+        spread = np.abs(rng.normal(0, 0.008, n)) * close
+        df = pd.DataFrame(
+            {"Open": close, "High": close + spread, "Low": close - spread, "Close": close, "Volume": 1e6},
+            index=index[-n:],
+        )
+        path = price_store.price_store_path(ticker)
+        price_store.write_prices(path, df, fetched="2025-06-30")
+        cache_catalog.record_entry(path, ticker, "prices", start_date="", end_date="2025-06-30")
+    return tickers
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tickers", type=int, default=3000)
+    parser.add_argument("--bars", type=int, default=756)
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix="screener_bench_")
+    price_store.STOCK_DATA_DIR = root
+    cache_catalog.CACHE_CATALOG_FILE = os.path.join(root, "catalog.sqlite")
+    tickers = write_universe(args.tickers, args.bars)
+
+    loop_time, expected = timeit(
+        lambda: {ticker: calculate_indicators(load_cached_prices(ticker)[0]) for ticker in tickers}
+    )
+    screener_time, table = timeit(lambda: run_screener(tickers))
+
+    for ticker in tickers[::97]:
+        for key, value in expected[ticker].items():
+            if not np.isclose(table.at[ticker, key], value, rtol=1e-9, atol=1e-9, equal_nan=True):
+                raise SystemExit(f"{ticker} {key}: screener result differs from calculate_indicators")
+
+    query_time, hits = timeit(lambda: screen(table, "RSI < 30 and 장기이격도 < -15", sort_by="RSI"))
+
+    print(f"{args.tickers} tickers x {args.bars} bars: per-ticker loop {loop_time:.2f} s, "
+          f"screener {screener_time:.2f} s ({loop_time / screener_time:.1f}x), "
+          f"query {query_time * 1000:.1f} ms -> {len(hits)} hits")
+
+if __name__ == "__main__":
+    main()
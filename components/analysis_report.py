@@ -0,0 +1,127 @@
+import streamlit as st
+
+from components.charts import (
+    chart_positions, build_line_chart, build_panel_chart, level_lines, fibonacci_overlay, add_overlays
+)
+
+# ETF/주식 페이지 공용 화면. services.analysis.report의 보고서만 읽어 차트와 인사이트를 그린다 (조회/지표 계산 없음).
+
+# 차트 표시 기간 (거래일 수). 통계/인사이트는 기간과 무관하게 최근 1년 기준
+CHART_PERIODS = {"1년": 252, "2년": 504, "3년": 756}
+
+def render_charts(report, period_label):
+    # 선택 기간만 잘라 그리고, 길면 종가 기준 LTTB로 줄인 봉만 그린다 (SVG/WebGL은 점 수로 자동 선택)
+    data = report.frame(CHART_PERIODS[period_label])
+    positions = chart_positions(data["Close"])
+
+    # 메인 차트: 가격 + MA, 볼린저밴드(상단, 하단 + 영역 채우기, 중앙 MA20), 피보나치 레벨
+    fig = build_line_chart(data.index, [
+        ("Close", data["Close"], {}),
+        ("MA10", data["MA10"], {"line": dict(color="orange", width=2)}),
+        ("MA50", data["MA50"], {"line": dict(color="purple", width=2)}),
+        ("MA200", data["MA200"], {"line": dict(color="blue", width=2)}),
+        ("Upper BB", data["BB20_UPPER"], {"line": dict(color="lightblue", width=1)}),
+        ("Lower BB", data["BB20_LOWER"], {"line": dict(color="lightblue", width=1),
+                                          "fill": "tonexty", "fillcolor": "rgba(200,200,255,0.2)"}),
+        ("MA20 (BB)", data["BB20_MID"], {"line": dict(color="grey", width=1, dash="dash")}),
+    ], positions, title=f"{report.name} {period_label} 가격 추이", height=600)
+    fig.update_layout(dragmode="zoom", margin=dict(l=40, r=40, t=40, b=40))
+    add_overlays(fig, *fibonacci_overlay(report.week52_high, report.week52_low, report.current_price, opacity=0.5))
+    st.plotly_chart(fig, use_container_width=True, config={"scrollZoom": True})
+
+    # 하단 보조지표 subplot
+    fig_ind = build_panel_chart(data.index, [
+        [("MACD", data["MACD"], {}), ("Signal", data["MACD_SIGNAL"], {}),
+         ("Histogram", data["MACD_HIST"], {"kind": "bar", "marker_color": "grey"})],
+        [("RSI(28)", data["RSI28"], {})],
+        [("Stoch %K", data["STOCH14"], {}), ("Stoch %D", data["STOCH14_D3"], {})],
+    ], positions, ["MACD (12,26,9)", "RSI(28)", "Stochastic Slow (14,3,3)"], height=850, title="보조지표 분석")
+    # RSI 70/30, 스토캐스틱 80/20 기준선
+    rsi_lines, _ = level_lines([(70, "red"), (30, "green")], row=2)
+    stoch_lines, _ = level_lines([(80, "red"), (20, "green")], row=3)
+    add_overlays(fig_ind, rsi_lines + stoch_lines)
+    fig_ind.update_layout(showlegend=True, margin=dict(l=40, r=40, t=60, b=40))
+    st.plotly_chart(fig_ind, use_container_width=True, config={"scrollZoom": True})
+
+def render_insights(report, scenario_title, scenario_view, asset_label):
+    """scenario_title/scenario_view/asset_label: 페이지별 문구 (예: "가치투자 시나리오", "장기 가치 관점", "ETF")."""
+    r = report
+    price = r.current_price
+    macd_now, signal_now, hist_now = r.latest("MACD"), r.latest("MACD_SIGNAL"), r.latest("MACD_HIST")
+    rsi28_now = r.latest("RSI28")
+    stoch_k_now, stoch_d_now = r.latest("STOCH14"), r.latest("STOCH14_D3")
+    ma10_now, ma50_now, ma200_now = r.latest("MA10"), r.latest("MA50"), r.latest("MA200")
+    upper_now, ma20_now, lower_now = r.latest("BB20_UPPER"), r.latest("BB20_MID"), r.latest("BB20_LOWER")
+    zone = f"Fib {r.fib_zone[0]:.3f} ~ {r.fib_zone[1]:.3f}" if r.fib_zone else "범위 외"
+
+    if price < r.week52_high * 0.8:
+        val_msg = "현재 가격이 52주 고점 대비 약 20% 할인되어 있습니다."
+    elif price > r.week52_high * 0.95:
+        val_msg = "현재 가격이 52주 고점에 근접하여 단기 조정 가능성이 있습니다."
+    else:
+        val_msg = "현재 가격은 중간 수준으로, 신중한 접근이 필요합니다."
+
+    # 종목 기본 정보 및 σ 위치
+    summary_info = f"""📌 종목: {r.ticker} ({r.name})
+현재가: ${price:.2f}
+최근 일간 등락률: {r.daily_return:+.2f}%
+평균 일등락률(μ): {r.mean_return:+.2f}%, 표준편차(σ): {r.std_return:.2f}% → **{r.n_sigma:+.1f}σ**
+"""
+
+    technical_insight = f"""📊 **기술적 해석**
+- MACD: {macd_now:+.2f} (Signal: {signal_now:+.2f}, Histogram: {hist_now:+.2f})
+- RSI(28): {rsi28_now:.1f} → {"과매도" if rsi28_now < 30 else ("과매수" if rsi28_now > 70 else "중립")}
+- Stochastic Slow: %K={stoch_k_now:.1f}, %D={stoch_d_now:.1f} → {"과매도" if stoch_k_now < 20 else ("과매수" if stoch_k_now > 80 else "중립")}
+- 이동평균선: MA10={ma10_now:.2f}, MA50={ma50_now:.2f}, MA200={ma200_now:.2f}
+   → { "장기 상승 흐름 유지" if price > ma10_now > ma50_now > ma200_now else ("MA200 하회" if price < ma200_now else "추세 전환 모호") }
+- 골든/데드 크로스: { "골든크로스 발생" if ma50_now > ma200_now else "데드크로스 발생" }
+- 볼린저밴드: 상단={upper_now:.2f}, 중앙(MA20)={ma20_now:.2f}, 하단={lower_now:.2f} → 현재가 { "상단" if price > upper_now else ("하단" if price < lower_now else "중앙") }
+   → { "볼린저밴드 수축 발생" if r.bb_squeeze else "수축 미발생" }
+👉 기술적으로는 **관망 또는 확인 필요** 상태입니다.
+"""
+
+    mdd_info = f"""📈 **MDD 및 회복률 분석**
+- 52주 고점 대비: {r.mdd_52week:+.1f}%
+- 최근 20일 고점 대비: {r.mdd_recent20:+.1f}%
+- 52주 저점 대비 회복률: {r.recovery_from_low:+.1f}%
+- 최근 20일 저점 대비 회복률: {r.recovery_recent20:+.1f}%
+"""
+
+    fib_insight = f"""🧮 **피보나치 분석**
+- 기준: 52주 고점 ${r.week52_high:.2f}, 52주 저점 ${r.week52_low:.2f}
+- 현재가 ${price:.2f}는 {zone} 구간에 위치
+→ 다음 저항: Fib 0.618 구간 (예상 가격: ${(r.week52_low + (r.week52_high - r.week52_low)*0.618):.2f})
+"""
+
+    value_insight = f"""💡 **{scenario_title}**
+- 52주 고점: ${r.week52_high:.2f}, 현재가: ${price:.2f}
+- {val_msg}
+👉 {scenario_view}에서는 **저가 매수 또는 분할 매집 전략**을 고려할 만합니다.
+"""
+
+    dividend_info = f"""📊 배당/수익률 통계 요약
+- 현재 주가: ${price:.2f}
+- 최근 1년간 배당 총액: ${r.dividends_last_year:.4f}
+- 시가 배당률: {r.dividend_yield:.2f}%
+- 평균 일수익률: {r.mean_return:.3f}%
+- 수익률 표준편차: {r.std_return:.3f}%
+- Sharpe Ratio (단순): {r.sharpe_ratio:.3f}
+"""
+    if r.sharpe_ratio < 0:
+        dividend_info += "\n=> 리스크 대비 수익이 비효율적입니다."
+
+    st.markdown(summary_info)
+    st.markdown(technical_insight)
+    st.markdown(mdd_info)
+    st.markdown(fib_insight)
+    st.markdown(value_insight)
+    st.markdown(dividend_info + f"""\n\n⚠️ 참고: Sharpe Ratio는 배당을 반영하지 않으므로, 고배당 {asset_label}에선 낮아도 큰 의미는 없습니다.""")
+    st.caption("※ 본 분석은 투자 참고용이며, 매수/매도 추천이 아닙니다. 투자 판단은 투자자 본인의 책임입니다.")
+
+def render_analysis_report(report, period_label, scenario_title, scenario_view, asset_label):
+    if report.stale:
+        st.warning("시세 서버 응답이 없어 마지막으로 저장된 가격 데이터를 표시합니다.")
+    render_charts(report, period_label)
+    if report.dividend_error:
+        st.warning(f"배당 이력을 불러오지 못했습니다: {report.dividend_error}")
+    render_insights(report, scenario_title, scenario_view, asset_label)
@@ -0,0 +1,99 @@
+import numpy as np
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from services.technical.downsample import lttb_positions
+from services.technical.extrema import FIB_LEVELS, fibonacci_levels
+from utils.constants import CHART_MAX_POINTS, CHART_WEBGL_POINTS
+
+# 가격/보조지표 Plotly 차트 공용 빌더.
+# - 봉 수가 CHART_MAX_POINTS를 넘으면 종가 기준 LTTB로 표시할 봉 위치를 한 번 고르고(전체 고점/저점 포함)
+#   같은 위치를 모든 선/막대에 적용한다 (볼린저밴드 채우기, 호버 날짜가 어긋나지 않게).
+# - 그림 한 장의 선 점 수 합계가 CHART_WEBGL_POINTS를 넘으면 Scatter(SVG) 대신 Scattergl(WebGL)로 그린다.
+# - 트레이스는 그림 생성 시 한 번에 넘기고, 수평선/피보나치 레벨은 add_hline 반복 대신
+#   shape/annotation 목록을 만들어 add_overlays()로 레이아웃을 한 번만 갱신한다.
+#
+# 시리즈 형식: (이름, 값 배열/Series, 트레이스 옵션 dict). 옵션의 "kind": "bar"는 막대로 그린다.
+#   fig = build_line_chart(df.index, [("Close", df["Close"], {}), ("MA50", ma50, {"line": dict(color="purple")})])
+#   add_overlays(fig, *fibonacci_overlay(high, low, current_price))
+
+def chart_positions(close, max_points=CHART_MAX_POINTS):
+    """차트에 그릴 봉 위치. 짧은 시계열은 전체 위치."""
+    return lttb_positions(close, max_points)
+
+def line_class(points):
+    return go.Scattergl if points > CHART_WEBGL_POINTS else go.Scatter
+
+def _traces(index, series, positions, row=None, col=None):
+    x = index[positions]
+    lines = sum(1 for _, _, options in series if options.get("kind") != "bar")
+    scatter = line_class(lines * len(positions))
+    traces = []
+    for name, values, options in series:
+        options = dict(options)
+        kind = options.pop("kind", "line")
+        y = np.asarray(values)[positions]
+        if kind == "bar":
+            traces.append(go.Bar(x=x, y=y, name=name, **options))
+        else:
+            traces.append(scatter(x=x, y=y, mode="lines", name=name, **options))
+    return traces
+
+def build_line_chart(index, series, positions=None, title=None, height=None):
+    """series[0](보통 종가) 기준으로 축소한 선 차트."""
+    if positions is None:
+        positions = chart_positions(series[0][1])
+    fig = go.Figure(data=_traces(index, series, positions))
+    fig.update_layout(title=title, height=height)
+    return fig
+
+def build_panel_chart(index, panels, positions, titles, height=None, title=None):
+    """panels[i]의 시리즈를 i+1번째 행에 그린 x축 공유 subplot 차트."""
+    fig = make_subplots(rows=len(panels), cols=1, shared_xaxes=True,
+                        vertical_spacing=0.05, subplot_titles=titles)
+    for row, series in enumerate(panels, start=1):
+        traces = _traces(index, series, positions)
+        fig.add_traces(traces, rows=[row] * len(traces), cols=[1] * len(traces))
+    fig.update_layout(height=height, title_text=title)
+    return fig
+
+def _axis(name, row):
+    return name if row is None or row == 1 else f"{name}{row}"
+
+def level_lines(levels, row=None, labels=None, label_position="top left", dash="dot", opacity=None):
+    """(y 값, 색) 목록의 수평선 shape와 라벨 annotation. row는 build_panel_chart의 행 번호."""
+    xref, yref = f"{_axis('x', row)} domain", _axis("y", row)
+    right = label_position.endswith("right")
+    shapes, annotations = [], []
+    for i, (y, color) in enumerate(levels):
+        shapes.append(dict(type="line", xref=xref, x0=0, x1=1, yref=yref, y0=y, y1=y,
+                           line=dict(color=color, dash=dash), opacity=opacity))
+        if labels is not None:
+            annotations.append(dict(xref=xref, x=1 if right else 0, yref=yref, y=y, text=labels[i],
+                                    showarrow=False, xanchor="right" if right else "left",
+                                    yanchor="bottom" if label_position.startswith("top") else "top"))
+    return shapes, annotations
+
+def fibonacci_overlay(high, low, current_price=None, descending=False, color="gray",
+                      zone_color="rgba(255, 255, 200, 0.4)", label="Fib {:.3f}", label_position="top left",
+                      opacity=None, levels=FIB_LEVELS):
+    """피보나치 레벨 수평선과, current_price가 놓인 인접 레벨 사이 구간 사각형.
+    descending=True면 레벨 0이 고점(고점에서 내려온 되돌림), False면 레벨 0이 저점."""
+    prices = fibonacci_levels(high, low, levels) if descending else fibonacci_levels(low, high, levels)
+    shapes, annotations = level_lines([(price, color) for price in prices],
+                                      labels=[label.format(level) for level in levels],
+                                      label_position=label_position, opacity=opacity)
+    if current_price is not None:
+        ordered = sorted(prices)
+        for lower, upper in zip(ordered, ordered[1:]):
+            if lower <= current_price <= upper:
+                shapes.insert(0, dict(type="rect", xref="x domain", x0=0, x1=1, yref="y", y0=lower, y1=upper,
+                                      fillcolor=zone_color, line_width=0))
+                break
+    return shapes, annotations
+
+def add_overlays(fig, shapes=(), annotations=()):
+    """shape/annotation을 기존 레이아웃(subplot 제목 등)에 더해 한 번에 갱신한다."""
+    fig.update_layout(shapes=fig.layout.shapes + tuple(shapes),
+                      annotations=fig.layout.annotations + tuple(annotations))
+    return fig
@@ -1,10 +1,12 @@
 ﻿import streamlit as st
 import numpy as np
-import yfinance as yf
 import pandas as pd
 
-from services.favorite_stocks.stock_data import get_stock_data
-from services.favorite_stocks.indicators import calculate_indicators
+from services.favorite_stocks.stock_data import get_group_stock_data
+from utils.ticker_meta import get_ticker_info
+from utils.fetch_executor import submit_fetch, gather
+from services.favorite_stocks.indicators import get_group_indicators
+from services.technical.engine import compute
 from components.favorite_stocks.metrics_table import get_gap_signal_text
 
 def get_aux_signal_insight(value, label):
@@ -19,10 +21,10 @@ def get_aux_signal_insight(value, label):
 
 def get_bollinger_insight(df):
     try:
-        ma20 = df["Close"].rolling(window=20).mean().iloc[-1]
-        std20 = df["Close"].rolling(window=20).std().iloc[-1]
-        upper = ma20 + 2 * std20
-        lower = ma20 - 2 * std20
+        bands = compute(df["Close"], [("bollinger", 20, 2)])
+        ma20 = bands["BB20_MID"][-1]
+        upper = bands["BB20_UPPER"][-1]
+        lower = bands["BB20_LOWER"][-1]
         close = df["Close"].iloc[-1]
 
         rel_diff = (close - ma20) / ma20 * 100
@@ -42,10 +44,9 @@ def get_bollinger_insight(df):
             band_desc = "밴드 폭 넓음"
 
         if len(df) >= 25:
-            ma20_prev = df["Close"].rolling(window=20).mean().iloc[-6]
-            std20_prev = df["Close"].rolling(window=20).std().iloc[-6]
-            upper_prev = ma20_prev + 2 * std20_prev
-            lower_prev = ma20_prev - 2 * std20_prev
+            ma20_prev = bands["BB20_MID"][-6]
+            upper_prev = bands["BB20_UPPER"][-6]
+            lower_prev = bands["BB20_LOWER"][-6]
             band_width_prev = (upper_prev - lower_prev) / ma20_prev * 100
             if band_width > band_width_prev:
                 trend = "밴드 폭 확장 중"
@@ -77,19 +78,19 @@ def render_insights_text(favorites, selected_group):
         return
 
     insights = []
+    info_futures = {ticker: submit_fetch(get_ticker_info, ticker) for ticker in group_tickers}
+    price_frames = get_group_stock_data(group_tickers)
+    # 지표 테이블에서 이미 계산한 결과를 캐시에서 그대로 읽는다
+    indicator_table = get_group_indicators(price_frames)
+    infos = gather(info_futures)
     for ticker in sorted(group_tickers):
-        df = get_stock_data(ticker)
-        if df is None or df.empty:
+        if ticker not in indicator_table.index:
             continue
-        indicators = calculate_indicators(df)
-        try:
-            tkr_obj = yf.Ticker(ticker)
-            info = tkr_obj.info
-            name = info.get("shortName", "N/A")
-            current_price = info.get("regularMarketPrice", df["Close"].iloc[-1])
-        except Exception:
-            name = "N/A"
-            current_price = df["Close"].iloc[-1]
+        df = price_frames[ticker]
+        indicators = indicator_table.loc[ticker].to_dict()
+        info = infos.get(ticker) or {}
+        name = info.get("shortName", "N/A")
+        current_price = info.get("regularMarketPrice", df["Close"].iloc[-1])
 
         summary = f"티커: {ticker}  현재가: {round(current_price,2)} USD  전체 변동률: {round(indicators.get('전체변동률평균',np.nan),1):+.1f}%\n"
 
@@ -1,46 +1,25 @@
 ﻿import streamlit as st
 import pandas as pd
 import numpy as np
-import yfinance as yf
 
-from services.favorite_stocks.stock_data import get_stock_data
-from services.favorite_stocks.indicators import (
-    calculate_indicators,
-    save_stock_insight
-)
+from services.favorite_stocks.stock_data import get_group_stock_data
+from utils.ticker_meta import get_ticker_info
+from utils.fetch_executor import submit_fetch, gather
+from services.favorite_stocks.indicators import get_group_indicators, save_stock_insight
+from services.screener.signals import gap_signal, aux_signal
 
 def get_gap_signal_text(gap, label):
     gap_r = round(gap, 1)
-    if label == "단기":
-        threshold = 5
-    elif label == "중기":
-        threshold = 10
-    elif label == "장기":
-        threshold = 15
-    else:
-        threshold = 10
-    if gap >= threshold:
-        signal = "매도"
-    elif gap <= -threshold:
-        signal = "매수"
-    else:
-        signal = "중립"
-    return f"{label}: {signal} ({gap_r:+.1f}%)"
+    return f"{label}: {gap_signal(gap, label)} ({gap_r:+.1f}%)"
 
 def get_aux_signal_text(value, label):
     val_r = round(value, 1)
-    if value < 30:
-        signal = "매수"
-    elif value > 70:
-        signal = "매도"
-    else:
-        signal = "중립"
-    return f"{label}: {signal} ({val_r:.1f})"
+    return f"{label}: {aux_signal(value)} ({val_r:.1f})"
 
 def color_aux(val):
     try:
         fval = float(val)
-    except:
+    except (TypeError, ValueError):
         return ""
     if fval <= 30:
         return "color: blue"
@@ -57,20 +36,20 @@ def render_metrics_table(favorites, selected_group):
         return
 
     metrics_list = []
+    info_futures = {ticker: submit_fetch(get_ticker_info, ticker) for ticker in group_tickers}
+    price_frames = get_group_stock_data(group_tickers)
+    # 그룹 전체 지표를 (봉 위치, 종목) 행렬로 한 번에 계산 (인사이트 요약과 결과 캐시를 공유)
+    indicator_table = get_group_indicators(price_frames)
+    infos = gather(info_futures)
     for ticker in group_tickers:
-        df = get_stock_data(ticker)
-        if df is None or df.empty:
+        if ticker not in indicator_table.index:
             continue
-        indicators = calculate_indicators(df)
+        df = price_frames[ticker]
+        indicators = indicator_table.loc[ticker].to_dict()
         save_stock_insight(ticker, indicators)
-        try:
-            tkr_obj = yf.Ticker(ticker)
-            info = tkr_obj.info
-            name = info.get("shortName", "N/A")
-            current_price = info.get("regularMarketPrice", df["Close"].iloc[-1])
-        except Exception:
-            name = "N/A"
-            current_price = df["Close"].iloc[-1]
+        info = infos.get(ticker) or {}
+        name = info.get("shortName", "N/A")
+        current_price = info.get("regularMarketPrice", df["Close"].iloc[-1])
 
         entry = {
             "티커": ticker,
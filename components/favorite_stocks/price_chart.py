@@ -2,7 +2,7 @@
 import pandas as pd
 import altair as alt
 
-from services.favorite_stocks.stock_data import get_stock_data
+from services.favorite_stocks.stock_data import get_group_stock_data
 
 def render_price_chart(favorites, selected_group):
     st.subheader("최근 가격 변동 (정규화)")
@@ -25,8 +25,9 @@ def render_price_chart(favorites, selected_group):
         return
 
     chart_df = pd.DataFrame()
+    price_frames = get_group_stock_data(selected_tickers)
     for ticker in selected_tickers:
-        df = get_stock_data(ticker)
+        df = price_frames.get(ticker)
         if df is None or df.empty or len(df) < period_days:
             continue
         df_recent = df.tail(period_days)["Close"]
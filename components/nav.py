@@ -40,6 +40,7 @@ def render_nav(active_page: str, direction: str = "horizontal"):
         "stocks": "🟧 개별 종목 분석",
         "stock_calc": "🧮 매수 계산기",
         "favorite_stocks": "⭐ 관심종목",
+        "screener": "🔍 스크리너",
         "my_dividend_report": "💵 배당 리포트"  # 추가된 항목
     }
 
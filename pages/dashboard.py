@@ -1,56 +1,34 @@
 import streamlit as st
 import streamlit.components.v1 as components
-import plotly.express as px
-import yfinance as yf
-from utils.data_utils import fetch_price
+from services.dashboard.macro_snapshot import get_macro_snapshot
+from services.market_data.resilient_provider import is_stale
+from services.technical.extrema import price_range
+from components.charts import build_line_chart, fibonacci_overlay, add_overlays
 
-def get_change(ticker):
-    try:
-        data = yf.Ticker(ticker).history(period="7d")
-        if not data.empty and len(data) >= 2:
-            sorted_dates = data.index.sort_values()
-            current_date = sorted_dates[-1]
-            previous_date = sorted_dates[-2]
-            previous_close = data.loc[previous_date, "Close"]
-            current_close = data.loc[current_date, "Close"]
-            if previous_close == 0:
-                return None
-            percent = (current_close - previous_close) / previous_close * 100
-            return percent
-        else:
-            return None
-    except:
-        return None
-
-def add_fibonacci_lines(fig, high, low):
-    levels = [0.0, 0.236, 0.382, 0.5, 0.618, 0.786, 1.0]
-    colors = ["#ffe6e6", "#ffcccc", "#ff9999", "#ff6666", "#ff3333", "#cc0000", "#990000"]
-    for level, color in zip(levels, colors):
-        price = high - (high - low) * level
-        fig.add_hline(
-            y=price,
-            line_dash="dot",
-            line_color=color,
-            annotation_text=f"{level:.3f}",
-            annotation_position="top right"
-        )
-    return fig
+MACRO_TICKERS = (
+    "^VIX", "^IRX", "^TNX", "^TYX", "^GSPC", "^DJI", "^IXIC",
+    "DX-Y.NYB", "GC=F", "CL=F", "HG=F", "^RUT"
+)
 
 def render():
     st.header("📊 매크로지표")
 
-    vix = fetch_price("^VIX")
-    irx = fetch_price("^IRX")
-    tnx = fetch_price("^TNX")
-    tyx = fetch_price("^TYX")
-    sp500 = fetch_price("^GSPC")
-    dji = fetch_price("^DJI")
-    nasdaq = fetch_price("^IXIC")
-    usd_idx = fetch_price("DX-Y.NYB")
-    gold = fetch_price("GC=F")
-    oil = fetch_price("CL=F")
-    copper = fetch_price("HG=F")  # 구리 선물
-    russell2000 = fetch_price("^RUT")  # 러쉘2000 지수
+    snapshot = get_macro_snapshot(MACRO_TICKERS)
+    if is_stale(snapshot):
+        st.warning("시세 서버 응답이 없어 마지막으로 받은 지표를 표시합니다.")
+
+    vix = snapshot["^VIX"]["price"]
+    irx = snapshot["^IRX"]["price"]
+    tnx = snapshot["^TNX"]["price"]
+    tyx = snapshot["^TYX"]["price"]
+    sp500 = snapshot["^GSPC"]["price"]
+    dji = snapshot["^DJI"]["price"]
+    nasdaq = snapshot["^IXIC"]["price"]
+    usd_idx = snapshot["DX-Y.NYB"]["price"]
+    gold = snapshot["GC=F"]["price"]
+    oil = snapshot["CL=F"]["price"]
+    copper = snapshot["HG=F"]["price"]  # 구리 선물
+    russell2000 = snapshot["^RUT"]["price"]  # 러쉘2000 지수
 
     spread_10y_3m  = tnx - irx if tnx and irx else None
     spread_30y_10y = tyx - tnx if tyx and tnx else None
@@ -76,7 +54,7 @@ def render():
 
     chart_indicators = [i for i in indicators if not i["ticker"].startswith("spread")]
     for ind in chart_indicators:
-        ind["change"] = get_change(ind["ticker"])
+        ind["change"] = snapshot[ind["ticker"]]["change"]
 
     tabs = st.tabs(["대시보드"] + [i["name"] for i in chart_indicators])
 
@@ -153,44 +131,20 @@ def render():
         with tab:
             st.header(f"{ind['name']} 차트 (1년)")
             try:
-                data = yf.Ticker(ind["ticker"]).history(period="1y")
-                if not data.empty:
+                data = snapshot[ind["ticker"]]["history"]
+                if data is not None and not data.empty:
                     close = data["Close"]
-                    high_52w = close.max()
-                    low_52w = close.min()
+                    year_range = price_range(close)
+                    high_52w, low_52w = year_range["high"], year_range["low"]
                     current_price = close.iloc[-1]
 
-                    fig = px.line(data, x=data.index, y="Close", title=ind["name"])
-                    fig.update_layout(
-                        yaxis_range=[low_52w * 0.95, high_52w * 1.05],
-                        height=500
-                    )
-
-                    levels = [0.0, 0.236, 0.382, 0.5, 0.618, 0.786, 1.0]
-                    for level in levels:
-                        price = high_52w - (high_52w - low_52w) * level
-                        fig.add_hline(
-                            y=price,
-                            line_dash="dot",
-                            line_color="gray",
-                            annotation_text=f"{level:.3f}",
-                            annotation_position="top right"
-                        )
-
-                    for i in range(len(levels) - 1):
-                        upper = high_52w - (high_52w - low_52w) * levels[i]
-                        lower = high_52w - (high_52w - low_52w) * levels[i + 1]
-                        if lower <= current_price <= upper:
-                            fig.add_shape(
-                                type="rect",
-                                x0=data.index.min(),
-                                x1=data.index.max(),
-                                y0=lower,
-                                y1=upper,
-                                fillcolor="rgba(173, 216, 230, 0.3)",
-                                line_width=0,
-                            )
-                            break
+                    fig = build_line_chart(data.index, [("Close", close, {})], title=ind["name"], height=500)
+                    fig.update_layout(yaxis_range=[low_52w * 0.95, high_52w * 1.05])
+                    # 고점(0.000)에서 저점(1.000)으로 내려오는 레벨과 현재가 구간을 한 번에 추가
+                    add_overlays(fig, *fibonacci_overlay(
+                        high_52w, low_52w, current_price, descending=True, label="{:.3f}",
+                        label_position="top right", zone_color="rgba(173, 216, 230, 0.3)"
+                    ))
 
                     st.plotly_chart(fig, use_container_width=True)
                 else:
@@ -1,6 +1,8 @@
 import streamlit as st
 import pandas as pd
-from utils.data_utils import get_etf_dividend_data, fetch_price, get_price_for_dividend
+from utils.data_utils import get_etf_dividend_data, fetch_price, get_reference_prices
+from utils.fetch_executor import submit_fetch
+from services.market_data.resilient_provider import is_stale
 
 def render():
     st.header("📈 배당 정보")
@@ -9,14 +11,18 @@ def render():
 
     if ticker_input:
         try:
+            # 배당 테이블 크롤링과 현재가 조회를 동시에 실행
+            price_future = submit_fetch(fetch_price, ticker_input.strip())
             with st.spinner("📆 배당 데이터를 불러오는 중... 잠시만 기다려주세요."):
-                df = get_etf_dividend_data(ticker_input.strip())
+                df = submit_fetch(get_etf_dividend_data, ticker_input.strip()).result()
 
             if df.empty:
                 st.warning("배당 데이터가 없습니다.")
                 st.stop()
+            if is_stale(df):
+                st.warning("배당 페이지 응답이 없어 마지막으로 받은 배당 이력을 표시합니다.")
 
-            current_price = fetch_price(ticker_input.strip())
+            current_price = price_future.result()
 
             # 최근 1년간 배당금 합산 및 시가배당율 계산
             temp_df = df.copy()
@@ -33,15 +39,11 @@ def render():
                     unsafe_allow_html=True
                 )
 
-            # Reference Price, Yield (%) 계산 (기준가격을 소수점 4자리 문자열 형식으로 포맷)
-            df["Reference Price"] = df["Ex-Dividend Date"].apply(
-                lambda d: get_price_for_dividend(ticker_input.strip(), d)
-            )
-            df["Yield (%)"] = df.apply(
-                lambda row: round((row["Cash Amount"] / row["Reference Price"] * 100), 2)
-                if pd.notna(row["Reference Price"]) and row["Reference Price"] != 0 else None,
-                axis=1
-            )
+            # Reference Price, Yield (%) 계산 (가격 이력은 한 번만 조회하고 벡터 연산으로 매칭)
+            df["Reference Price"] = get_reference_prices(ticker_input.strip(), df["Ex-Dividend Date"])
+            df["Yield (%)"] = (
+                df["Cash Amount"] / df["Reference Price"].where(df["Reference Price"] != 0) * 100
+            ).round(2)
             # Reference Price를 소수점 4자리까지 반올림 후 문자열 형식으로 변환
             df["Reference Price"] = df["Reference Price"].round(4)
             df["Reference Price"] = df["Reference Price"].apply(lambda x: f"{x:.4f}" if pd.notna(x) else None)
@@ -2,7 +2,8 @@ import streamlit as st
 import os
 import json
 import pandas as pd
-import yfinance as yf  # 야후 파이낸스 API 사용
+from utils.ticker_meta import get_quote
+from utils.fetch_executor import submit_fetch, gather
 from datetime import datetime
 
 # 데이터 파일 경로 설정 (상대 경로: ./data)
@@ -69,15 +70,15 @@ def create_snapshot(trans_df):
         return pd.DataFrame()
     snapshot = []
     grouped = trans_df.sort_values(by="날짜").groupby("ETF Ticker")
+    # 현재가 조회는 티커별로 병렬 실행
+    price_futures = {ticker: submit_fetch(get_quote, ticker) for ticker, _ in grouped}
+    prices = gather(price_futures)
     for ticker, group in grouped:
         latest_record = group.iloc[-1]
         current_principal = latest_record["현재원금"]
         cumulative_dividend = group["당일배당금"].sum()
         yield_rate = (cumulative_dividend / current_principal * 100) if current_principal > 0 else 0.0
-        try:
-            price = yf.Ticker(ticker).info.get("regularMarketPrice")
-        except Exception:
-            price = None
+        price = prices.get(ticker)
         snapshot.append({
             "ETF Ticker": ticker,
             "현재가": price if price is not None else 0.0,
@@ -0,0 +1,66 @@
+import time
+import streamlit as st
+
+from services.screener.screener import load_universe, run_screener, screen
+from services.prefetch.scheduler import watched_tickers
+from utils.constants import SCREENER_UNIVERSE_FILE
+from components.favorite_stocks.metrics_table import color_aux
+
+EXAMPLE_QUERIES = [
+    "RSI < 30 and 장기이격도 < -15",
+    "`RSI-Stoch` < 25",
+    "단기신호 == '매수' and RSI신호 == '매수'",
+    "장기이격도 > 15 and RSI > 70",
+]
+
+def render():
+    st.title("종목 스크리너")
+
+    universe = load_universe()
+    if not universe:
+        universe = watched_tickers()
+        st.info(f"종목 목록 파일({SCREENER_UNIVERSE_FILE})이 없어 관심종목/배당 리포트 종목 {len(universe)}개로 스크리닝합니다.")
+    if not universe:
+        st.warning("스크리닝할 종목이 없습니다.")
+        return
+
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        st.write(f"대상 종목: {len(universe)}개")
+    with col2:
+        refresh = st.checkbox("가격 갱신 후 실행 (네트워크)", value=False)
+
+    if st.button("스크리닝 실행") or "screener_table" not in st.session_state:
+        started = time.monotonic()
+        with st.spinner("지표 계산 중..."):
+            st.session_state["screener_table"] = run_screener(universe, refresh=refresh)
+        st.session_state["screener_elapsed"] = time.monotonic() - started
+
+    table = st.session_state["screener_table"]
+    st.caption(f"{len(table)}/{len(universe)}개 종목 계산, {st.session_state.get('screener_elapsed', 0):.1f}초")
+    if table.empty:
+        st.info("로컬 캐시에 가격 데이터가 있는 종목이 없습니다. '가격 갱신 후 실행'을 선택하세요.")
+        return
+
+    example = st.selectbox("조건 예시", [""] + EXAMPLE_QUERIES)
+    query = st.text_input("조건 (pandas query 식, 공백/기호가 있는 열은 `백틱`으로 감싸기)", value=example)
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        sort_by = st.selectbox("정렬 기준", [""] + list(table.columns))
+    with col2:
+        ascending = st.radio("정렬 순서", ["오름차순", "내림차순"], horizontal=True) == "오름차순"
+    with col3:
+        limit = st.number_input("최대 표시 개수", min_value=0, value=200, step=50)
+
+    try:
+        result = screen(table, query=query.strip() or None, sort_by=sort_by or None, ascending=ascending)
+    except Exception as e:
+        st.error(f"조건식을 해석할 수 없습니다: {e}")
+        return
+
+    st.write(f"조건에 맞는 종목: {len(result)}개")
+    if limit:
+        result = result.head(int(limit))
+    styled = (result.round(2).style
+              .map(color_aux, subset=["RSI", "Stoch", "RSI-Stoch"]))
+    st.dataframe(styled, use_container_width=True)
@@ -1,21 +1,23 @@
 import streamlit as st
-import yfinance as yf
 import math
+from utils.fetch_executor import submit_fetch
+from services.market_data.provider import get_provider
 
 
 def fetch_usdkrw_rate():
     try:
-        krw_data = yf.Ticker("KRW=X").history(period="1d")
+        krw_data = get_provider().history("KRW=X", period="1d")
         return krw_data['Close'].iloc[-1] if not krw_data.empty else None
-    except:
+    except Exception as e:
+        print(f"Error fetching data for KRW=X: {e}")
         return None
 
 def fetch_stock_price(ticker):
     try:
-        stock = yf.Ticker(ticker)
-        hist = stock.history(period="1d")
+        hist = get_provider().history(ticker, period="1d")
         return hist['Close'].iloc[-1] if not hist.empty else None
-    except:
+    except Exception as e:
+        print(f"Error fetching data for {ticker}: {e}")
         return None
 
 def render():
@@ -30,8 +32,9 @@ def render():
         with col2:
             shares = st.number_input("매수할 주식 수", min_value=1, step=1, value=10)
 
-        price = fetch_stock_price(ticker)
-        rate = fetch_usdkrw_rate()
+        price_future = submit_fetch(fetch_stock_price, ticker)
+        rate_future = submit_fetch(fetch_usdkrw_rate)
+        price, rate = price_future.result(), rate_future.result()
 
         if price and rate:
             rounded_rate = math.ceil(rate / 10) * 10
@@ -13,6 +13,13 @@ call .venv\Scripts\activate
 echo Installing dependencies from requirements.txt...
 pip install -r requirements.txt
 
+:: Run only the background prefetch scheduler (run.bat prefetch)
+if "%1"=="prefetch" (
+    echo Running background prefetch scheduler...
+    python -m services.prefetch.scheduler
+    exit /b %errorlevel%
+)
+
 :: Run the Streamlit app
 echo Running Streamlit app...
 streamlit run streamlit_app.py
\ No newline at end of file
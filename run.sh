@@ -14,6 +14,13 @@ source venv/bin/activate
 echo "Installing dependencies from requirements.txt..."
 pip install -r requirements.txt
 
+# Run only the background prefetch scheduler (./run.sh prefetch)
+if [ "$1" = "prefetch" ]; then
+    echo "Running background prefetch scheduler..."
+    python -m services.prefetch.scheduler
+    exit $?
+fi
+
 # Run the Streamlit app
 echo "Running Streamlit app..."
 streamlit run streamlit_app.py --server.port 8501 --server.enableCORS false --server.enableXsrfProtection false
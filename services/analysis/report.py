@@ -0,0 +1,219 @@
+import os
+import json
+import logging
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass, fields
+from types import MappingProxyType
+
+from services.favorite_stocks.stock_data import get_stock_data
+from services.market_data.resilient_provider import is_stale
+from services.technical.engine import compute
+from services.technical.extrema import price_range, fibonacci_zone
+from utils.constants import (
+    ANALYSIS_REPORT_DIR, ANALYSIS_REPORT_CACHE_MAX_BYTES, PRICE_CACHE_TTL_SECONDS
+)
+from utils.cache_catalog import record_entry
+from utils.data_utils import fetch_dividends
+from utils.fetch_executor import submit_fetch
+from utils.file_utils import atomic_write
+from utils.market_session import session_str
+from utils.memory_cache import MemoryCache
+from utils.single_flight import SingleFlight
+from utils.ticker_meta import get_ticker_meta
+
+# ETF/주식 페이지가 그리는 종목 분석 보고서.
+# 가격(최대 STOCK_HISTORY_PERIOD), 종목 정보, 배당 이력을 한 번 받아 차트 지표 시계열과 통계/인사이트 스칼라를
+# 모두 계산한 불변 객체를 (티커, 기준일) 단위로 메모리와 디스크(.npz)에 보관한다.
+# 기준일은 가격 캐시와 같은 미국 장 마감일(session_str)이라서 다음 장 마감 전에 다시 열거나 위젯을 바꿔도 조회/계산을 하지 않는다.
+# 시세 서버 응답이 없어 저장된 가격으로 만들었거나 배당 이력 조회에 실패한 보고서는 캐시하지 않는다 (다음 요청에서 다시 만든다).
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s:%(message)s")
+
+# 차트에 그리는 지표 목록 (이동평균, 볼린저밴드, MACD, RSI, 스토캐스틱)
+CHART_SPECS = [
+    ("ma", 10), ("ma", 50), ("ma", 200), ("bollinger", 20, 2),
+    ("macd", 12, 26, 9), ("rsi", 28), ("stoch", 14, 3),
+]
+# 통계/인사이트 기준 구간 (최근 1년, 약 252거래일)
+STATS_BARS = 252
+SERIES_FIELDS = ("dates", "series")
+
+_reports = MemoryCache(ANALYSIS_REPORT_CACHE_MAX_BYTES, PRICE_CACHE_TTL_SECONDS)
+_flights = SingleFlight()
+
+@dataclass(frozen=True)
+class AnalysisReport:
+    ticker: str
+    as_of: str              # 기준 장 마감일 (YYYYMMDD)
+    last_bar: str           # 마지막 봉 날짜 (YYYY-MM-DD)
+    name: str
+    quote_type: str
+    exchange: str
+    stale: bool             # 시세 서버 응답이 없어 마지막으로 저장된 가격으로 만든 보고서
+    dividend_error: str     # 배당 이력 조회 실패 메시지 (성공이면 "")
+    # 현재가와 최근 1년 일간 등락률 통계 (%)
+    current_price: float
+    daily_return: float
+    mean_return: float
+    std_return: float
+    n_sigma: float
+    sharpe_ratio: float     # (평균 일수익률 - 0.1) ÷ 표준편차, 표준편차가 0이면 NaN
+    # 전체 가격 기간 고점/저점과 최근 20일 고점/저점 대비 낙폭·회복률 (%)
+    week52_high: float
+    week52_low: float
+    mdd_52week: float
+    mdd_recent20: float
+    recovery_from_low: float
+    recovery_recent20: float
+    fib_zone: tuple         # 현재가가 놓인 피보나치 레벨 쌍, 범위 밖이면 None
+    bb_squeeze: bool        # 최근 5일 볼린저밴드 폭 평균이 그 전 5일보다 좁음
+    dividends_last_year: float
+    dividend_yield: float
+    # 차트 시계열: 전체 가격 기간 날짜와 "Close" + CHART_SPECS 결과 키 → 읽기 전용 배열
+    dates: pd.DatetimeIndex
+    series: MappingProxyType
+
+    def latest(self, key):
+        return float(self.series[key][-1])
+
+    def frame(self, bars=None):
+        """마지막 bars개 봉(None이면 전체)의 차트용 DataFrame (배열 복사 없음)."""
+        start = 0 if bars is None else max(len(self.dates) - bars, 0)
+        return pd.DataFrame({key: values[start:] for key, values in self.series.items()}, index=self.dates[start:])
+
+def _frozen(values):
+    values = np.array(values, dtype=np.float64)
+    values.setflags(write=False)
+    return values
+
+def build_report(ticker, as_of=None):
+    """가격/정보/배당을 조회해 보고서를 새로 만든다 (캐시 미사용). 가격이 없으면 None."""
+    ticker = ticker.strip().upper()
+    # 가격, 종목 정보, 배당 이력을 동시에 요청
+    info_future = submit_fetch(get_ticker_meta, ticker)
+    dividends_future = submit_fetch(fetch_dividends, ticker)
+    data_full = get_stock_data(ticker)
+    if data_full is None or data_full.empty:
+        return None
+    info = info_future.result()
+
+    full_close = data_full["Close"]
+    indicators = compute(full_close, CHART_SPECS)
+    series = {"Close": _frozen(full_close.to_numpy())}
+    series.update((key, _frozen(values)) for key, values in indicators.items())
+
+    # 통계는 최근 1년 기준
+    close = full_close.tail(STATS_BARS)
+    current_price = float(close.iloc[-1])
+    prev_close = float(close.iloc[-2]) if len(close) > 1 else np.nan
+    daily_return = (current_price - prev_close) / prev_close * 100
+    returns = close.pct_change().dropna()
+    mean_return = float(returns.mean() * 100)
+    std_return = float(returns.std() * 100)
+    has_spread = std_return != 0 and not np.isnan(std_return)
+
+    week52 = price_range(full_close)
+    recent20 = price_range(close, 20)
+    band = (series["BB20_UPPER"] - series["BB20_LOWER"])[-STATS_BARS:]
+
+    dividend_error = ""
+    try:
+        dividends = dividends_future.result()
+    except Exception as e:
+        # 배당 이력 조회 실패는 보고서 전체를 중단하지 않고 배당 통계만 0으로 둔다
+        logging.warning(f"Failed to fetch dividends for {ticker}: {e}")
+        dividends, dividend_error = pd.Series(dtype=float), str(e) or type(e).__name__
+    dividends_last_year = 0.0
+    if not dividends.empty:
+        one_year_ago = pd.Timestamp.today(tz="America/New_York") - pd.DateOffset(years=1)
+        dividends_last_year = float(dividends[dividends.index >= one_year_ago].sum())
+
+    return AnalysisReport(
+        ticker=ticker,
+        as_of=as_of or session_str(),
+        last_bar=data_full.index[-1].strftime("%Y-%m-%d"),
+        name=info.get("shortName", ticker),
+        quote_type=info.get("quoteType", "Unknown"),
+        exchange=info.get("exchange", "Unknown"),
+        stale=is_stale(data_full),
+        dividend_error=dividend_error,
+        current_price=current_price,
+        daily_return=daily_return,
+        mean_return=mean_return,
+        std_return=std_return,
+        n_sigma=(daily_return - mean_return) / std_return if has_spread else 0.0,
+        sharpe_ratio=(mean_return - 0.1) / std_return if has_spread else np.nan,
+        week52_high=float(week52["high"]),
+        week52_low=float(week52["low"]),
+        mdd_52week=float(week52["drawdown"]),
+        mdd_recent20=float(recent20["drawdown"]),
+        recovery_from_low=float(week52["recovery"]),
+        recovery_recent20=float(recent20["recovery"]),
+        fib_zone=fibonacci_zone(current_price, week52["low"], week52["high"]),
+        bb_squeeze=bool(np.nanmean(band[-5:]) < np.nanmean(band[-10:-5])),
+        dividends_last_year=dividends_last_year,
+        dividend_yield=dividends_last_year / current_price * 100,
+        dates=data_full.index,
+        series=MappingProxyType(series),
+    )
+
+def _report_path(ticker, as_of):
+    return os.path.join(ANALYSIS_REPORT_DIR, f"{ticker}_{as_of}.npz")
+
+def _report_nbytes(report):
+    return sum(values.nbytes for values in report.series.values()) + len(report.dates) * 8 + 2048
+
+def _save_report(report):
+    os.makedirs(ANALYSIS_REPORT_DIR, exist_ok=True)
+    meta = {f.name: getattr(report, f.name) for f in fields(report) if f.name not in SERIES_FIELDS}
+    meta["tz"] = str(report.dates.tz) if report.dates.tz is not None else None
+    arrays = {f"series_{key}": values for key, values in report.series.items()}
+    arrays.update(meta=np.array(json.dumps(meta)), dates=report.dates.asi8)
+    path = _report_path(report.ticker, report.as_of)
+    atomic_write(path, lambda f: np.savez(f, **arrays))
+    record_entry(path, report.ticker, "report", end_date=report.last_bar)
+
+def _read_report(ticker, as_of):
+    path = _report_path(ticker, as_of)
+    if not os.path.exists(path):
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as arrays:
+            meta = json.loads(str(arrays["meta"]))
+            tz = meta.pop("tz")
+            dates = pd.DatetimeIndex(arrays["dates"].astype("datetime64[ns]"), name="Date")
+            if tz is not None:
+                dates = dates.tz_localize("UTC").tz_convert(tz)
+            series = {name[len("series_"):]: _frozen(arrays[name]) for name in arrays.files if name.startswith("series_")}
+    except (OSError, ValueError, KeyError) as e:
+        logging.warning(f"Ignoring unreadable analysis report {path}: {e}")
+        return None
+    if meta["fib_zone"] is not None:
+        meta["fib_zone"] = tuple(meta["fib_zone"])
+    return AnalysisReport(dates=dates, series=MappingProxyType(series), **meta)
+
+def _load_report(ticker, as_of):
+    key = (ticker, as_of)
+    # 기다리는 사이 다른 요청이 먼저 만들었을 수 있으므로 메모리 캐시를 다시 확인한다
+    report = _reports.get(key)
+    if report is not None:
+        return report
+    report = _read_report(ticker, as_of)
+    if report is None:
+        report = build_report(ticker, as_of)
+        if report is None or report.stale or report.dividend_error:
+            return report
+        _save_report(report)
+    _reports.put(key, report, _report_nbytes(report))
+    return report
+
+def get_analysis_report(ticker):
+    """가장 최근 장 마감 기준 ticker 보고서. 메모리 → 디스크 → 새로 계산 순서로 찾는다. 가격이 없으면 None."""
+    ticker = ticker.strip().upper()
+    key = (ticker, session_str())
+    report = _reports.get(key)
+    if report is not None:
+        return report
+    # 같은 티커를 동시에 연 세션들은 한 번의 조회/계산 결과를 공유한다
+    return _flights.do(key, _load_report, *key)
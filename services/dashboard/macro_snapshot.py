@@ -0,0 +1,37 @@
+import streamlit as st
+
+from services.market_data.provider import get_provider
+from services.market_data.resilient_provider import is_stale, mark_stale
+
+# 대시보드 갱신 주기 (초)
+MACRO_SNAPSHOT_TTL = 600
+
+# 1년치 일봉 한 번으로 현재가, 전일 대비 등락률, 차트 데이터를 모두 만든다
+@st.cache_data(ttl=MACRO_SNAPSHOT_TTL)
+def _cached_macro_snapshot(tickers: tuple) -> dict:
+    frames = get_provider().download(list(tickers), period="1y")
+    snapshot = {}
+    for ticker in tickers:
+        df = frames.get(ticker)
+        close = df["Close"].dropna() if df is not None else None
+        if close is None or close.empty:
+            snapshot[ticker] = {"price": None, "change": None, "history": None}
+            continue
+
+        change = None
+        if len(close) >= 2 and close.iloc[-2] != 0:
+            change = float((close.iloc[-1] - close.iloc[-2]) / close.iloc[-2] * 100)
+        snapshot[ticker] = {
+            "price": float(close.iloc[-1]),
+            "change": change,
+            "history": df[["Close"]].dropna(),
+        }
+    return mark_stale(snapshot) if is_stale(frames) else snapshot
+
+def get_macro_snapshot(tickers: tuple) -> dict:
+    """{티커: {"price", "change", "history"}}. 시세 서버 대신 마지막 성공 값으로 만들었으면 is_stale()이 True."""
+    snapshot = _cached_macro_snapshot(tickers)
+    if is_stale(snapshot):
+        # 마지막 성공 값으로 만든 결과는 캐시에 남기지 않아 다음 요청에서 다시 조회한다
+        _cached_macro_snapshot.clear(tickers)
+    return snapshot
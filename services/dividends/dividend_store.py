@@ -0,0 +1,77 @@
+import os
+import time
+import logging
+import pandas as pd
+
+from services.dividends.table_parser import COLUMNS, DATE_COLUMNS, parse_dividend_table
+from services.market_data.provider import get_provider
+from services.market_data.resilient_provider import is_stale, mark_stale
+from utils.constants import DIVIDEND_HISTORY_DIR, DIVIDEND_REFRESH_HOURS
+from utils.file_utils import atomic_write
+from utils.single_flight import SingleFlight
+
+# 티커별 배당 이력을 CSV로 보관한다. 재수집할 때는 저장된 마지막 배당락일 이후 행만 덧붙이므로
+# 프로세스를 재시작해도 DIVIDEND_REFRESH_HOURS 안에는 페이지를 다시 긁지 않는다.
+
+_flights = SingleFlight()
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s:%(message)s")
+
+def dividend_history_path(ticker):
+    return os.path.join(DIVIDEND_HISTORY_DIR, f"{ticker.upper()}.csv")
+
+def load_dividend_history(ticker):
+    path = dividend_history_path(ticker)
+    if not os.path.exists(path):
+        return None
+    try:
+        df = pd.read_csv(path, parse_dates=DATE_COLUMNS)
+    except (OSError, ValueError) as e:
+        logging.warning(f"Ignoring unreadable dividend history {path}: {e}")
+        return None
+    return df[COLUMNS]
+
+def save_dividend_history(ticker, df):
+    os.makedirs(DIVIDEND_HISTORY_DIR, exist_ok=True)
+    path = dividend_history_path(ticker)
+    atomic_write(path, lambda f: df.to_csv(f, index=False, date_format="%Y-%m-%d"), mode="w", encoding="utf-8", newline="")
+
+def is_history_fresh(ticker):
+    path = dividend_history_path(ticker)
+    return os.path.exists(path) and time.time() - os.path.getmtime(path) < DIVIDEND_REFRESH_HOURS * 3600
+
+def _refresh(ticker, stored):
+    print(f"[{ticker.upper()}] 🧰 웹에서 수집 (저장된 이력 없음 또는 갱신 주기 경과)")
+    html = get_provider().dividend_page(ticker)
+    stale = is_stale(html)
+
+    latest = None
+    if stored is not None and not stored.empty:
+        latest = stored["Ex-Dividend Date"].max()
+    new_rows = parse_dividend_table(html, after=latest)
+
+    if stored is None:
+        merged = new_rows
+    elif new_rows.empty and not stale:
+        # 새 배당이 없으면 수정 시각만 갱신해 다음 주기까지 다시 긁지 않는다
+        os.utime(dividend_history_path(ticker))
+        return stored
+    else:
+        merged = pd.concat([new_rows, stored], ignore_index=True)
+        merged = merged.sort_values("Ex-Dividend Date", ascending=False).reset_index(drop=True)
+
+    if stale:
+        # 페이지를 받지 못해 마지막으로 받은 본문을 쓴 경우: 저장/수정 시각 갱신 없이 다음 요청에서 다시 긁는다
+        logging.warning(f"Dividend page for {ticker.upper()} is stale, not storing it")
+        return mark_stale(merged)
+
+    save_dividend_history(ticker, merged)
+    logging.info(f"Stored {len(new_rows)} new dividend rows for {ticker.upper()}")
+    return merged
+
+def get_dividend_history(ticker, force=False):
+    """저장된 배당 이력을 반환하고, 오래되었거나 없으면 새 배당락일 행만 받아 덧붙인다."""
+    stored = load_dividend_history(ticker)
+    if stored is not None and not force and is_history_fresh(ticker):
+        return stored
+    return _flights.do(ticker.upper(), _refresh, ticker, stored)
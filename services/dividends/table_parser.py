@@ -0,0 +1,62 @@
+import re
+import pandas as pd
+from html import unescape
+
+# stockanalysis.com 배당 페이지에서 dividend-table 구간만 잘라 정규식으로 읽는다.
+# 문서 전체로 BeautifulSoup 트리를 만드는 것보다 훨씬 빠르고, 외부 파서 의존성도 없다.
+
+COLUMNS = ["Ex-Dividend Date", "Cash Amount", "Declaration Date", "Record Date", "Pay Date"]
+DATE_COLUMNS = ["Ex-Dividend Date", "Declaration Date", "Record Date", "Pay Date"]
+
+_TABLE_DIV = re.compile(r"""data-test\s*=\s*["']dividend-table["']""", re.I)
+_TABLE_OPEN = re.compile(r"<table\b", re.I)
+_TBODY = re.compile(r"<tbody\b[^>]*>(.*?)</tbody>", re.I | re.S)
+_ROW = re.compile(r"<tr\b[^>]*>(.*?)</tr>", re.I | re.S)
+_CELL = re.compile(r"<td\b[^>]*>(.*?)</td>", re.I | re.S)
+_TAG = re.compile(r"<[^>]*>")
+
+def _cell_text(cell):
+    return unescape(_TAG.sub("", cell)).strip()
+
+def _table_body(html):
+    div = _TABLE_DIV.search(html)
+    if div is None:
+        raise Exception("Cannot find dividend table div")
+    table = _TABLE_OPEN.search(html, div.end())
+    if table is None:
+        raise Exception("Cannot find table tag")
+    tbody = _TBODY.search(html, table.end())
+    if tbody is None:
+        raise Exception("Cannot find tbody")
+    return tbody.group(1)
+
+def iter_dividend_rows(html):
+    """dividend-table의 각 행을 (원문 문자열) dict로 순서대로 돌려준다."""
+    for row in _ROW.finditer(_table_body(html)):
+        cells = _CELL.findall(row.group(1))
+        if len(cells) < 5:
+            continue
+        yield dict(zip(COLUMNS, (_cell_text(cell) for cell in cells[:5])))
+
+def to_dividend_frame(rows):
+    df = pd.DataFrame(list(rows), columns=COLUMNS)
+
+    # 날짜 변환
+    for col in DATE_COLUMNS:
+        df[col] = pd.to_datetime(df[col], format="%b %d, %Y", errors="coerce")
+
+    # 배당금 숫자 처리
+    df["Cash Amount"] = (
+        df["Cash Amount"].str.replace("$", "", regex=False).str.replace(",", "", regex=False)
+    )
+    df["Cash Amount"] = pd.to_numeric(df["Cash Amount"], errors="coerce")
+
+    # 정렬
+    return df.sort_values("Ex-Dividend Date", ascending=False).reset_index(drop=True)
+
+def parse_dividend_table(html, after=None):
+    """배당 표를 DataFrame으로 변환한다. after가 주어지면 그보다 나중 배당락일 행만 남긴다."""
+    df = to_dividend_frame(iter_dividend_rows(html))
+    if after is not None:
+        df = df[df["Ex-Dividend Date"] > after].reset_index(drop=True)
+    return df
@@ -0,0 +1,252 @@
+import os
+import json
+import logging
+import threading
+import numpy as np
+import pandas as pd
+from collections import deque
+
+from services.favorite_stocks.indicators import calculate_indicators, summarize_indicators
+from utils.constants import INDICATOR_STATE_DIR, RESTATEMENT_RTOL
+from utils.file_utils import atomic_write
+
+# 관심종목 지표(MA20/125/200, RSI14, Stoch14, 수익률 표준편차)를 티커별 상태로 보관하고
+# 새 봉이 추가될 때마다 상수 시간에 갱신한다. 상태는 이동창 값과 합계, 최저/최고가 단조 덱으로 이루어진다.
+# 과거 가격이 재조정되었거나(분할/배당) 상태가 없으면 전체 프레임으로 다시 만든다.
+
+MA_WINDOWS = (20, 125, 200)
+RSI_WINDOW = 14
+STOCH_WINDOW = 14
+# 누적 덧셈/뺄셈 오차가 쌓이지 않도록 이 횟수마다 합계를 창에서 다시 더한다
+RESUM_INTERVAL = 64
+
+_states = {}
+_lock = threading.Lock()
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s:%(message)s")
+
+class IndicatorState:
+    def __init__(self):
+        self.bars = 0          # 지금까지 넣은 봉 수 (단조 덱의 위치 기준)
+        self.length = 0        # 현재 프레임 길이 (앞쪽 봉이 잘리면 줄어든다)
+        self.last_date = None
+        self.last_close = None
+        self.updates = 0
+        self.closes = {w: deque(maxlen=w) for w in MA_WINDOWS}
+        self.close_sums = {w: 0.0 for w in MA_WINDOWS}
+        self.gains = deque(maxlen=RSI_WINDOW)
+        self.losses = deque(maxlen=RSI_WINDOW)
+        self.gain_sum = 0.0
+        self.loss_sum = 0.0
+        self.lows = deque()    # (위치, 저가) 저가 오름차순
+        self.highs = deque()   # (위치, 고가) 고가 내림차순
+        self.returns = deque() # 프레임 두 번째 봉부터의 일간 수익률
+        self.return_sum = 0.0
+        self.return_sq = 0.0
+
+    def push(self, date, close, high, low):
+        if self.last_close is not None:
+            delta = close - self.last_close
+            self.gain_sum += _push_window(self.gains, max(delta, 0.0))
+            self.loss_sum += _push_window(self.losses, max(-delta, 0.0))
+            ret = close / self.last_close - 1
+            self.returns.append(ret)
+            self.return_sum += ret
+            self.return_sq += ret * ret
+        for window in MA_WINDOWS:
+            self.close_sums[window] += _push_window(self.closes[window], close)
+
+        position = self.bars
+        while self.lows and self.lows[-1][1] >= low:
+            self.lows.pop()
+        self.lows.append((position, low))
+        while self.highs and self.highs[-1][1] <= high:
+            self.highs.pop()
+        self.highs.append((position, high))
+        while self.lows[0][0] <= position - STOCH_WINDOW:
+            self.lows.popleft()
+        while self.highs[0][0] <= position - STOCH_WINDOW:
+            self.highs.popleft()
+
+        self.bars += 1
+        self.length += 1
+        self.last_date = date
+        self.last_close = close
+        self.updates += 1
+        if self.updates % RESUM_INTERVAL == 0:
+            self.resum()
+
+    def drop_front(self, count):
+        # 보관 기간을 넘어 프레임 앞쪽에서 잘린 봉의 수익률을 뺀다 (이동창은 뒤쪽이라 영향 없음)
+        for _ in range(count):
+            if self.returns:
+                ret = self.returns.popleft()
+                self.return_sum -= ret
+                self.return_sq -= ret * ret
+        self.length -= count
+
+    def resum(self):
+        for window in MA_WINDOWS:
+            self.close_sums[window] = sum(self.closes[window])
+        self.gain_sum = sum(self.gains)
+        self.loss_sum = sum(self.losses)
+        self.return_sum = sum(self.returns)
+        self.return_sq = sum(ret * ret for ret in self.returns)
+
+    def moving_average(self, window):
+        if self.length < window:
+            return np.nan
+        return self.close_sums[window] / window
+
+    def rsi(self):
+        if self.length <= RSI_WINDOW:
+            return np.nan
+        avg_gain = self.gain_sum / RSI_WINDOW
+        avg_loss = self.loss_sum / RSI_WINDOW
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return float(100 - 100 / (1 + np.float64(avg_gain) / avg_loss))
+
+    def stoch(self):
+        if self.length < STOCH_WINDOW:
+            return np.nan
+        lowest, highest = self.lows[0][1], self.highs[0][1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return float(100 * np.float64(self.last_close - lowest) / (highest - lowest))
+
+    def sigma(self):
+        count = len(self.returns)
+        if count < 2:
+            return np.nan
+        mean = self.return_sum / count
+        variance = max(self.return_sq - self.return_sum * mean, 0.0) / (count - 1)
+        return float(np.sqrt(variance) * 100)
+
+    def to_arrays(self):
+        meta = {
+            "bars": self.bars, "length": self.length, "updates": self.updates,
+            "last_date": self.last_date.isoformat(), "last_close": self.last_close,
+        }
+        arrays = {f"closes{w}": np.array(self.closes[w], dtype=float) for w in MA_WINDOWS}
+        arrays.update(
+            meta=np.array(json.dumps(meta)),
+            gains=np.array(self.gains, dtype=float), losses=np.array(self.losses, dtype=float),
+            lows=np.array(self.lows, dtype=float).reshape(-1, 2), highs=np.array(self.highs, dtype=float).reshape(-1, 2),
+            returns=np.array(self.returns, dtype=float),
+        )
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        state = cls()
+        meta = json.loads(str(arrays["meta"]))
+        state.bars, state.length, state.updates = meta["bars"], meta["length"], meta["updates"]
+        state.last_date = pd.Timestamp(meta["last_date"])
+        state.last_close = meta["last_close"]
+        for window in MA_WINDOWS:
+            state.closes[window].extend(arrays[f"closes{window}"].tolist())
+        state.gains.extend(arrays["gains"].tolist())
+        state.losses.extend(arrays["losses"].tolist())
+        state.lows.extend((int(position), value) for position, value in arrays["lows"].tolist())
+        state.highs.extend((int(position), value) for position, value in arrays["highs"].tolist())
+        state.returns.extend(arrays["returns"].tolist())
+        state.resum()
+        return state
+
+def _push_window(window, value):
+    # 꽉 찬 창에 값을 넣으면서 합계 변화량(새 값 - 빠지는 값)을 반환한다
+    removed = window[0] if len(window) == window.maxlen else 0.0
+    window.append(value)
+    return value - removed
+
+def _state_path(ticker):
+    return os.path.join(INDICATOR_STATE_DIR, f"{ticker}.npz")
+
+def _load_state(ticker):
+    path = _state_path(ticker)
+    if not os.path.exists(path):
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as arrays:
+            return IndicatorState.from_arrays(arrays)
+    except (OSError, ValueError, KeyError) as e:
+        logging.warning(f"Ignoring unreadable indicator state {path}: {e}")
+        return None
+
+def _save_state(ticker, state):
+    os.makedirs(INDICATOR_STATE_DIR, exist_ok=True)
+    atomic_write(_state_path(ticker), lambda f: np.savez(f, **state.to_arrays()))
+
+def _price_arrays(df, start=0):
+    closes = df["Close"].to_numpy()[start:]
+    highs = df["High"].to_numpy()[start:]
+    lows = df["Low"].to_numpy()[start:]
+    # NaN이 섞인 봉은 pandas 이동창 규칙을 따라야 하므로 상태로 처리하지 않는다
+    if np.isnan(closes).any() or np.isnan(highs).any() or np.isnan(lows).any():
+        return None
+    return closes, highs, lows
+
+def build_state(df):
+    """df 전체로 상태를 만든다. 가격에 NaN이 있으면 None."""
+    arrays = _price_arrays(df)
+    if arrays is None or df.empty:
+        return None
+    state = IndicatorState()
+    for date, close, high, low in zip(df.index, *arrays):
+        state.push(date, float(close), float(high), float(low))
+    return state
+
+def advance_state(state, df):
+    """state를 df의 마지막 봉까지 갱신하고 (새 봉 수, state)를 반환한다. 처음부터 다시 만들어야 하면 None."""
+    if state is None or state.last_date is None or df.empty:
+        return None
+    index = df.index
+    position = int(index.searchsorted(state.last_date))
+    if position >= len(index) or index[position] != state.last_date:
+        return None
+    if not np.isclose(df["Close"].iat[position], state.last_close, rtol=RESTATEMENT_RTOL):
+        return None
+
+    new_count = len(index) - position - 1
+    dropped = state.length + new_count - len(index)
+    arrays = _price_arrays(df, position + 1)
+    if dropped < 0 or arrays is None:
+        return None
+    state.drop_front(dropped)
+    for date, close, high, low in zip(index[position + 1:], *arrays):
+        state.push(date, float(close), float(high), float(low))
+    return new_count, state
+
+def state_indicators(state, df):
+    return summarize_indicators(
+        df["Close"].iloc[0], state.last_close, state.sigma(), state.rsi(), state.stoch(),
+        state.moving_average(20), state.moving_average(125), state.moving_average(200),
+    )
+
+def incremental_indicators(ticker, df):
+    """calculate_indicators(df)와 같은 값을 티커별 상태로 증분 계산한다."""
+    with _lock:
+        state = _states.get(ticker) or _load_state(ticker)
+        advanced = advance_state(state, df)
+        if advanced is None:
+            state = build_state(df)
+            if state is None:
+                _states.pop(ticker, None)
+                return calculate_indicators(df)
+            changed = True
+            logging.info(f"Rebuilt indicator state for {ticker} from {len(df)} bars")
+        else:
+            new_count, state = advanced
+            changed = new_count > 0
+        _states[ticker] = state
+        if changed:
+            _save_state(ticker, state)
+        return state_indicators(state, df)
+
+def verify_state(ticker, df, rtol=1e-9):
+    """증분 결과와 전체 재계산 결과를 비교하여 다른 항목을 {키: (증분, 전체)}로 반환한다."""
+    incremental = incremental_indicators(ticker, df)
+    full = calculate_indicators(df)
+    return {
+        key: (incremental[key], full[key]) for key in full
+        if not np.isclose(incremental[key], full[key], rtol=rtol, atol=1e-9, equal_nan=True)
+    }
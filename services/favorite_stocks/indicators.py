@@ -1,54 +1,127 @@
-﻿import os
+import os
 import pandas as pd
 import numpy as np
 import logging
 
-from utils.constants import STOCK_INSIGHT_DIR, TODAY_STR, FILE_EXPIRY_DAYS
-from services.favorite_stocks.stock_data import cleanup_old_files
+from services.technical.engine import compute
+from services.technical.extrema import as_price_array
+from utils.constants import (
+    STOCK_INSIGHT_DIR, today_str,
+    INDICATOR_CACHE_MAX_BYTES, INDICATOR_CACHE_ENTRY_BYTES, PRICE_CACHE_TTL_SECONDS
+)
+from utils.cache_catalog import record_entry, sweep_expired
+from utils.file_utils import atomic_write
+from utils.memory_cache import MemoryCache
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s:%(message)s")
 
-def calculate_indicators(df):
-    indicators = {}
+# 관심종목 지표 테이블/인사이트에 쓰는 지표 목록
+INSIGHT_SPECS = [("ma", 20), ("ma", 125), ("ma", 200), ("sigma",), ("rsi", 14), ("stoch", 14, 3)]
+# 이동창 지표는 최종값만 쓰므로 가장 긴 창(+diff 1봉)에 필요한 마지막 봉들로만 계산한다
+WINDOW_SPECS = [spec for spec in INSIGHT_SPECS if spec[0] != "sigma"]
+TAIL_BARS = max(spec[1] + (spec[2] if spec[0] == "stoch" else 0) for spec in WINDOW_SPECS) + 1
+
+# (티커, 마지막 봉, 마지막 종가, 봉 수, 지표 목록) → 지표 dict. 여러 컴포넌트와 세션이 함께 쓴다.
+_indicator_results = MemoryCache(INDICATOR_CACHE_MAX_BYTES, PRICE_CACHE_TTL_SECONDS)
+
+def calculate_indicators(prices):
+    """가격(DataFrame 또는 Close/High/Low 배열 매핑)의 지표 요약 dict를 반환한다.
+    입력은 읽기만 하므로 읽기 전용·memmap·여러 세션이 공유하는 가격 배열을 복사 없이 넘겨도 된다."""
+    close = as_price_array(prices["Close"])
+    series = _final_series(close, as_price_array(prices["High"]), as_price_array(prices["Low"]))
+
+    return summarize_indicators(
+        float(close[0]), float(close[-1]), series["SIGMA"], series["RSI14"][-1], series["STOCH14"][-1],
+        series["MA20"][-1], series["MA125"][-1], series["MA200"][-1],
+    )
+
+def _final_series(close, high, low):
+    # 수익률 표준편차만 전체 구간, 나머지는 마지막 TAIL_BARS 봉으로 계산한다 (최종값은 전체 계산과 같다)
+    tail = slice(-TAIL_BARS, None)
+    series = compute(close[tail], WINDOW_SPECS, high=high[tail], low=low[tail])
+    series["SIGMA"] = compute(close, [("sigma",)])["SIGMA"]
+    return series
+
+def align_by_bar(price_frames, column):
+    # 종목마다 마지막 봉을 맞춰 (봉 위치, 종목) 행렬을 만든다. 이력이 짧은 종목은 앞쪽이 NaN.
+    # 날짜가 아닌 봉 위치로 맞추므로 거래소 휴일이 달라도 종목별 이동창이 개별 계산과 같다.
+    # 모든 종목이 float32(압축 모드)면 행렬도 float32로 만든다
+    columns = [as_price_array(prices[column]) for prices in price_frames.values()]
+    rows = max(len(values) for values in columns)
+    matrix = np.full((rows, len(columns)), np.nan, dtype=np.result_type(*columns))
+    for j, values in enumerate(columns):
+        matrix[rows - len(values):, j] = values
+    return matrix
+
+def calculate_group_indicators(price_frames):
+    """{티커: 가격}의 지표를 한 번에 계산하여 티커 인덱스의 지표 테이블로 반환한다.
+    가격은 DataFrame 또는 Close/High/Low 배열 매핑 (읽기 전용 memmap 배열도 된다)."""
+    price_frames = {
+        ticker: prices for ticker, prices in price_frames.items()
+        if prices is not None and len(prices["Close"])
+    }
+    if not price_frames:
+        return pd.DataFrame()
+
+    closes = align_by_bar(price_frames, "Close")
+    series = _final_series(closes, align_by_bar(price_frames, "High"), align_by_bar(price_frames, "Low"))
+    lengths = np.array([len(prices["Close"]) for prices in price_frames.values()])
+    start_prices = closes[len(closes) - lengths, np.arange(len(lengths))].astype(np.float64)
 
-    df["MA20"] = df["Close"].rolling(window=20).mean()
-    df["MA125"] = df["Close"].rolling(window=125).mean()
-    df["MA200"] = df["Close"].rolling(window=200).mean()
-    
-    start_price = df["Close"].iloc[0]
-    end_price = df["Close"].iloc[-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        indicators = summarize_indicators(
+            start_prices, closes[-1].astype(np.float64), series["SIGMA"], series["RSI14"][-1], series["STOCH14"][-1],
+            series["MA20"][-1], series["MA125"][-1], series["MA200"][-1],
+        )
+    return pd.DataFrame(indicators, index=pd.Index(list(price_frames), name="Ticker"))
+
+def _result_key(ticker, df):
+    # 마지막 종가와 봉 수도 넣어 같은 날 재조정(백필)된 프레임은 다른 키가 되게 한다
+    return (ticker, df.index[-1], float(df["Close"].iat[-1]), len(df), tuple(INSIGHT_SPECS))
+
+def get_group_indicators(price_frames):
+    """캐시된 지표를 먼저 쓰고, 없거나 새 봉이 들어온 종목만 모아서 일괄 계산한다."""
+    rows, missing = {}, {}
+    for ticker, df in price_frames.items():
+        if df is None or df.empty:
+            continue
+        cached = _indicator_results.get(_result_key(ticker, df))
+        if cached is None:
+            missing[ticker] = df
+        else:
+            rows[ticker] = cached
+
+    if missing:
+        for ticker, values in calculate_group_indicators(missing).to_dict("index").items():
+            _indicator_results.put(_result_key(ticker, missing[ticker]), values, INDICATOR_CACHE_ENTRY_BYTES)
+            rows[ticker] = values
+
+    order = [ticker for ticker in price_frames if ticker in rows]
+    table = pd.DataFrame.from_dict({ticker: rows[ticker] for ticker in order}, orient="index")
+    table.index.name = "Ticker"
+    return table
+
+def summarize_indicators(start_price, end_price, std_return, rsi, stoch, ma20, ma125, ma200):
+    # 지표 최종값으로 테이블/인사이트용 dict를 만든다 (전체 재계산, 증분 갱신, 그룹 일괄 계산이 함께 쓴다)
+    indicators = {}
     indicators["전체변동률평균"] = (end_price / start_price - 1) * 100
 
-    df["Return"] = df["Close"].pct_change()
-    std_return = df["Return"].std() * 100
     indicators["표준편차"] = std_return
     indicators["-1 시그마"] = -1 * std_return
     indicators["-2 시그마"] = -2 * std_return
     indicators["-3 시그마"] = -3 * std_return
 
-    delta = df["Close"].diff()
-    gain = delta.clip(lower=0).rolling(window=14).mean()
-    loss = -delta.clip(upper=0).rolling(window=14).mean()
-    RS = gain / loss
-    RSI = 100 - (100 / (1 + RS))
-    indicators["RSI"] = RSI.iloc[-1] if not RSI.empty else np.nan
-
-    low_min = df["Low"].rolling(window=14).min()
-    high_max = df["High"].rolling(window=14).max()
-    stoch = 100 * ((df["Close"] - low_min) / (high_max - low_min))
-    indicators["Stoch"] = stoch.iloc[-1] if not stoch.empty else np.nan
-
-    indicators["RSI-Stoch"] = (
-        (indicators["RSI"] + indicators["Stoch"]) / 2
-        if not np.isnan(indicators["RSI"]) and not np.isnan(indicators["Stoch"])
-        else np.nan
-    )
+    indicators["RSI"] = rsi
+    indicators["Stoch"] = stoch
+
+    # 둘 중 하나라도 NaN이면 NaN (스칼라와 종목별 배열 모두 같은 식으로 계산)
+    indicators["RSI-Stoch"] = (indicators["RSI"] + indicators["Stoch"]) / 2
 
-    indicators["MA20"] = df["MA20"].iloc[-1]
-    indicators["MA125"] = df["MA125"].iloc[-1]
-    indicators["MA200"] = df["MA200"].iloc[-1]
+    indicators["MA20"] = ma20
+    indicators["MA125"] = ma125
+    indicators["MA200"] = ma200
 
-    current_price = df["Close"].iloc[-1]
+    current_price = end_price
     indicators["단기이격도"] = (current_price - indicators["MA20"]) / indicators["MA20"] * 100
     indicators["중기이격도"] = (current_price - indicators["MA125"]) / indicators["MA125"] * 100
     indicators["장기이격도"] = (current_price - indicators["MA200"]) / indicators["MA200"] * 100
@@ -82,8 +155,9 @@ def interpret_aux_signal(value, label):
     return f"{label}: <span style='color:{color};'>{signal}</span> ({val_r:.1f})"
 
 def save_stock_insight(ticker, indicators):
-    cleanup_old_files(STOCK_INSIGHT_DIR)
-    file_path = os.path.join(STOCK_INSIGHT_DIR, f"{ticker}_{TODAY_STR}.csv")
+    sweep_expired()
+    file_path = os.path.join(STOCK_INSIGHT_DIR, f"{ticker}_{today_str()}.csv")
     df_insight = pd.DataFrame([indicators])
-    df_insight.to_csv(file_path, index=False)
+    atomic_write(file_path, lambda f: df_insight.to_csv(f, index=False), mode="w", encoding="utf-8", newline="")
+    record_entry(file_path, ticker, "insight", end_date=today_str())
     logging.info(f"Saved stock insight for {ticker} to {file_path}")
@@ -0,0 +1,149 @@
+import os
+import json
+import struct
+import numpy as np
+import pandas as pd
+
+from utils.constants import STOCK_DATA_DIR, PRICE_COMPACT_MODE
+from utils.file_utils import atomic_write
+
+# 파일 구조: MAGIC | 헤더 길이(uint32) | JSON 헤더 | (패딩) | 날짜 int64[n] | 값 float64[컬럼수, n]
+# 컬럼별로 연속 저장하므로 np.memmap으로 읽으면 복사 없이 DataFrame을 만들 수 있다.
+# 압축 모드(PRICE_COMPACT_MODE)에서는 값을 float32로 저장하고(헤더 "dtype": "<f4"),
+# 대부분 0인 이벤트 컬럼(배당/분할/자본이득)은 값 행렬에서 빼고 헤더 "events"에 {컬럼: [[행, 값], ...]}로 둔다.
+# 읽을 때는 이벤트를 0 채움 SparseArray 컬럼으로 되붙이므로 두 모드 모두 같은 컬럼의 DataFrame을 돌려준다.
+# float32의 상대 오차는 약 6e-8이며, 지표 엔진은 누적합/EMA/수익률 단계에서 float64로 넓혀 계산한다.
+MAGIC = b"ETFLAB01"
+ALIGNMENT = 64
+STORE_EXT = ".ohlcv"
+EVENT_COLUMNS = ("Dividends", "Stock Splits", "Capital Gains")
+
+def price_store_path(ticker):
+    return os.path.join(STOCK_DATA_DIR, f"{ticker}{STORE_EXT}")
+
+def _data_offset(header_len):
+    offset = len(MAGIC) + 4 + header_len
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+def _sparse_events(df):
+    # 이벤트 컬럼의 0이 아닌 값만 [[행 위치, 값], ...]로 모은다 (NaN은 이벤트 없음)
+    events = {}
+    for column in EVENT_COLUMNS:
+        if column in df.columns:
+            values = df[column].fillna(0).to_numpy(dtype=float)
+            rows = np.flatnonzero(values)
+            events[column] = [[int(row), float(values[row])] for row in rows]
+    return events
+
+def write_prices(path, df, fetched, compact=None):
+    compact = PRICE_COMPACT_MODE if compact is None else compact
+    index = pd.DatetimeIndex(df.index)
+    tz = str(index.tz) if index.tz is not None else None
+    dates = (index.tz_convert("UTC") if tz else index).as_unit("ns").asi8.astype("<i8")
+    dtype = "<f4" if compact else "<f8"
+    extra = {}
+    if compact:
+        extra["events"] = _sparse_events(df)
+        df = df[[col for col in df.columns if col not in EVENT_COLUMNS]]
+    values = np.ascontiguousarray(df.to_numpy(dtype=dtype).T)
+
+    header = json.dumps({
+        "rows": len(df),
+        "columns": [str(col) for col in df.columns],
+        "tz": tz,
+        "fetched": fetched,
+        "dtype": dtype,
+        **extra,
+    }).encode("utf-8")
+    offset = _data_offset(len(header))
+
+    def write(f):
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(header)))
+        f.write(header)
+        f.write(b"\0" * (offset - f.tell()))
+        f.write(dates.tobytes())
+        f.write(values.tobytes())
+    atomic_write(path, write)
+
+def read_header(path):
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"Not a price store file: {path}")
+        (header_len,) = struct.unpack("<I", f.read(4))
+        header = json.loads(f.read(header_len).decode("utf-8"))
+    header["offset"] = _data_offset(header_len)
+    return header
+
+def _map_values(path, header):
+    rows, columns = header["rows"], header["columns"]
+    offset = header["offset"]
+    dates = np.memmap(path, dtype="<i8", mode="r", offset=offset, shape=(rows,))
+    # dtype이 없는 이전 파일은 float64
+    values = np.memmap(path, dtype=header.get("dtype", "<f8"), mode="r", offset=offset + 8 * rows, shape=(len(columns), rows))
+    return dates, values
+
+def _date_index(dates, tz):
+    index = pd.DatetimeIndex(np.asarray(dates).view("M8[ns]"), name="Date")
+    return index.tz_localize("UTC").tz_convert(tz) if tz else index
+
+def _event_column(pairs, rows):
+    dense = np.zeros(rows)
+    if pairs:
+        positions, values = zip(*pairs)
+        dense[list(positions)] = values
+    return pd.arrays.SparseArray(dense, fill_value=0.0)
+
+def read_prices(path):
+    header = read_header(path)
+    rows, columns = header["rows"], header["columns"]
+    events = header.get("events", {})
+    if rows == 0:
+        return pd.DataFrame(columns=columns + list(events), index=pd.DatetimeIndex([], name="Date")), header
+
+    dates, values = _map_values(path, header)
+    index = _date_index(dates, header["tz"])
+    # values.T 는 (rows, 컬럼수) 뷰이며 pandas 블록 레이아웃과 같아 복사가 일어나지 않는다
+    df = pd.DataFrame(values.T, index=index, columns=columns, copy=False)
+    # 압축 모드 이벤트는 별도 블록으로 붙으므로 memmap 값 블록은 그대로 공유된다
+    for column, pairs in events.items():
+        df[column] = _event_column(pairs, rows)
+    return df, header
+
+def read_arrays(path):
+    """DataFrame을 만들지 않고 {컬럼: 읽기 전용 memmap 배열}과 헤더를 반환한다.
+    헤더의 "last_date"는 마지막 봉의 Timestamp (행이 없으면 None)."""
+    header = read_header(path)
+    if header["rows"] == 0:
+        header["last_date"] = None
+        return {column: np.empty(0) for column in header["columns"]}, header
+
+    dates, values = _map_values(path, header)
+    last_date = pd.Timestamp(int(dates[-1]))
+    if header["tz"]:
+        last_date = last_date.tz_localize("UTC").tz_convert(header["tz"])
+    header["last_date"] = last_date
+    return dict(zip(header["columns"], values)), header
+
+def read_events(path):
+    """압축 모드 파일의 이벤트(배당/분할/자본이득)를 0이 아닌 날짜만 담은 DataFrame으로 반환한다.
+    이전 형식 파일은 값 행렬의 이벤트 컬럼에서 0이 아닌 행을 고른다."""
+    header = read_header(path)
+    if header["rows"] == 0:
+        return pd.DataFrame(columns=list(EVENT_COLUMNS), index=pd.DatetimeIndex([], name="Date"))
+    dates, values = _map_values(path, header)
+    if "events" in header:
+        events = header["events"]
+    else:
+        columns = dict(zip(header["columns"], values))
+        events = {
+            column: [[int(row), float(columns[column][row])] for row in np.flatnonzero(np.nan_to_num(columns[column]))]
+            for column in EVENT_COLUMNS if column in columns
+        }
+    rows = sorted({row for pairs in events.values() for row, _ in pairs})
+    position = {row: i for i, row in enumerate(rows)}
+    table = pd.DataFrame(0.0, index=_date_index(dates[rows], header["tz"]), columns=list(events))
+    for j, pairs in enumerate(events.values()):
+        for row, value in pairs:
+            table.iat[position[row], j] = value
+    return table
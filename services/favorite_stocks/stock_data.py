@@ -1,40 +1,253 @@
 ﻿import os
 import pandas as pd
-import datetime
-import yfinance as yf
+import numpy as np
 import logging
 
-from utils.constants import STOCK_DATA_DIR, TODAY_STR, FILE_EXPIRY_DAYS
+from services.market_data.provider import get_provider
+from services.market_data.resilient_provider import is_stale, mark_stale
+from services.favorite_stocks.price_store import price_store_path, read_prices, write_prices
+from utils.constants import (
+    STOCK_HISTORY_PERIOD, STOCK_HISTORY_DAYS, DELTA_OVERLAP_DAYS, RESTATEMENT_RTOL,
+    PRICE_CACHE_MAX_BYTES, PRICE_CACHE_TTL_SECONDS
+)
+from utils.cache_catalog import lookup, record_entry, remove_entry, sweep_expired
+from utils.market_session import session_str, fetched_str, is_fresh
+from utils.memory_cache import MemoryCache, frame_nbytes
+from utils.single_flight import SingleFlight
+
+# (티커, 마지막 봉 날짜) → 가격 프레임. 모든 세션이 공유한다.
+_price_frames = MemoryCache(PRICE_CACHE_MAX_BYTES, PRICE_CACHE_TTL_SECONDS)
+# 티커 → (갱신한 장 마감일, 마지막 봉 날짜). 디스크를 읽지 않고 캐시 키를 찾는 데 쓴다.
+_latest_bars = {}
+# (티커, 데이터 종류) 단위로 진행 중인 다운로드를 하나로 합친다
+_flights = SingleFlight()
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s:%(message)s")
 
-def is_file_expired(file_path):
-    if os.path.exists(file_path):
-        mtime = os.path.getmtime(file_path)
-        file_date = datetime.datetime.fromtimestamp(mtime)
-        return (datetime.datetime.now() - file_date).days >= FILE_EXPIRY_DAYS
-    return True
+def normalize_price_index(df):
+    # CSV 캐시는 날짜가 문자열로 읽히므로 yfinance와 같은 tz-aware 인덱스로 맞춘다
+    index = pd.to_datetime(df.index, utc=True).tz_convert("America/New_York")
+    df.index = index.rename("Date")
+    return df
 
-def cleanup_old_files(folder):
-    for fname in os.listdir(folder):
-        fpath = os.path.join(folder, fname)
-        if os.path.isfile(fpath) and is_file_expired(fpath):
-            os.remove(fpath)
-            logging.info(f"Deleted expired file: {fpath}")
+def needs_backfill(cached, delta):
+    # 겹치는 구간의 종가가 달라졌거나 새 구간에 분할/배당 이벤트가 있으면 과거 가격이 재조정된 것
+    overlap = cached.index.intersection(delta.index)
+    if overlap.empty:
+        return True
+    old_close = cached.loc[overlap, "Close"].to_numpy()
+    new_close = delta.loc[overlap, "Close"].to_numpy()
+    if not np.allclose(old_close, new_close, rtol=RESTATEMENT_RTOL, equal_nan=True):
+        return True
+    new_bars = delta[delta.index > cached.index[-1]]
+    for col in ("Dividends", "Stock Splits"):
+        if col in new_bars.columns and (new_bars[col].fillna(0) != 0).any():
+            return True
+    return False
 
-def get_stock_data(ticker):
-    cleanup_old_files(STOCK_DATA_DIR)
-    file_path = os.path.join(STOCK_DATA_DIR, f"{ticker}_{TODAY_STR}.csv")
-    
-    if os.path.exists(file_path):
-        df = pd.read_csv(file_path, index_col="Date", parse_dates=True)
-        logging.info(f"Using cached data for {ticker} from {file_path}")
-    else:
-        ticker_obj = yf.Ticker(ticker)
-        df = ticker_obj.history(period="3y")
-        if df.empty:
-            return None
-        df.to_csv(file_path)
-        logging.info(f"Saved new data for {ticker} to {file_path}")
-    
+def fetch_full_history(ticker):
+    df = get_provider().history(ticker, period=STOCK_HISTORY_PERIOD)
+    if df.empty:
+        return None
     return df
+
+def merge_delta(ticker, cached, delta):
+    # 재조정이 감지되면 None을 반환하여 전체 기간 재수집이 필요함을 알린다
+    last_date = cached.index[-1]
+    if delta is None or delta.empty:
+        logging.info(f"No new bars for {ticker} since {last_date.date()}")
+        return cached
+    if needs_backfill(cached, delta):
+        logging.info(f"Detected split/dividend restatement for {ticker}, backfilling full history")
+        return None
+
+    merged = pd.concat([cached[cached.index < delta.index[0]], delta])
+    cutoff = merged.index[-1] - pd.Timedelta(days=STOCK_HISTORY_DAYS)
+    merged = merged[merged.index > cutoff]
+    logging.info(f"Appended {int((delta.index > last_date).sum())} new bars for {ticker}")
+    return merged
+
+def delta_start(cached_frames):
+    last_date = min(df.index[-1] for df in cached_frames)
+    return (last_date - pd.Timedelta(days=DELTA_OVERLAP_DAYS)).strftime("%Y-%m-%d")
+
+def update_stock_data(ticker, cached):
+    delta = get_provider().history(ticker, start=delta_start([cached]))
+    if is_stale(delta):
+        return mark_stale(cached)
+    merged = merge_delta(ticker, cached, delta)
+    if merged is None:
+        return fetch_full_history(ticker)
+    return merged
+
+def load_cached_prices(ticker):
+    # 반환값: (캐시 프레임 또는 None, 마지막 조회 시각 문자열, 이관 대상 CSV 경로)
+    entry = lookup(ticker, "prices")
+    if entry is not None:
+        try:
+            df, header = read_prices(entry["path"])
+            return df, header.get("fetched"), None
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable price store {entry['path']}: {e}")
+            remove_entry(entry["path"])
+
+    legacy = lookup(ticker, "prices_csv")
+    if legacy is not None:
+        try:
+            df = normalize_price_index(pd.read_csv(legacy["path"], index_col="Date"))
+            return df, legacy["end_date"], legacy["path"]
+        except OSError:
+            remove_entry(legacy["path"])
+    return None, None, None
+
+def recall_prices(ticker):
+    # 가장 최근 장 마감 이후 이미 갱신된 프레임이 메모리에 있으면 디스크를 읽지 않고 반환한다
+    latest = _latest_bars.get(ticker)
+    if latest is None or latest[0] != session_str():
+        return None
+    # 공유 프레임을 복사 없이 그대로 돌려준다. 호출자는 읽기만 한다 (지표 계산도 입력을 바꾸지 않는다).
+    return _price_frames.get((ticker, latest[1]))
+
+def remember_prices(ticker, df):
+    last_bar = df.index[-1].strftime("%Y-%m-%d")
+    _price_frames.put((ticker, last_bar), df, frame_nbytes(df))
+    _latest_bars[ticker] = (session_str(), last_bar)
+    return df
+
+def save_cached_prices(ticker, df, legacy_path=None):
+    store_path = price_store_path(ticker)
+    try:
+        write_prices(store_path, df, fetched=fetched_str())
+    except PermissionError as e:
+        # Windows에서는 다른 세션이 memmap으로 열어둔 파일을 교체할 수 없다
+        logging.warning(f"Could not replace price store {store_path}: {e}")
+        return remember_prices(ticker, df)
+    record_entry(
+        store_path, ticker, "prices",
+        start_date=df.index[0].strftime("%Y-%m-%d"), end_date=df.index[-1].strftime("%Y-%m-%d")
+    )
+    if legacy_path is not None:
+        if os.path.exists(legacy_path):
+            os.remove(legacy_path)
+        remove_entry(legacy_path)
+    logging.info(f"Saved new data for {ticker} to {store_path}")
+    # 방금 쓴 파일을 memmap으로 다시 열어 읽기 전용 버퍼를 세션 간에 공유한다
+    df, _ = read_prices(store_path)
+    return remember_prices(ticker, df)
+
+def _load_group_stock_data(tickers):
+    # 그룹 전체를 확인한 뒤 갱신이 필요한 티커만 묶어서 한 번에 다운로드한다
+    result, stale, legacy_paths = {}, {}, {}
+    missing = []
+    for ticker in tickers:
+        df = recall_prices(ticker)
+        if df is not None:
+            result[ticker] = df
+            continue
+        cached, fetched, legacy_path = load_cached_prices(ticker)
+        legacy_paths[ticker] = legacy_path
+        if cached is None or cached.empty:
+            missing.append(ticker)
+        elif is_fresh(fetched):
+            result[ticker] = remember_prices(ticker, cached)
+        else:
+            stale[ticker] = cached
+
+    if stale or missing:
+        sweep_expired()
+
+    if stale:
+        try:
+            deltas = get_provider().download(list(stale), start=delta_start(stale.values()))
+        except Exception as e:
+            # 갱신에 실패하면 디스크에 남아 있는 이전 가격을 stale 표시와 함께 쓴다
+            logging.warning(f"Failed to update {len(stale)} tickers, serving cached prices: {e}")
+            deltas = {ticker: mark_stale(cached) for ticker, cached in stale.items()}
+        for ticker, cached in stale.items():
+            delta = deltas.get(ticker)
+            # 마지막 성공 응답에 없던 티커도 새 봉이 없는 것이 아니라 확인하지 못한 것이므로 저장하지 않는다
+            if is_stale(deltas) or is_stale(delta):
+                result[ticker] = mark_stale(cached)
+                continue
+            merged = merge_delta(ticker, cached, delta)
+            if merged is None:
+                missing.append(ticker)
+            else:
+                result[ticker] = save_cached_prices(ticker, merged, legacy_paths[ticker])
+
+    if missing:
+        logging.info(f"Downloading full history for {len(missing)} tickers in one request")
+        try:
+            frames = get_provider().download(missing, period=STOCK_HISTORY_PERIOD)
+        except Exception as e:
+            logging.warning(f"Failed to download full history for {missing}: {e}")
+            frames = {}
+        for ticker, df in frames.items():
+            if not isinstance(df, pd.DataFrame):
+                continue
+            result[ticker] = df if is_stale(frames) or is_stale(df) else save_cached_prices(ticker, df, legacy_paths[ticker])
+
+    return result
+
+def get_group_stock_data(tickers):
+    # 다른 세션이 이미 받고 있는 티커는 그 결과를 기다리고, 나머지만 직접 묶어서 받는다
+    result, owned, waiting = {}, {}, {}
+    for ticker in dict.fromkeys(tickers):
+        df = recall_prices(ticker)
+        if df is not None:
+            result[ticker] = df
+            continue
+        flight, leader = _flights.begin((ticker, "prices"))
+        (owned if leader else waiting)[ticker] = flight
+
+    try:
+        if owned:
+            result.update(_load_group_stock_data(list(owned)))
+    except BaseException as e:
+        for ticker, flight in owned.items():
+            _flights.finish((ticker, "prices"), flight, error=e)
+        raise
+    for ticker, flight in owned.items():
+        _flights.finish((ticker, "prices"), flight, result=result.get(ticker))
+
+    for ticker, flight in waiting.items():
+        df = flight.wait()
+        if df is not None:
+            result[ticker] = df
+    return {ticker: result[ticker] for ticker in tickers if ticker in result}
+
+def _load_stock_data(ticker):
+    # 기다리는 사이 다른 요청이 먼저 갱신했을 수 있으므로 메모리 캐시를 다시 확인한다
+    df = recall_prices(ticker)
+    if df is not None:
+        return df
+
+    sweep_expired()
+    cached, fetched, legacy_path = load_cached_prices(ticker)
+
+    if cached is not None and is_fresh(fetched) and not cached.empty:
+        logging.info(f"Using cached data for {ticker}")
+        return remember_prices(ticker, cached)
+
+    if cached is not None and not cached.empty:
+        try:
+            df = update_stock_data(ticker, cached)
+        except Exception as e:
+            # 갱신에 실패하면 디스크에 남아 있는 이전 가격을 stale 표시와 함께 쓴다
+            logging.warning(f"Failed to update {ticker}, serving cached prices: {e}")
+            return mark_stale(cached)
+    else:
+        df = fetch_full_history(ticker)
+    if df is None or df.empty:
+        return None
+    if is_stale(df):
+        return df
+
+    return save_cached_prices(ticker, df, legacy_path)
+
+def get_stock_data(ticker):
+    df = recall_prices(ticker)
+    if df is not None:
+        return df
+    # 같은 티커를 동시에 요청한 세션들은 한 번의 다운로드 결과를 공유한다
+    return _flights.do((ticker, "prices"), _load_stock_data, ticker)
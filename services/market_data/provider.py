@@ -0,0 +1,69 @@
+import threading
+from abc import ABC, abstractmethod
+
+from utils.constants import MARKET_DATA_PROVIDER, REPLAY_FIXTURE_DIR
+
+# 시세/종목정보/배당 조회의 공통 인터페이스.
+# 페이지와 서비스는 yfinance나 requests를 직접 부르지 않고 get_provider()를 통해 조회한다.
+# 구현체는 download()를 제외한 조회 메서드를 모두 구현해야 생성할 수 있다.
+
+class MarketDataProvider(ABC):
+    name = "base"
+
+    @abstractmethod
+    def history(self, ticker, period=None, start=None, end=None):
+        """yfinance Ticker.history()와 같은 형식의 일봉 DataFrame (없으면 빈 DataFrame)."""
+
+    def download(self, tickers, period=None, start=None):
+        """여러 티커의 history()를 {티커: DataFrame}으로 반환한다. 데이터가 없는 티커는 빠진다."""
+        frames = {}
+        for ticker in tickers:
+            df = self.history(ticker, period=period, start=start)
+            if not df.empty:
+                frames[ticker] = df
+        return frames
+
+    @abstractmethod
+    def quote(self, ticker):
+        """{"last_price": float, "previous_close": float} 형식의 현재가."""
+
+    @abstractmethod
+    def info(self, ticker):
+        """yfinance Ticker.info 와 같은 dict."""
+
+    @abstractmethod
+    def dividends(self, ticker):
+        """배당락일 인덱스의 배당금 Series."""
+
+    @abstractmethod
+    def dividend_page(self, ticker):
+        """stockanalysis.com 배당 페이지 HTML."""
+
+_provider = None
+_lock = threading.Lock()
+
+def create_provider(name):
+    if name == "yahoo":
+        from services.market_data.yahoo_provider import YahooProvider
+        return YahooProvider()
+    if name == "replay":
+        from services.market_data.replay_provider import ReplayProvider
+        return ReplayProvider(REPLAY_FIXTURE_DIR)
+    if name == "record":
+        from services.market_data.yahoo_provider import YahooProvider
+        from services.market_data.replay_provider import RecordingProvider
+        return RecordingProvider(YahooProvider(), REPLAY_FIXTURE_DIR)
+    raise ValueError(f"Unknown market data provider: {name}")
+
+def get_provider():
+    global _provider
+    with _lock:
+        if _provider is None:
+            from services.market_data.resilient_provider import ResilientProvider
+            _provider = ResilientProvider(create_provider(MARKET_DATA_PROVIDER))
+        return _provider
+
+def set_provider(provider):
+    global _provider
+    with _lock:
+        _provider = provider
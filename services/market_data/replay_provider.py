@@ -0,0 +1,180 @@
+import os
+import json
+import time
+import random
+import threading
+import pandas as pd
+
+from services.market_data.provider import MarketDataProvider
+from utils.constants import REPLAY_LATENCY_MS, REPLAY_ERROR_RATE, REPLAY_SEED
+from utils.file_utils import atomic_write
+
+# 디스크에 저장된 fixture로 응답하는 오프라인 제공자.
+# 폴더 구조: {fixture_dir}/{티커}/history.csv, info.json, quote.json, dividends.csv, dividend_page.html
+# 인터넷 없이 페이지 렌더링과 지표 계산 성능을 반복 측정할 때 사용한다.
+
+FIXTURE_TZ = "America/New_York"
+
+class ReplayError(Exception):
+    pass
+
+def _period_start(last_date, period):
+    unit_days = {"d": 1, "wk": 7, "mo": 31, "y": 365}
+    for unit, days in unit_days.items():
+        if period.endswith(unit) and period[:-len(unit)].isdigit():
+            return last_date - pd.Timedelta(days=int(period[:-len(unit)]) * days)
+    return None  # "max" 등
+
+def _to_timestamp(value):
+    ts = pd.Timestamp(value)
+    return ts.tz_localize(FIXTURE_TZ) if ts.tzinfo is None else ts
+
+class ReplayProvider(MarketDataProvider):
+    name = "replay"
+
+    def __init__(self, fixture_dir, latency_ms=REPLAY_LATENCY_MS, error_rate=REPLAY_ERROR_RATE, seed=REPLAY_SEED):
+        self.fixture_dir = fixture_dir
+        self.latency_ms = latency_ms
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _path(self, ticker, name):
+        return os.path.join(self.fixture_dir, ticker.upper(), name)
+
+    def _simulate(self, ticker):
+        if self.latency_ms > 0:
+            time.sleep(self.latency_ms / 1000)
+        with self._lock:
+            failed = self._random.random() < self.error_rate
+        if failed:
+            raise ReplayError(f"Injected replay error for {ticker}")
+
+    def _read_history(self, ticker, period=None, start=None, end=None):
+        path = self._path(ticker, "history.csv")
+        if not os.path.exists(path):
+            return pd.DataFrame()
+        df = pd.read_csv(path, index_col="Date")
+        df.index = pd.to_datetime(df.index, utc=True).tz_convert(FIXTURE_TZ).rename("Date")
+        if df.empty:
+            return df
+
+        if start is not None or end is not None:
+            if start is not None:
+                df = df[df.index >= _to_timestamp(start)]
+            if end is not None:
+                df = df[df.index < _to_timestamp(end)]
+            return df
+        period_start = _period_start(df.index[-1], period or "1mo")
+        return df[df.index > period_start] if period_start is not None else df
+
+    def history(self, ticker, period=None, start=None, end=None):
+        self._simulate(ticker)
+        return self._read_history(ticker, period=period, start=start, end=end)
+
+    def download(self, tickers, period=None, start=None):
+        # 일괄 다운로드는 한 번의 요청으로 취급하여 지연/오류도 한 번만 주입한다
+        self._simulate(",".join(tickers))
+        frames = {}
+        for ticker in tickers:
+            df = self._read_history(ticker, period=period, start=start)
+            if not df.empty:
+                frames[ticker] = df
+        return frames
+
+    def quote(self, ticker):
+        self._simulate(ticker)
+        path = self._path(ticker, "quote.json")
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        df = self._read_history(ticker, period="5d")
+        if df.empty:
+            raise ReplayError(f"No quote fixture for {ticker}")
+        close = df["Close"]
+        return {
+            "last_price": float(close.iloc[-1]),
+            "previous_close": float(close.iloc[-2]) if len(close) >= 2 else None,
+        }
+
+    def info(self, ticker):
+        self._simulate(ticker)
+        path = self._path(ticker, "info.json")
+        if not os.path.exists(path):
+            return {}
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def dividends(self, ticker):
+        self._simulate(ticker)
+        path = self._path(ticker, "dividends.csv")
+        if not os.path.exists(path):
+            return pd.Series(dtype="float64", name="Dividends")
+        series = pd.read_csv(path, index_col="Date")["Dividends"]
+        series.index = pd.to_datetime(series.index, utc=True).tz_convert(FIXTURE_TZ).rename("Date")
+        return series
+
+    def dividend_page(self, ticker):
+        self._simulate(ticker)
+        path = self._path(ticker, "dividend_page.html")
+        if not os.path.exists(path):
+            raise ReplayError(f"No dividend page fixture for {ticker}")
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+
+class RecordingProvider(MarketDataProvider):
+    """다른 제공자의 응답을 그대로 돌려주면서 ReplayProvider가 읽을 수 있는 fixture로 저장한다.
+    history는 조회할 때마다 기존 fixture와 합쳐 가장 긴 구간을 남긴다."""
+    name = "record"
+
+    def __init__(self, inner, fixture_dir):
+        self.inner = inner
+        self.fixture_dir = fixture_dir
+        self._lock = threading.Lock()
+
+    def _write(self, ticker, name, write_fn, mode="w"):
+        folder = os.path.join(self.fixture_dir, ticker.upper())
+        os.makedirs(folder, exist_ok=True)
+        atomic_write(os.path.join(folder, name), write_fn, mode=mode, encoding="utf-8", newline="")
+
+    def _record_history(self, ticker, df):
+        if df.empty:
+            return
+        with self._lock:
+            path = os.path.join(self.fixture_dir, ticker.upper(), "history.csv")
+            if os.path.exists(path):
+                old = pd.read_csv(path, index_col="Date")
+                old.index = pd.to_datetime(old.index, utc=True).tz_convert(FIXTURE_TZ).rename("Date")
+                df = pd.concat([old[~old.index.isin(df.index)], df]).sort_index()
+            self._write(ticker, "history.csv", lambda f: df.to_csv(f))
+
+    def history(self, ticker, period=None, start=None, end=None):
+        df = self.inner.history(ticker, period=period, start=start, end=end)
+        self._record_history(ticker, df)
+        return df
+
+    def download(self, tickers, period=None, start=None):
+        frames = self.inner.download(tickers, period=period, start=start)
+        for ticker, df in frames.items():
+            self._record_history(ticker, df)
+        return frames
+
+    def quote(self, ticker):
+        quote = self.inner.quote(ticker)
+        self._write(ticker, "quote.json", lambda f: json.dump(quote, f))
+        return quote
+
+    def info(self, ticker):
+        info = self.inner.info(ticker)
+        self._write(ticker, "info.json", lambda f: json.dump(info, f, ensure_ascii=False, default=str))
+        return info
+
+    def dividends(self, ticker):
+        series = self.inner.dividends(ticker)
+        self._write(ticker, "dividends.csv", lambda f: series.rename("Dividends").to_csv(f, index_label="Date"))
+        return series
+
+    def dividend_page(self, ticker):
+        html = self.inner.dividend_page(ticker)
+        self._write(ticker, "dividend_page.html", lambda f: f.write(html))
+        return html
@@ -0,0 +1,202 @@
+import time
+import random
+import logging
+import threading
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+from services.market_data.provider import MarketDataProvider
+from utils.constants import (
+    YAHOO_HOST, STOCKANALYSIS_HOST, FETCH_MAX_WORKERS,
+    PROVIDER_BACKSTOP_SECONDS, PROVIDER_RETRY_ATTEMPTS, PROVIDER_BACKOFF_BASE_SECONDS, PROVIDER_BACKOFF_MAX_SECONDS,
+    BREAKER_FAILURE_THRESHOLD, BREAKER_COOLDOWN_SECONDS, STALE_CACHE_MAX_BYTES, STALE_CACHE_TTL_SECONDS
+)
+from utils.fetch_executor import get_bucket
+from utils.memory_cache import MemoryCache, frame_nbytes
+
+# 모든 제공자 호출에 호스트별 속도 제한(시도마다 토큰 하나), 지터가 들어간 지수 백오프 재시도와 호스트별 차단기(circuit breaker)를 적용한다.
+# 요청별 타임아웃은 내부 제공자가 yfinance/requests에 직접 넘기고, 여기서는 전용 풀에서 대기 한도(backstop)만 건다.
+# 대기 한도를 넘긴 호출이나 풀이 가득 찬 상태는 다시 보내지 않고 실패로 세어 바로 마지막 성공 값으로 넘어간다.
+# 차단기가 열린 동안에는 네트워크를 기다리지 않고 같은 호출의 마지막 성공 값을 stale 표시와 함께 돌려준다.
+# stale 여부는 is_stale()로 확인한다 (값에 "stale" 키를 넣지 않으므로 티커→프레임 매핑을 그대로 순회할 수 있다).
+
+# 메서드별 요청 호스트 (나머지는 Yahoo)
+CALL_HOSTS = {"dividend_page": STOCKANALYSIS_HOST}
+
+class ProviderUnavailable(Exception):
+    pass
+
+class CircuitBreaker:
+    def __init__(self, host, threshold=BREAKER_FAILURE_THRESHOLD, cooldown=BREAKER_COOLDOWN_SECONDS):
+        self.host = host
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = None
+        self.trial = False
+        self.lock = threading.Lock()
+
+    def allow(self):
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at < self.cooldown or self.trial:
+                return False
+            # 대기 시간이 지나면 한 번만 시험 호출을 허용한다 (half-open)
+            self.trial = True
+            return True
+
+    def record_success(self):
+        with self.lock:
+            if self.opened_at is not None:
+                logging.info(f"Circuit closed for {self.host}")
+            self.failures = 0
+            self.opened_at = None
+            self.trial = False
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.opened_at is not None or self.failures >= self.threshold:
+                if not self.trial:
+                    logging.warning(f"Circuit opened for {self.host} after {self.failures} failures")
+                self.opened_at = time.monotonic()
+            self.trial = False
+
+class StaleDict(dict):
+    """마지막 성공 값으로 돌려준 dict (티커→프레임 매핑, quote/info). 키를 추가하지 않고 타입으로 표시한다."""
+    stale = True
+
+class StaleText(str):
+    """마지막 성공 값으로 돌려준 문자열 (배당 페이지 HTML)."""
+    stale = True
+
+def mark_stale(value):
+    """마지막 성공 값을 최신이 아님으로 표시한다.
+    DataFrame/Series는 attrs["stale"], dict는 StaleDict(안의 프레임도 표시), 문자열은 StaleText로 감싼다."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        value = value.copy(deep=False)
+        value.attrs["stale"] = True
+        return value
+    if isinstance(value, dict):
+        return StaleDict((key, mark_stale(v) if isinstance(v, (pd.DataFrame, pd.Series)) else v)
+                         for key, v in value.items())
+    if isinstance(value, str):
+        return StaleText(value)
+    raise TypeError(f"Cannot mark {type(value).__name__} as stale")
+
+def is_stale(value):
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return bool(value.attrs.get("stale"))
+    return isinstance(value, (StaleDict, StaleText))
+
+def _nbytes(value):
+    if isinstance(value, pd.DataFrame):
+        return frame_nbytes(value)
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=False))
+    if isinstance(value, dict):
+        return sum(_nbytes(v) for v in value.values()) + 64 * len(value)
+    if isinstance(value, str):
+        return len(value)
+    return 64
+
+def _shallow(value):
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy(deep=False)
+    if isinstance(value, dict):
+        return {key: _shallow(v) for key, v in value.items()}
+    return value
+
+class ResilientProvider(MarketDataProvider):
+    def __init__(self, inner, timeout=PROVIDER_BACKSTOP_SECONDS, attempts=PROVIDER_RETRY_ATTEMPTS):
+        self.inner = inner
+        self.name = inner.name
+        self.timeout = timeout
+        self.attempts = attempts
+        self._breakers = {}
+        self._lock = threading.Lock()
+        self._last_good = MemoryCache(STALE_CACHE_MAX_BYTES, STALE_CACHE_TTL_SECONDS)
+        # 대기 한도를 걸기 위한 전용 풀 (조회 스레드 풀 안에서 호출되어도 서로 막히지 않게 분리)
+        self._max_calls = FETCH_MAX_WORKERS * 2
+        self._calls = ThreadPoolExecutor(max_workers=self._max_calls, thread_name_prefix="provider-call")
+        # 실행 중이거나 대기 중인 호출 수. 돌아오지 않는 호출이 풀을 채우면 새 호출을 큐에 쌓지 않는다
+        self._in_flight = 0
+
+    def breaker(self, host):
+        with self._lock:
+            if host not in self._breakers:
+                self._breakers[host] = CircuitBreaker(host)
+            return self._breakers[host]
+
+    def _call_done(self, future):
+        with self._lock:
+            self._in_flight -= 1
+
+    def _submit(self, method, *args, **kwargs):
+        with self._lock:
+            if self._in_flight >= self._max_calls:
+                return None
+            self._in_flight += 1
+        future = self._calls.submit(getattr(self.inner, method), *args, **kwargs)
+        future.add_done_callback(self._call_done)
+        return future
+
+    def _call(self, method, *args, **kwargs):
+        key = (method, args, tuple(sorted(kwargs.items())))
+        breaker = self.breaker(CALL_HOSTS.get(method, YAHOO_HOST))
+        error = None
+        for attempt in range(self.attempts):
+            if not breaker.allow():
+                error = error or ProviderUnavailable(f"Circuit open for {breaker.host}")
+                break
+            if attempt > 0:
+                time.sleep(random.uniform(0, min(PROVIDER_BACKOFF_MAX_SECONDS, PROVIDER_BACKOFF_BASE_SECONDS * 2 ** attempt)))
+            get_bucket(breaker.host).acquire()
+            future = self._submit(method, *args, **kwargs)
+            if future is None:
+                error = ProviderUnavailable(f"{method}{args} not sent: all {self._max_calls} provider calls are still running")
+                breaker.record_failure()
+                logging.warning(f"{error}")
+                break
+            try:
+                result = future.result(timeout=self.timeout)
+            except FutureTimeoutError:
+                # 요청별 타임아웃으로도 돌아오지 않은 호출: 아직 시작 전이면 취소하고, 같은 호출을 다시 쌓지 않는다
+                future.cancel()
+                error = ProviderUnavailable(f"{method}{args} did not return within {self.timeout:g}s")
+                breaker.record_failure()
+                logging.warning(f"{error}")
+                break
+            except Exception as e:
+                error = e
+            else:
+                breaker.record_success()
+                self._last_good.put(key, _shallow(result), _nbytes(result))
+                return result
+            breaker.record_failure()
+            logging.warning(f"{method}{args} failed (attempt {attempt + 1}/{self.attempts}): {error}")
+
+        cached = self._last_good.get(key)
+        if cached is not None:
+            logging.warning(f"Serving stale {method}{args}: {error}")
+            return mark_stale(cached)
+        raise error
+
+    def history(self, ticker, period=None, start=None, end=None):
+        return self._call("history", ticker, period=period, start=start, end=end)
+
+    def download(self, tickers, period=None, start=None):
+        return self._call("download", tuple(tickers), period=period, start=start)
+
+    def quote(self, ticker):
+        return self._call("quote", ticker)
+
+    def info(self, ticker):
+        return self._call("info", ticker)
+
+    def dividends(self, ticker):
+        return self._call("dividends", ticker)
+
+    def dividend_page(self, ticker):
+        return self._call("dividend_page", ticker)
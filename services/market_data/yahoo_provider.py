@@ -0,0 +1,72 @@
+import pandas as pd
+import yfinance as yf
+
+from services.market_data.provider import MarketDataProvider
+from utils.constants import PROVIDER_TIMEOUT_SECONDS
+from utils.http_client import get_text
+
+HISTORY_COLUMNS = ["Open", "High", "Low", "Close", "Volume", "Dividends", "Stock Splits", "Capital Gains"]
+DIVIDEND_PAGE_URL = "https://stockanalysis.com/etf/{ticker}/dividend/"
+
+class YahooProvider(MarketDataProvider):
+    name = "yahoo"
+
+    def __init__(self, timeout=PROVIDER_TIMEOUT_SECONDS):
+        # 요청별 타임아웃. 응답이 없으면 yfinance/requests가 직접 예외를 내고 호출 스레드를 돌려준다
+        self.timeout = timeout
+
+    def history(self, ticker, period=None, start=None, end=None):
+        if start is None and end is None:
+            return yf.Ticker(ticker).history(period=period or "1mo", timeout=self.timeout)
+        return yf.Ticker(ticker).history(start=start, end=end, timeout=self.timeout)
+
+    def download(self, tickers, period=None, start=None):
+        # yfinance 다중 티커 다운로드를 한 번에 요청한 뒤 티커별 history() 형식으로 나눈다
+        if not tickers:
+            return {}
+        kwargs = {"start": start} if start is not None else {"period": period or "1mo"}
+        data = yf.download(
+            list(tickers), group_by="ticker", actions=True, auto_adjust=True,
+            ignore_tz=False, progress=False, threads=True, timeout=self.timeout, **kwargs
+        )
+        frames = {}
+        for ticker in tickers:
+            if isinstance(data.columns, pd.MultiIndex):
+                if ticker not in data.columns.get_level_values(0):
+                    continue
+                df = data[ticker]
+            else:
+                df = data
+            df = df.dropna(how="all", subset=[col for col in ("Open", "High", "Low", "Close") if col in df.columns])
+            if df.empty:
+                continue
+            df = df[[col for col in HISTORY_COLUMNS if col in df.columns]].copy()
+            if df.index.tz is None:
+                df.index = df.index.tz_localize("America/New_York")
+            df.index.name = "Date"
+            frames[ticker] = df
+        return frames
+
+    def quote(self, ticker):
+        # fast_info는 타임아웃을 받지 않으므로 같은 값(최근 일봉 종가, 그 전 종가)을 history()로 구한다
+        close = self.history(ticker, period="5d")["Close"].dropna()
+        if close.empty:
+            raise ValueError(f"No recent prices for {ticker}")
+        return {
+            "last_price": float(close.iloc[-1]),
+            "previous_close": float(close.iloc[-2]) if len(close) >= 2 else None,
+        }
+
+    def info(self, ticker):
+        # yfinance .info는 타임아웃을 받지 않는다 (내부 30초). ResilientProvider의 대기 한도가 안전장치다
+        return yf.Ticker(ticker).info
+
+    def dividends(self, ticker):
+        # .dividends와 같은 값(전체 기간 일봉의 배당 열)을 타임아웃을 걸어 받는다
+        df = yf.Ticker(ticker).history(period="max", timeout=self.timeout)
+        if "Dividends" not in df.columns:
+            return pd.Series(dtype="float64", name="Dividends")
+        return df.loc[df["Dividends"] != 0, "Dividends"]
+
+    def dividend_page(self, ticker):
+        return get_text(DIVIDEND_PAGE_URL.format(ticker=ticker.upper()), timeout=self.timeout)
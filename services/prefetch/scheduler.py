@@ -0,0 +1,123 @@
+import os
+import sys
+import json
+import time
+import logging
+import threading
+import pandas as pd
+
+from services.dividends.dividend_store import get_dividend_history
+from services.favorite_stocks.stock_data import get_group_stock_data
+from services.favorite_stocks.indicator_state import incremental_indicators
+from services.favorite_stocks.indicators import save_stock_insight
+from utils.constants import (
+    FAVORITE_FILE, DIVIDEND_REPORT_GROUPS_FILE, PREFETCH_STATE_FILE,
+    PREFETCH_BATCH_SIZE
+)
+from utils.cache_catalog import sweep_expired
+from utils.fetch_executor import submit_fetch, gather
+from utils.file_utils import atomic_write
+from utils.market_session import market_now, last_session_close, next_session_close
+from utils.ticker_meta import get_ticker_meta
+
+# 미국 장 마감 후 관심종목 전체의 가격/배당/지표를 미리 받아두어 아침 첫 접속이 캐시를 바로 쓰게 한다.
+# 실행 방법: ./run.sh prefetch (별도 프로세스) 또는 PREFETCH_IN_SERVER=1 (Streamlit 서버 내부 스레드)
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s:%(message)s")
+
+def _load_json(path):
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        logging.warning(f"Failed to read {path}: {e}")
+        return {}
+
+def watched_tickers():
+    tickers = []
+    for path in (FAVORITE_FILE, DIVIDEND_REPORT_GROUPS_FILE):
+        for group_tickers in _load_json(path).values():
+            tickers.extend(t.upper().strip() for t in group_tickers)
+    return list(dict.fromkeys(t for t in tickers if t))
+
+def refresh_indicators(price_frames):
+    for ticker, df in price_frames.items():
+        try:
+            save_stock_insight(ticker, incremental_indicators(ticker, df))
+        except Exception as e:
+            logging.warning(f"Failed to compute indicators for {ticker}: {e}")
+
+def run_prefetch(tickers=None):
+    tickers = watched_tickers() if tickers is None else tickers
+    if not tickers:
+        logging.info("No watched tickers to prefetch")
+        return {}
+    started = time.monotonic()
+
+    # 가격은 묶음 단위로 일괄 다운로드하고, 묶음들은 공유 스레드 풀에서 동시에 실행한다
+    batches = [tickers[i:i + PREFETCH_BATCH_SIZE] for i in range(0, len(tickers), PREFETCH_BATCH_SIZE)]
+    price_futures = {i: submit_fetch(get_group_stock_data, batch) for i, batch in enumerate(batches)}
+    meta_futures = {ticker: submit_fetch(get_ticker_meta, ticker) for ticker in tickers}
+    dividend_futures = {ticker: submit_fetch(get_dividend_history, ticker, force=True) for ticker in tickers}
+
+    price_frames = {}
+    for frames in gather(price_futures, default={}).values():
+        price_frames.update(frames)
+    refresh_indicators(price_frames)
+    gather(meta_futures)
+    dividends = gather(dividend_futures)
+
+    sweep_expired(force=True)
+
+    logging.info(
+        f"Prefetched {len(price_frames)}/{len(tickers)} price histories, "
+        f"{sum(df is not None for df in dividends.values())} dividend tables "
+        f"in {time.monotonic() - started:.1f}s"
+    )
+    return price_frames
+
+def _load_last_run():
+    state = _load_json(PREFETCH_STATE_FILE)
+    last_run = state.get("last_run")
+    return pd.Timestamp(last_run) if last_run else None
+
+def _save_last_run(ts):
+    atomic_write(
+        PREFETCH_STATE_FILE,
+        lambda f: json.dump({"last_run": ts.isoformat()}, f),
+        mode="w", encoding="utf-8"
+    )
+
+def run_forever():
+    while True:
+        now = market_now()
+        last_run = _load_last_run()
+        # 마지막 장 마감 이후 아직 갱신하지 않았다면 (서버 재시작 등) 바로 실행한다
+        if last_run is None or last_run < last_session_close(now):
+            try:
+                run_prefetch()
+                _save_last_run(now)
+            except Exception as e:
+                logging.exception(f"Prefetch run failed: {e}")
+        wake_at = next_session_close(market_now())
+        logging.info(f"Next prefetch at {wake_at}")
+        time.sleep(max(60.0, (wake_at - market_now()).total_seconds()))
+
+_background_thread = None
+_background_lock = threading.Lock()
+
+def start_background_prefetch():
+    """Streamlit 서버 프로세스 안에서 한 번만 스케줄러 스레드를 띄운다."""
+    global _background_thread
+    with _background_lock:
+        if _background_thread is None or not _background_thread.is_alive():
+            _background_thread = threading.Thread(target=run_forever, name="prefetch", daemon=True)
+            _background_thread.start()
+
+if __name__ == "__main__":
+    if "--once" in sys.argv:
+        run_prefetch()
+    else:
+        run_forever()
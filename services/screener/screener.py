@@ -0,0 +1,125 @@
+import os
+import time
+import logging
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+
+from services.favorite_stocks.stock_data import recall_prices, load_cached_prices, get_group_stock_data
+from services.favorite_stocks.price_store import price_store_path, read_arrays
+from services.favorite_stocks.indicators import calculate_group_indicators
+from services.screener.signals import gap_signal, aux_signal
+from utils.constants import (
+    SCREENER_UNIVERSE_FILE, SCREENER_BATCH_SIZE, SCREENER_LOAD_WORKERS, PREFETCH_BATCH_SIZE
+)
+from utils.fetch_executor import submit_fetch, gather
+
+# 로컬 종목 목록 전체에 관심종목 지표와 신호 규칙을 적용해 티커 인덱스 테이블을 만든다.
+# 가격은 로컬 캐시(.ohlcv)를 DataFrame 없이 memmap 배열로 스레드 풀에서 병렬로 읽고, 지표는 SCREENER_BATCH_SIZE 종목씩
+# (봉 위치, 종목) 행렬로 한 번에 계산한다. memmap은 종목마다 파일 하나를 열어 두므로 읽기도 같은 묶음 단위로 하고
+# 묶음 계산이 끝나면 배열을 놓는다 (열린 파일 수가 묶음 크기를 넘지 않는다).
+# 결과 테이블은 screen()의 df.query 식으로 거르고 정렬한다.
+#   예) screen(table, "RSI < 30 and 장기이격도 < -15", sort_by="RSI")
+#   열 이름에 공백/기호가 있으면 백틱으로 감싼다: "`RSI-Stoch` < 25"
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s:%(message)s")
+
+SIGNAL_COLUMNS = {
+    "단기신호": ("단기이격도", "단기"),
+    "중기신호": ("중기이격도", "중기"),
+    "장기신호": ("장기이격도", "장기"),
+}
+AUX_SIGNAL_COLUMNS = {"RSI신호": "RSI", "Stoch신호": "Stoch", "RSI-Stoch신호": "RSI-Stoch"}
+
+def load_universe(path=SCREENER_UNIVERSE_FILE):
+    """한 줄에 티커 하나(쉼표/공백 구분도 허용, # 뒤는 주석)인 목록 파일을 읽는다."""
+    if not os.path.exists(path):
+        return []
+    tickers = []
+    with open(path, "r", encoding="utf-8-sig") as f:
+        for line in f:
+            line = line.split("#", 1)[0]
+            tickers.extend(t.upper() for t in line.replace(",", " ").split())
+    return list(dict.fromkeys(tickers))
+
+def _price_arrays(df):
+    return {"Close": df["Close"].to_numpy(), "High": df["High"].to_numpy(), "Low": df["Low"].to_numpy(), "date": df.index[-1]}
+
+def _load_local(ticker):
+    # 메모리 캐시 → .ohlcv 저장소(DataFrame 없이 memmap 배열만) → 이전 CSV 순서로 찾는다
+    try:
+        df = recall_prices(ticker)
+        if df is not None:
+            return _price_arrays(df)
+        path = price_store_path(ticker)
+        if os.path.exists(path):
+            arrays, header = read_arrays(path)
+            return {**arrays, "date": header["last_date"]} if header["rows"] else None
+        df, _, _ = load_cached_prices(ticker)
+    except Exception as e:
+        logging.warning(f"Failed to load cached prices for {ticker}: {e}")
+        return None
+    return _price_arrays(df) if df is not None and not df.empty else None
+
+def load_local_prices(tickers, workers=SCREENER_LOAD_WORKERS):
+    """로컬 캐시에 있는 가격만 병렬로 읽는다 (네트워크 호출 없음).
+    {티커: {"Close", "High", "Low": 배열, "date": 마지막 봉 Timestamp}}"""
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="screener-load") as pool:
+        loaded = dict(zip(tickers, pool.map(_load_local, tickers)))
+    return {ticker: prices for ticker, prices in loaded.items() if prices is not None}
+
+def refresh_prices(tickers):
+    """관심종목 예열과 같은 묶음 다운로드로 가격 캐시를 갱신한다. load_local_prices와 같은 형식."""
+    batches = [tickers[i:i + PREFETCH_BATCH_SIZE] for i in range(0, len(tickers), PREFETCH_BATCH_SIZE)]
+    futures = {i: submit_fetch(get_group_stock_data, batch) for i, batch in enumerate(batches)}
+    price_frames = {}
+    for frames in gather(futures, default={}).values():
+        price_frames.update(frames)
+    return {ticker: _price_arrays(df) for ticker, df in price_frames.items() if not df.empty}
+
+def build_screener_table(price_frames, batch_size=SCREENER_BATCH_SIZE):
+    """load_local_prices 결과의 지표·신호 테이블 (인덱스: Ticker)."""
+    tickers = list(price_frames)
+    tables = [
+        calculate_group_indicators({ticker: price_frames[ticker] for ticker in tickers[i:i + batch_size]})
+        for i in range(0, len(tickers), batch_size)
+    ]
+    tables = [table for table in tables if not table.empty]
+    if not tables:
+        return pd.DataFrame(index=pd.Index([], name="Ticker"))
+    table = pd.concat(tables)
+
+    table.insert(0, "현재가", [price_frames[ticker]["Close"][-1] for ticker in table.index])
+    table.insert(1, "기준일", [price_frames[ticker]["date"].strftime("%Y-%m-%d") for ticker in table.index])
+    table.insert(2, "봉수", [len(price_frames[ticker]["Close"]) for ticker in table.index])
+    for column, (gap_column, label) in SIGNAL_COLUMNS.items():
+        table[column] = gap_signal(table[gap_column].to_numpy(), label)
+    for column, value_column in AUX_SIGNAL_COLUMNS.items():
+        table[column] = aux_signal(table[value_column].to_numpy())
+    return table
+
+def run_screener(tickers, refresh=False, batch_size=SCREENER_BATCH_SIZE):
+    """tickers 전체의 스크리너 테이블. refresh=True면 가격 캐시를 먼저 묶음 다운로드로 갱신한다."""
+    started = time.monotonic()
+    tables, load_time = [], 0.0
+    for i in range(0, len(tickers), batch_size):
+        batch = tickers[i:i + batch_size]
+        loading = time.monotonic()
+        price_frames = refresh_prices(batch) if refresh else load_local_prices(batch)
+        load_time += time.monotonic() - loading
+        tables.append(build_screener_table(price_frames, batch_size))
+        # 다음 묶음을 읽기 전에 이 묶음의 memmap(열린 파일)을 놓는다
+        del price_frames
+    tables = [table for table in tables if not table.empty]
+    table = pd.concat(tables) if tables else pd.DataFrame(index=pd.Index([], name="Ticker"))
+    logging.info(
+        f"Screened {len(table)}/{len(tickers)} tickers "
+        f"(load {load_time:.2f}s, indicators {time.monotonic() - started - load_time:.2f}s)"
+    )
+    return table
+
+def screen(table, query=None, sort_by=None, ascending=True, limit=None):
+    """query(df.query 식)로 거른 뒤 sort_by 열로 정렬하고 limit개까지 반환한다."""
+    result = table.query(query) if query else table
+    if sort_by:
+        result = result.sort_values(sort_by, ascending=ascending, na_position="last")
+    return result.head(limit) if limit else result
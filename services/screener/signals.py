@@ -0,0 +1,18 @@
+import numpy as np
+
+# 관심종목 지표 테이블의 이격도/보조지표 신호 규칙.
+# 스칼라와 종목별 배열 모두 같은 식으로 계산한다 (NaN은 어느 조건에도 걸리지 않아 "중립").
+
+GAP_THRESHOLDS = {"단기": 5, "중기": 10, "장기": 15}
+DEFAULT_GAP_THRESHOLD = 10
+AUX_BUY_BELOW = 30
+AUX_SELL_ABOVE = 70
+
+def gap_signal(gap, label):
+    threshold = GAP_THRESHOLDS.get(label, DEFAULT_GAP_THRESHOLD)
+    gap = np.asarray(gap, dtype=float)
+    return np.select([gap >= threshold, gap <= -threshold], ["매도", "매수"], "중립")[()]
+
+def aux_signal(value):
+    value = np.asarray(value, dtype=float)
+    return np.select([value < AUX_BUY_BELOW, value > AUX_SELL_ABOVE], ["매수", "매도"], "중립")[()]
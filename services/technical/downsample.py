@@ -0,0 +1,46 @@
+import numpy as np
+
+# 차트 표시용 시계열 축소 (LTTB: Largest-Triangle-Three-Buckets).
+# 첫 봉과 마지막 봉을 남기고 가운데 봉을 max_points-2개 구간으로 나눈 뒤, 구간마다 직전에 고른 점과
+# 다음 구간의 평균점이 이루는 삼각형 넓이가 가장 큰 봉을 고른다. 급등락과 추세 모양은 유지하면서
+# 점 수를 차트 가로 픽셀 수 정도로 줄인다. x는 봉 위치(0, 1, 2, ...)로 본다.
+# 전체 고점/저점 봉은 LTTB가 고르지 않아도 항상 포함한다 (피보나치 레벨의 기준점이 차트에서 사라지지 않게).
+# NaN 봉은 넓이 비교에서 제외되고, 구간 전체가 NaN이면 구간의 첫 봉을 고른다.
+
+def lttb_positions(values, max_points):
+    """values에서 표시할 봉 위치(오름차순 정수 배열).
+    길이가 max_points 이하이면 전체 위치를 그대로 반환한다."""
+    y = np.asarray(values, dtype=float)
+    n = len(y)
+    if n <= max(max_points, 2):
+        return np.arange(n)
+    max_points = max(max_points, 3)
+    finite = np.isfinite(y)
+
+    # 가운데 봉 1..n-2를 구간 max_points-2개로 나눈 경계와 구간 평균점
+    buckets = max_points - 2
+    edges = (np.arange(buckets + 1) * ((n - 2) / buckets)).astype(np.int64) + 1
+    edges[-1] = n - 1
+    sums = np.add.reduceat(np.where(finite, y, 0.0), edges[:-1])
+    counts = np.add.reduceat(finite.astype(np.int64), edges[:-1])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_y = sums / counts
+    mean_x = (edges[:-1] + edges[1:] - 1) / 2
+    # 마지막 구간의 "다음 구간"은 마지막 봉
+    mean_x = np.append(mean_x[1:], n - 1)
+    mean_y = np.append(mean_y[1:], y[-1])
+
+    positions = np.empty(max_points, dtype=np.int64)
+    positions[0], positions[-1] = 0, n - 1
+    a = 0
+    for i in range(buckets):
+        start, stop = edges[i], edges[i + 1]
+        xs = np.arange(start, stop)
+        area = np.abs((a - mean_x[i]) * (y[start:stop] - y[a]) - (a - xs) * (mean_y[i] - y[a]))
+        a = start + int(np.argmax(np.where(np.isnan(area), -1.0, area)))
+        positions[i + 1] = a
+
+    if finite.any():
+        extremes = [int(np.nanargmax(y)), int(np.nanargmin(y))]
+        positions = np.union1d(positions, extremes)
+    return positions
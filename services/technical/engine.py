@@ -0,0 +1,212 @@
+import numpy as np
+import pandas as pd
+
+from services.technical.extrema import rolling_min, rolling_max, as_price_array
+
+# 기술적 지표 계산 엔진.
+# 지표 목록(spec)을 한 번에 받아 diff, 누적합, 이동창 합계/최솟값/최댓값, EMA 같은 중간 결과를 공유하며 NumPy로 계산한다.
+# 이동창 최솟값/최댓값은 extrema 모듈의 커널을 쓴다 (창 크기에 거의 무관).
+# 입력은 (n,) 또는 (n, 종목수) 배열이며 항상 axis 0(시간) 방향으로 계산한다.
+# float32 입력(가격 저장소 압축 모드)은 복사 없이 그대로 받고, 최솟값/최댓값은 입력 정밀도로,
+# 누적합/차분/수익률/EMA처럼 오차가 쌓이는 단계만 float64로 넓혀 계산한다. 결과는 항상 float64.
+#
+# spec 예시와 결과 키:
+#   ("ma", 20)             → "MA20"
+#   ("ema", 12)            → "EMA12"
+#   ("rsi", 14)            → "RSI14"
+#   ("macd", 12, 26, 9)    → "MACD", "MACD_SIGNAL", "MACD_HIST"
+#   ("stoch", 14, 3)       → "STOCH14", "STOCH14_D3"   (high/low가 없으면 종가로 계산)
+#   ("bollinger", 20, 2)   → "BB20_MID", "BB20_STD", "BB20_UPPER", "BB20_LOWER"
+#   ("returns",)           → "RETURN"  (일간 수익률, pct_change)
+#   ("sigma",)             → "SIGMA"   (일간 수익률 표준편차 %, 스칼라 또는 종목별 배열)
+#
+# pandas rolling(window=n)과 같게 창 안에 NaN이 하나라도 있으면 NaN이다.
+# EMA는 ewm(adjust=False)와 같으며 앞쪽 NaN은 건너뛰고 첫 유효값부터 시작한다.
+
+# EMA 폐형식 계산에서 (1-alpha)^-k 가 이 값을 넘지 않도록 구간을 나눈다
+_EMA_MAX_SCALE = 1e150
+
+class _Workspace:
+    def __init__(self, close, high=None, low=None):
+        self.close = close
+        self.high = close if high is None else high
+        self.low = close if low is None else low
+        self._cache = {}
+
+    def _memo(self, key, fn):
+        if key not in self._cache:
+            self._cache[key] = fn()
+        return self._cache[key]
+
+    def prefix(self, name, x):
+        # (유효값 누적 개수, 누적합, 기준값). 정밀도를 위해 열마다 첫 유효값을 빼고 더한다.
+        def build():
+            valid = ~np.isnan(x)
+            shift = _first_valid(x).astype(np.float64)
+            centered = np.where(valid, x.astype(np.float64, copy=False) - shift, 0.0)
+            zeros = np.zeros((1,) + x.shape[1:])
+            counts = np.concatenate([zeros, np.cumsum(valid, axis=0)])
+            sums = np.concatenate([zeros, np.cumsum(centered, axis=0)])
+            return counts, sums, centered, shift
+        return self._memo(("prefix", name), build)
+
+    def prefix_squares(self, name, x):
+        def build():
+            centered = self.prefix(name, x)[2]
+            zeros = np.zeros((1,) + x.shape[1:])
+            return np.concatenate([zeros, np.cumsum(centered * centered, axis=0)])
+        return self._memo(("squares", name), build)
+
+    def _window_sums(self, name, x, window):
+        # (창 안 유효값이 모두 찬 위치, 창 합계) - 결과는 window-1 위치부터 시작한다
+        def build():
+            counts, sums, _, _ = self.prefix(name, x)
+            return counts[window:] - counts[:-window] == window, sums[window:] - sums[:-window]
+        return self._memo(("window", name, window), build)
+
+    def rolling_mean(self, name, x, window):
+        def build():
+            mean = np.full(x.shape, np.nan)
+            if window <= len(x):
+                full, s1 = self._window_sums(name, x, window)
+                mean[window - 1:] = np.where(full, s1 / window + self.prefix(name, x)[3], np.nan)
+            return mean
+        return self._memo(("mean", name, window), build)
+
+    def rolling_std(self, name, x, window):
+        def build():
+            std = np.full(x.shape, np.nan)
+            if 1 < window <= len(x):
+                full, s1 = self._window_sums(name, x, window)
+                squares = self.prefix_squares(name, x)
+                s2 = squares[window:] - squares[:-window]
+                var = np.maximum(s2 - s1 * s1 / window, 0.0) / (window - 1)
+                std[window - 1:] = np.where(full, np.sqrt(var), np.nan)
+            return std
+        return self._memo(("std", name, window), build)
+
+    def rolling_extreme(self, name, x, window, kernel):
+        # kernel은 extrema 모듈의 rolling_min 또는 rolling_max
+        return self._memo(("extreme", name, window, kernel.__name__), lambda: kernel(x, window))
+
+    def diff(self):
+        def build():
+            out = np.full(self.close.shape, np.nan)
+            np.subtract(self.close[1:], self.close[:-1], out=out[1:], dtype=np.float64)
+            return out
+        return self._memo("diff", build)
+
+    def gain_loss(self):
+        def build():
+            delta = self.diff()
+            return np.where(delta > 0, delta, np.where(np.isnan(delta), np.nan, 0.0)), \
+                np.where(delta < 0, -delta, np.where(np.isnan(delta), np.nan, 0.0))
+        return self._memo("gain_loss", build)
+
+    def ema(self, name, x, span):
+        return self._memo(("ema", name, span), lambda: ema(x, span))
+
+    def returns(self):
+        def build():
+            out = np.full(self.close.shape, np.nan)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                np.divide(self.close[1:], self.close[:-1], out=out[1:], dtype=np.float64)
+            out[1:] -= 1
+            return out
+        return self._memo("returns", build)
+
+def _first_valid(x):
+    # 열마다 첫 유효값 (모두 NaN이면 0)
+    valid = ~np.isnan(x)
+    idx = np.argmax(valid, axis=0)
+    first = np.take_along_axis(x, np.expand_dims(idx, 0), axis=0)[0] if x.ndim > 1 else x[idx]
+    return np.where(np.any(valid, axis=0), first, 0.0)
+
+def ema(x, span):
+    """pandas ewm(span=span, adjust=False).mean()과 같은 지수이동평균 (axis 0)."""
+    x = np.asarray(x, dtype=float)
+    alpha = 2.0 / (span + 1)
+    decay = 1.0 - alpha
+    n = len(x)
+    out = np.full(x.shape, np.nan)
+    if n == 0:
+        return out
+
+    # 앞쪽 NaN은 첫 유효값으로 채워 계산한 뒤 다시 NaN으로 되돌린다 (상수 구간의 EMA는 그 값 그대로)
+    leading = np.cumsum(~np.isnan(x), axis=0) == 0
+    filled = np.where(leading, _first_valid(x), x)
+
+    # y_t = decay^t * (decay * y_-1 + alpha * sum_k x_k * decay^-k) 를 구간별 누적합으로 계산한다
+    chunk = max(1, min(n, int(np.log(_EMA_MAX_SCALE) / -np.log(decay)) if decay > 0 else n))
+    state = filled[0]
+    for start in range(0, n, chunk):
+        block = filled[start:start + chunk]
+        k = np.arange(len(block), dtype=float).reshape((-1,) + (1,) * (x.ndim - 1))
+        growth = decay ** -k
+        acc = decay * state + alpha * np.cumsum(block * growth, axis=0)
+        out[start:start + chunk] = acc / growth
+        state = out[start + len(block) - 1]
+    out[leading] = np.nan
+    return out
+
+def compute(close, specs, high=None, low=None):
+    """specs에 나열된 지표를 한 번에 계산하여 {키: 배열}로 반환한다. 입력 배열은 수정하지 않는다."""
+    close = as_price_array(close)
+    ws = _Workspace(close, None if high is None else as_price_array(high), None if low is None else as_price_array(low))
+    results = {}
+
+    for spec in specs:
+        kind, params = spec[0], spec[1:]
+        if kind == "ma":
+            (window,) = params
+            results[f"MA{window}"] = ws.rolling_mean("close", close, window)
+        elif kind == "ema":
+            (span,) = params
+            results[f"EMA{span}"] = ws.ema("close", close, span)
+        elif kind == "rsi":
+            (window,) = params
+            gain, loss = ws.gain_loss()
+            avg_gain = ws.rolling_mean("gain", gain, window)
+            avg_loss = ws.rolling_mean("loss", loss, window)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                results[f"RSI{window}"] = 100 - 100 / (1 + avg_gain / avg_loss)
+        elif kind == "macd":
+            fast, slow, signal = params if params else (12, 26, 9)
+            line = ws.ema("close", close, fast) - ws.ema("close", close, slow)
+            signal_line = ws.ema(("macd", fast, slow), line, signal)
+            results["MACD"] = line
+            results["MACD_SIGNAL"] = signal_line
+            results["MACD_HIST"] = line - signal_line
+        elif kind == "stoch":
+            window, smooth = params if len(params) == 2 else (params[0], 3)
+            lowest = ws.rolling_extreme("low", ws.low, window, rolling_min)
+            highest = ws.rolling_extreme("high", ws.high, window, rolling_max)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                k = 100 * (close - lowest) / (highest - lowest)
+            results[f"STOCH{window}"] = k
+            results[f"STOCH{window}_D{smooth}"] = ws.rolling_mean(("stoch", window), k, smooth)
+        elif kind == "bollinger":
+            window, width = params if len(params) == 2 else (params[0], 2)
+            mid, std = ws.rolling_mean("close", close, window), ws.rolling_std("close", close, window)
+            results[f"BB{window}_MID"] = mid
+            results[f"BB{window}_STD"] = std
+            results[f"BB{window}_UPPER"] = mid + width * std
+            results[f"BB{window}_LOWER"] = mid - width * std
+        elif kind == "returns":
+            results["RETURN"] = ws.returns()
+        elif kind == "sigma":
+            returns = ws.returns()
+            valid = ~np.isnan(returns)
+            count = valid.sum(axis=0)
+            mean = np.where(valid, returns, 0.0).sum(axis=0) / np.maximum(count, 1)
+            var = np.square(np.where(valid, returns - mean, 0.0)).sum(axis=0) / np.maximum(count - 1, 1)
+            results["SIGMA"] = np.where(count > 1, np.sqrt(var) * 100, np.nan)[()]
+        else:
+            raise ValueError(f"Unknown indicator spec: {spec}")
+    return results
+
+def indicator_frame(close, specs, high=None, low=None):
+    """1차원 종가 Series를 받아 같은 인덱스의 지표 DataFrame을 반환한다 (스칼라 지표는 제외)."""
+    results = compute(close, specs, high=high, low=low)
+    columns = {key: values for key, values in results.items() if np.ndim(values) == 1}
+    return pd.DataFrame(columns, index=close.index)
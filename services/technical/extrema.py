@@ -0,0 +1,93 @@
+import numpy as np
+
+# 이동창 최솟값/최댓값 커널과 가격 범위(고점/저점, 낙폭, 피보나치) 계산.
+# 이동창 계산은 길이 1, 2, 4, ... 창의 최솟값을 겹쳐 가며 두 배씩 넓히고(겹침 배가),
+# 마지막에 길이 window 창을 두 개의 2^k 창의 겹침으로 구한다. 파이썬 반복은 log2(window)번뿐이고
+# 나머지는 NumPy 벡터 연산이라 창 크기가 커져도 거의 일정한 시간이 든다.
+# 결과는 단조 덱과 같다: 값과 창 안에서 처음 나온 위치(동률이면 앞쪽).
+# 입력은 (n,) 또는 (n, 종목수) 배열이며 항상 axis 0(시간) 방향으로 계산한다.
+# pandas rolling(window=n).min()/max()와 같게 창 안에 NaN이 있으면 NaN이고, 위치는 -1이다.
+
+FIB_LEVELS = (0.0, 0.236, 0.382, 0.5, 0.618, 0.786, 1.0)
+
+def as_price_array(values):
+    """float32/float64 배열은 그대로(복사 없이), 그 밖의 입력은 float64 배열로 바꾼다.
+    최솟값/최댓값은 비교만 하므로 float32 입력도 정밀도 손실이 없다."""
+    if hasattr(values, "to_numpy"):
+        values = values.to_numpy()
+    values = np.asarray(values)
+    return values if values.dtype in (np.float32, np.float64) else values.astype(np.float64)
+
+def _rolling_min(x, window, with_positions):
+    n = len(x)
+    values = np.full(x.shape, np.nan)
+    positions = np.full(x.shape, -1, dtype=np.int64) if with_positions else None
+    if window < 1 or window > n:
+        return values, positions
+
+    current = x
+    found = np.broadcast_to(np.arange(n).reshape((-1,) + (1,) * (x.ndim - 1)), x.shape) if with_positions else None
+    span = 1
+    while span * 2 <= window:
+        left, right = current[:-span], current[span:]
+        if with_positions:
+            # 동률이면 앞쪽 창의 위치를 남긴다
+            found = np.where(right < left, found[span:], found[:-span])
+        current = np.minimum(left, right)
+        span *= 2
+
+    # 길이 window 창 = [i, i+span) 창과 [i+window-span, i+window) 창의 겹침
+    left, right = current[:n - window + 1], current[window - span:]
+    values[window - 1:] = np.minimum(left, right)
+    if with_positions:
+        chosen = np.where(right < left, found[window - span:], found[:n - window + 1])
+        positions[window - 1:] = np.where(np.isnan(values[window - 1:]), -1, chosen)
+    return values, positions
+
+def rolling_min(x, window):
+    """이동창 최솟값 배열."""
+    return _rolling_min(as_price_array(x), window, False)[0]
+
+def rolling_max(x, window):
+    """이동창 최댓값 배열."""
+    return -_rolling_min(-as_price_array(x), window, False)[0]
+
+def rolling_extrema(x, window):
+    """(최솟값, 최댓값, 최솟값 위치, 최댓값 위치)를 한 번에 반환한다. 위치는 창 안에서 처음 나온 절대 인덱스."""
+    x = as_price_array(x)
+    low, low_pos = _rolling_min(x, window, True)
+    high, high_pos = _rolling_min(-x, window, True)
+    return low, -high, low_pos, high_pos
+
+def price_range(close, window=None):
+    """마지막 window개 종가(None이면 전체)의 고점/저점과 현재가의 낙폭·회복률(%)을 dict로 반환한다.
+    Series.max()/min()처럼 NaN은 건너뛰고, 현재가는 구간의 마지막 유효 종가다.
+    전체 구간 하나의 최댓값/최솟값이라 이동창 커널 대신 nanargmax/nanargmin 한 번씩으로 구한다 (같은 값이면 앞쪽 위치)."""
+    values = as_price_array(close)
+    start = 0 if window is None else max(len(values) - window, 0)
+    values = values[start:]
+    valid = np.flatnonzero(~np.isnan(values))
+    if valid.size == 0:
+        return {"high": np.nan, "low": np.nan, "high_pos": -1, "low_pos": -1, "drawdown": np.nan, "recovery": np.nan}
+    high_pos, low_pos = int(np.nanargmax(values)), int(np.nanargmin(values))
+    high, low, current = float(values[high_pos]), float(values[low_pos]), float(values[valid[-1]])
+    return {
+        "high": high,
+        "low": low,
+        "high_pos": start + high_pos,
+        "low_pos": start + low_pos,
+        "drawdown": (current - high) / high * 100,
+        "recovery": (current - low) / low * 100,
+    }
+
+def fibonacci_levels(low, high, levels=FIB_LEVELS):
+    """저점→고점 구간의 피보나치 되돌림 가격 목록 (levels 순서)."""
+    return [low + (high - low) * level for level in levels]
+
+def fibonacci_zone(price, low, high, levels=FIB_LEVELS):
+    """price가 놓인 인접 레벨 쌍 (하단 레벨, 상단 레벨). 범위 밖이면 None."""
+    prices = fibonacci_levels(low, high, levels)
+    for i in range(len(prices) - 1):
+        if prices[i] <= price <= prices[i + 1]:
+            return levels[i], levels[i + 1]
+    return None
@@ -11,6 +11,12 @@ import os, sys
 import importlib
 from urllib.parse import unquote
 from components.nav import render_nav  # Assuming this module exists
+from utils.constants import PREFETCH_IN_SERVER
+
+# 장 마감 후 관심종목 캐시 예열 스레드 (서버 프로세스당 한 번만 시작됨)
+if PREFETCH_IN_SERVER:
+    from services.prefetch.scheduler import start_background_prefetch
+    start_background_prefetch()
 
 
 # Hide default sidebar elements
@@ -81,6 +87,10 @@ elif current_page == "favorite_stocks":
     import pages.favorite_stocks as favorite_stocks
     importlib.reload(favorite_stocks)
     favorite_stocks.render()
+elif current_page == "screener":
+    import pages.screener as screener
+    importlib.reload(screener)
+    screener.render()
 elif current_page == "my_dividend_report":
     import pages.my_dividend_report as my_dividend_report
     importlib.reload(my_dividend_report)
@@ -0,0 +1,147 @@
+import os
+import re
+import time
+import logging
+import sqlite3
+import threading
+
+from utils.constants import (
+    CACHE_CATALOG_FILE, CACHE_SWEEP_INTERVAL_SECONDS, FILE_EXPIRY_DAYS, STOCK_HISTORY_DAYS,
+    STOCK_DATA_DIR, STOCK_INSIGHT_DIR
+)
+
+# 캐시 파일마다 (티커, 종류, 기간, 크기, 만료 시각)을 기록하는 색인.
+# 조회와 만료 정리를 디렉터리 스캔 대신 색인으로 처리하고, 정리는 일정 주기마다 한 번만 실행한다.
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    path TEXT PRIMARY KEY,
+    ticker TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    start_date TEXT,
+    end_date TEXT,
+    size INTEGER NOT NULL,
+    updated_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_ticker_kind ON entries (ticker, kind, updated_at);
+CREATE INDEX IF NOT EXISTS entries_expires ON entries (expires_at);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+# 색인 도입 이전에 만들어진 파일을 처음 한 번 등록할 때 쓰는 파일명 규칙
+LEGACY_PATTERNS = [
+    (STOCK_DATA_DIR, re.compile(r"^(?P<ticker>.+)_(?P<date>\d{8})\.csv$"), "prices_csv"),
+    (STOCK_DATA_DIR, re.compile(r"^(?P<ticker>.+)\.ohlcv$"), "prices"),
+    (STOCK_INSIGHT_DIR, re.compile(r"^(?P<ticker>.+)_(?P<date>\d{8})\.csv$"), "insight"),
+]
+
+# 종류별 보관 기간(일). 가격 저장소(.ohlcv)는 증분 갱신의 기반이므로 보관 기간 창(STOCK_HISTORY_DAYS)이 지나
+# 겹치는 봉이 없어질 때까지 남긴다. 그 밖의 날짜별 파일(인사이트, 보고서, 이전 CSV)은 FILE_EXPIRY_DAYS.
+KIND_EXPIRY_DAYS = {"prices": STOCK_HISTORY_DAYS}
+
+def expiry_days(kind):
+    return KIND_EXPIRY_DAYS.get(kind, FILE_EXPIRY_DAYS)
+
+_init_lock = threading.Lock()
+_initialized = False
+_next_sweep = 0.0
+
+def _connect():
+    conn = sqlite3.connect(CACHE_CATALOG_FILE, timeout=10)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+def _ensure_catalog():
+    global _initialized
+    if _initialized:
+        return
+    with _init_lock:
+        if _initialized:
+            return
+        with _connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            indexed = conn.execute("SELECT value FROM meta WHERE key = 'indexed'").fetchone()
+            if indexed is None:
+                _index_existing_files(conn)
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('indexed', '1')")
+            # 보관 기간이 바뀌었을 수 있으므로 종류별 보관 기간이 따로 있는 항목의 만료 시각을 다시 계산한다
+            for kind, days in KIND_EXPIRY_DAYS.items():
+                conn.execute("UPDATE entries SET expires_at = updated_at + ? WHERE kind = ?", (days * 86400, kind))
+        _initialized = True
+
+def _index_existing_files(conn):
+    count = 0
+    for folder, pattern, kind in LEGACY_PATTERNS:
+        if not os.path.isdir(folder):
+            continue
+        for fname in os.listdir(folder):
+            match = pattern.match(fname)
+            if match is None:
+                continue
+            path = os.path.join(folder, fname)
+            stat = os.stat(path)
+            date = match.groupdict().get("date")
+            _upsert(conn, path, match.group("ticker"), kind, None, date, stat.st_size, stat.st_mtime)
+            count += 1
+    logging.info(f"Indexed {count} existing cache files into {CACHE_CATALOG_FILE}")
+
+def _upsert(conn, path, ticker, kind, start_date, end_date, size, updated_at):
+    conn.execute(
+        """INSERT OR REPLACE INTO entries
+           (path, ticker, kind, start_date, end_date, size, updated_at, expires_at)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+        (path, ticker, kind, start_date, end_date, size, updated_at,
+         updated_at + expiry_days(kind) * 86400)
+    )
+
+def record_entry(path, ticker, kind, start_date=None, end_date=None):
+    _ensure_catalog()
+    with _connect() as conn:
+        _upsert(conn, path, ticker, kind, start_date, end_date, os.path.getsize(path), time.time())
+
+def remove_entry(path):
+    _ensure_catalog()
+    with _connect() as conn:
+        conn.execute("DELETE FROM entries WHERE path = ?", (path,))
+
+def lookup(ticker, kind):
+    """(ticker, kind)의 가장 최근 항목을 dict로 반환한다. 만료되었거나 없으면 None."""
+    _ensure_catalog()
+    with _connect() as conn:
+        row = conn.execute(
+            """SELECT * FROM entries WHERE ticker = ? AND kind = ? AND expires_at > ?
+               ORDER BY updated_at DESC LIMIT 1""",
+            (ticker, kind, time.time())
+        ).fetchone()
+    return dict(row) if row is not None else None
+
+def sweep_expired(force=False):
+    """만료된 캐시 파일을 삭제한다. 요청 경로에서 불려도 CACHE_SWEEP_INTERVAL_SECONDS마다 한 번만 동작한다."""
+    global _next_sweep
+    now = time.time()
+    if not force and now < _next_sweep:
+        return 0
+    _next_sweep = now + CACHE_SWEEP_INTERVAL_SECONDS
+    _ensure_catalog()
+
+    with _connect() as conn:
+        # 여러 프로세스가 함께 쓰므로 마지막 정리 시각도 색인에 남긴다
+        last = conn.execute("SELECT value FROM meta WHERE key = 'last_sweep'").fetchone()
+        if not force and last is not None and now - float(last["value"]) < CACHE_SWEEP_INTERVAL_SECONDS:
+            return 0
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('last_sweep', ?)", (str(now),))
+        expired = [row["path"] for row in conn.execute("SELECT path FROM entries WHERE expires_at <= ?", (now,))]
+
+        for path in expired:
+            try:
+                os.remove(path)
+                logging.info(f"Deleted expired file: {path}")
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logging.warning(f"Could not delete expired file {path}: {e}")
+                continue
+            conn.execute("DELETE FROM entries WHERE path = ?", (path,))
+    return len(expired)
@@ -15,3 +15,101 @@ FILE_EXPIRY_DAYS = 7
 
 # 오늘 날짜 문자열
 TODAY_STR = datetime.datetime.today().strftime("%Y%m%d")
+
+# 장시간 실행되는 프로세스(서버, 프리페치 스케줄러)는 임포트 시점이 아닌 현재 날짜를 써야 한다
+def today_str():
+    return datetime.datetime.today().strftime("%Y%m%d")
+
+# 가격 데이터 보관 기간 및 증분 갱신 설정
+STOCK_HISTORY_PERIOD = "3y"
+STOCK_HISTORY_DAYS = 365 * 3
+# 증분 조회 시 기존 캐시와 겹치게 다시 받아올 일수 (분할/배당 재조정 감지용)
+DELTA_OVERLAP_DAYS = 5
+# 겹치는 구간 종가 비교 허용 오차 (상대값)
+RESTATEMENT_RTOL = 1e-4
+
+# 네트워크 조회 동시 실행 설정
+FETCH_MAX_WORKERS = int(os.environ.get("FETCH_MAX_WORKERS", "8"))
+YAHOO_HOST = "finance.yahoo.com"
+STOCKANALYSIS_HOST = "stockanalysis.com"
+# 호스트별 토큰 버킷 (초당 요청 수, 최대 버스트)
+FETCH_RATE_LIMITS = {
+    YAHOO_HOST: (4.0, 8),
+    STOCKANALYSIS_HOST: (1.0, 2),
+}
+FETCH_DEFAULT_RATE_LIMIT = (5.0, 5)
+
+# 프로세스 공용 가격 데이터 메모리 캐시 (바이트, 초)
+PRICE_CACHE_MAX_BYTES = int(os.environ.get("PRICE_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+PRICE_CACHE_TTL_SECONDS = int(os.environ.get("PRICE_CACHE_TTL_SECONDS", str(6 * 60 * 60)))
+
+# 종목 메타데이터(.info) 캐시
+TICKER_META_FILE = os.path.join(DATA_DIR, "ticker_meta.json")
+TICKER_META_TTL_DAYS = 7
+QUOTE_TTL_SECONDS = 300
+
+# 시세 데이터 제공자 설정 ("yahoo", "replay", "record")
+MARKET_DATA_PROVIDER = os.environ.get("MARKET_DATA_PROVIDER", "yahoo")
+REPLAY_FIXTURE_DIR = os.environ.get("REPLAY_FIXTURE_DIR", os.path.join(DATA_DIR, "fixtures"))
+# replay 제공자에 주입할 지연(ms)과 오류 비율(0~1)
+REPLAY_LATENCY_MS = float(os.environ.get("REPLAY_LATENCY_MS", "0"))
+REPLAY_ERROR_RATE = float(os.environ.get("REPLAY_ERROR_RATE", "0"))
+REPLAY_SEED = int(os.environ.get("REPLAY_SEED", "0"))
+
+# 장 마감 후 관심종목 일괄 갱신 (미국 동부 시간 기준)
+DIVIDEND_REPORT_GROUPS_FILE = os.path.join(DATA_DIR, "my_dividend_report_groups.json")
+PREFETCH_STATE_FILE = os.path.join(DATA_DIR, "prefetch_state.json")
+PREFETCH_RUN_AT = "16:30"
+PREFETCH_BATCH_SIZE = 20
+PREFETCH_IN_SERVER = os.environ.get("PREFETCH_IN_SERVER", "0") == "1"
+
+# 캐시 파일 색인 (SQLite) 및 만료 정리 주기
+CACHE_CATALOG_FILE = os.path.join(DATA_DIR, "cache_catalog.sqlite")
+CACHE_SWEEP_INTERVAL_SECONDS = 60 * 60
+
+# 배당 이력 (stockanalysis.com) 로컬 저장소 및 재수집 주기
+DIVIDEND_HISTORY_DIR = os.path.join(DATA_DIR, "dividend_history")
+DIVIDEND_REFRESH_HOURS = 12
+
+# 직접 HTTP 요청 (연결 재사용, ETag/Last-Modified 재검증)
+HTTP_CACHE_DIR = os.path.join(DATA_DIR, "http_cache")
+HTTP_TIMEOUT_SECONDS = 15
+HTTP_USER_AGENT = "Mozilla/5.0"
+
+# 시세 제공자 호출 보호 (타임아웃, 재시도, 호스트별 차단기)
+# 요청별 타임아웃은 yfinance/requests에 직접 넘긴다. 전용 스레드 풀 대기는 그래도 돌아오지 않는 호출에 대한 안전장치로,
+# yfinance 한 호출이 여러 요청(시간대/쿠키 조회)을 보내고 .info는 자체 30초 타임아웃을 쓰므로 넉넉히 잡는다.
+PROVIDER_TIMEOUT_SECONDS = float(os.environ.get("PROVIDER_TIMEOUT_SECONDS", "20"))
+PROVIDER_BACKSTOP_SECONDS = PROVIDER_TIMEOUT_SECONDS * 3
+PROVIDER_RETRY_ATTEMPTS = 3
+PROVIDER_BACKOFF_BASE_SECONDS = 0.5
+PROVIDER_BACKOFF_MAX_SECONDS = 4.0
+# 연속 실패 횟수가 기준을 넘으면 COOLDOWN 동안 호출하지 않고 마지막 성공 값을 돌려준다
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_COOLDOWN_SECONDS = 60
+STALE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+STALE_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# 티커별 증분 지표 상태 (이동창 합계, 단조 덱) 저장 경로
+INDICATOR_STATE_DIR = os.path.join(DATA_DIR, "indicator_state")
+
+# 지표 계산 결과 메모리 캐시 (티커, 마지막 봉, 지표 목록 단위)
+INDICATOR_CACHE_MAX_BYTES = 8 * 1024 * 1024
+INDICATOR_CACHE_ENTRY_BYTES = 2048
+
+# 스크리너 대상 종목 목록 (한 줄에 티커 하나, #은 주석) 및 일괄 계산 단위
+SCREENER_UNIVERSE_FILE = os.path.join(DATA_DIR, "screener_universe.txt")
+SCREENER_BATCH_SIZE = 500
+SCREENER_LOAD_WORKERS = 16
+
+# 가격 저장소 압축 모드: float32 값 + 이벤트 컬럼(배당/분할) 희소 저장 (메모리 절반 이하)
+PRICE_COMPACT_MODE = os.environ.get("PRICE_COMPACT_MODE", "0") == "1"
+
+# 긴 기간 차트: 표시 점 수 상한(차트 가로 픽셀 수 정도, 넘으면 LTTB로 축소)과
+# SVG 대신 WebGL(Scattergl) 선으로 그리는 기준 (그림 한 장의 선 점 수 합계)
+CHART_MAX_POINTS = 1200
+CHART_WEBGL_POINTS = 5000
+
+# 종목 분석 보고서(ETF/주식 페이지): (티커, 기준일) 단위 디스크 보관 경로와 메모리 캐시 예산
+ANALYSIS_REPORT_DIR = os.path.join(DATA_DIR, "analysis_report")
+ANALYSIS_REPORT_CACHE_MAX_BYTES = 32 * 1024 * 1024
@@ -1,14 +1,15 @@
 import streamlit as st
-import requests
 import pandas as pd
-import yfinance as yf
-from bs4 import BeautifulSoup
+import numpy as np
+from services.dividends.dividend_store import get_dividend_history
+from services.market_data.provider import get_provider
+from services.market_data.resilient_provider import is_stale
 
 # 금리 및 지수 가격 조회
 def fetch_price(ticker):
     try:
         # Fetch data for the last 5 days to handle weekends/holidays
-        data = yf.Ticker(ticker).history(period="5d")
+        data = get_provider().history(ticker, period="5d")
         if not data.empty:
             # Get the most recent available closing price
             return data["Close"].iloc[-1]
@@ -18,79 +19,51 @@ def fetch_price(ticker):
         print(f"Error fetching data for {ticker}: {e}")
         return None  # Return None if an error occurs
 
-# 배당 정보 크롤링
-@st.cache_data(ttl=3600)
-def get_etf_dividend_data(ticker: str) -> pd.DataFrame:
-    print(f"[{ticker.upper()}] 🧰 웹에서 수집 (캐시 무상 또는 TTL 만료 시)")
-
-    url = f"https://stockanalysis.com/etf/{ticker.upper()}/dividend/"
-    headers = {"User-Agent": "Mozilla/5.0"}
-    response = requests.get(url, headers=headers)
-    if response.status_code != 200:
-        raise Exception(f"Failed to fetch page: {response.status_code}")
-
-    soup = BeautifulSoup(response.text, "html.parser")
-    div_table = soup.find("div", attrs={"data-test": "dividend-table"})
-    if div_table is None:
-        raise Exception("Cannot find dividend table div")
-
-    table = div_table.find("table")
-    if table is None:
-        raise Exception("Cannot find table tag")
-
-    tbody = table.find("tbody")
-    if tbody is None:
-        raise Exception("Cannot find tbody")
-
-    rows = []
-    for tr in tbody.find_all("tr"):
-        cells = tr.find_all("td")
-        if len(cells) < 5:
-            continue
-        rows.append({
-            "Ex-Dividend Date": cells[0].get_text(strip=True),
-            "Cash Amount": cells[1].get_text(strip=True),
-            "Declaration Date": cells[2].get_text(strip=True),
-            "Record Date": cells[3].get_text(strip=True),
-            "Pay Date": cells[4].get_text(strip=True),
-        })
-
-    df = pd.DataFrame(rows)
+# 종목 정보 / 배당 이력 조회 (공유 스레드 풀에서 실행)
+def fetch_ticker_info(ticker):
+    return get_provider().info(ticker)
 
-    # 날짜 변환
-    for col in ["Ex-Dividend Date", "Declaration Date", "Record Date", "Pay Date"]:
-        df[col] = pd.to_datetime(df[col], format="%b %d, %Y", errors="coerce")
+def fetch_dividends(ticker):
+    return get_provider().dividends(ticker)
 
-    # 배당금 숫자 처리
-    df["Cash Amount"] = (
-        df["Cash Amount"].str.replace("$", "", regex=False).str.replace(",", "", regex=False)
-    )
-    df["Cash Amount"] = pd.to_numeric(df["Cash Amount"], errors="coerce")
+# 배당 정보 크롤링 (티커별 로컬 이력에 새 배당락일 행만 덧붙인다)
+@st.cache_data(ttl=3600)
+def _cached_dividend_data(ticker: str) -> pd.DataFrame:
+    return get_dividend_history(ticker)
 
-    # 정렬
-    df = df.sort_values("Ex-Dividend Date", ascending=False).reset_index(drop=True)
+def get_etf_dividend_data(ticker: str) -> pd.DataFrame:
+    df = _cached_dividend_data(ticker)
+    if is_stale(df):
+        # 페이지를 받지 못해 마지막 성공 값으로 만든 이력은 캐시에 남기지 않아 다음 요청에서 다시 긁는다
+        _cached_dividend_data.clear(ticker)
     return df
 
-# 기준일 가격 조회 (개별 수익률 계산용)
-def get_price_for_dividend(ticker: str, div_date: pd.Timestamp) -> float:
-    try:
-        div_date = pd.to_datetime(div_date).tz_localize(None)  # ✅ 날짜도 명확히 비표준화
-
-        ticker_obj = yf.Ticker(ticker)
-        start = (div_date - pd.Timedelta(days=5)).strftime("%Y-%m-%d")
-        end = (div_date + pd.Timedelta(days=1)).strftime("%Y-%m-%d")
-        hist = ticker_obj.history(start=start, end=end)
+# 배당락일별 기준가 조회 (전체 기간을 한 번에 조회한 뒤 as-of 조인)
+def get_reference_prices(ticker: str, div_dates: pd.Series) -> pd.Series:
+    dates = pd.to_datetime(div_dates, errors="coerce").dt.tz_localize(None).astype("datetime64[ns]")
+    reference = pd.Series(np.nan, index=div_dates.index, name="Reference Price")
+    valid = dates.dropna()
+    if valid.empty:
+        return reference
 
-        if hist.empty:
-            print(f"[{ticker}] ❌ 기준가 조회 실패: 데이터 없음")
-            return None
-
-        hist.index = hist.index.tz_localize(None)  # ✅ 인덱스도 표준화
-
-        valid = hist[hist.index <= div_date]
-        if not valid.empty:
-            return valid["Close"].iloc[-1]
-        return hist["Close"].iloc[0]
+    try:
+        start = (valid.min() - pd.Timedelta(days=5)).strftime("%Y-%m-%d")
+        end = (valid.max() + pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+        hist = get_provider().history(ticker, start=start, end=end)
     except Exception as e:
         print(f"[{ticker}] ❌ 기준가 조회 실패: {e}")
-        return None
+        return reference
+    if hist.empty:
+        print(f"[{ticker}] ❌ 기준가 조회 실패: 데이터 없음")
+        return reference
+
+    closes = pd.DataFrame({
+        "date": hist.index.tz_localize(None).astype("datetime64[ns]"),
+        "close": hist["Close"].to_numpy(),
+    }).sort_values("date")
+    left = pd.DataFrame({"date": valid, "row": valid.index}).sort_values("date")
+
+    # 배당락일 이전 5일 이내 마지막 종가 (기존 개별 조회의 5일 구간과 동일)
+    matched = pd.merge_asof(left, closes, on="date", direction="backward", tolerance=pd.Timedelta(days=5))
+    reference.loc[matched["row"].to_numpy()] = matched["close"].to_numpy()
+    return reference
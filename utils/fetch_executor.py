@@ -0,0 +1,67 @@
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from utils.constants import FETCH_MAX_WORKERS, FETCH_RATE_LIMITS, FETCH_DEFAULT_RATE_LIMIT
+
+# 모든 Streamlit 세션이 공유하는 네트워크 조회용 스레드 풀과 호스트별 토큰 버킷.
+# 토큰은 실제로 요청을 보내는 곳(ResilientProvider의 호출 시도마다)에서만 받아 초당 요청 수를 제한한다 (Yahoo 429 방지).
+# 풀에 넘기는 함수가 메모리/디스크 캐시에서 바로 돌려주면 속도 제한을 기다리지 않는다.
+
+class TokenBucket:
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+_executor = None
+_buckets = {}
+_lock = threading.Lock()
+
+def get_executor():
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=FETCH_MAX_WORKERS, thread_name_prefix="fetch")
+        return _executor
+
+def get_bucket(host):
+    with _lock:
+        if host not in _buckets:
+            rate, capacity = FETCH_RATE_LIMITS.get(host, FETCH_DEFAULT_RATE_LIMIT)
+            _buckets[host] = TokenBucket(rate, capacity)
+        return _buckets[host]
+
+def host_of(url):
+    return urlparse(url).hostname or url
+
+def submit_fetch(fn, *args, **kwargs):
+    """fn을 공유 스레드 풀에서 실행하고 Future를 반환한다."""
+    return get_executor().submit(fn, *args, **kwargs)
+
+def gather(futures, default=None):
+    """{키: Future}를 {키: 결과}로 모은다. 실패한 작업은 로그를 남기고 default로 채운다."""
+    results = {}
+    for key, future in futures.items():
+        try:
+            results[key] = future.result()
+        except Exception as e:
+            logging.warning(f"Fetch failed for {key}: {e}")
+            results[key] = default
+    return results
@@ -0,0 +1,13 @@
+import os
+import threading
+
+def atomic_write(path, write_fn, mode="wb", **open_kwargs):
+    """임시 파일에 쓴 뒤 os.replace로 교체하여 다른 세션이 반쯤 쓰인 파일을 읽지 않게 한다."""
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, mode, **open_kwargs) as f:
+            write_fn(f)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
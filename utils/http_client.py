@@ -0,0 +1,77 @@
+import os
+import json
+import hashlib
+import logging
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+
+from utils.constants import FETCH_MAX_WORKERS, HTTP_CACHE_DIR, HTTP_TIMEOUT_SECONDS, HTTP_USER_AGENT
+from utils.file_utils import atomic_write
+
+# 프로세스 전체가 공유하는 requests.Session.
+# 호스트별 연결 풀로 keep-alive를 유지하고, 이전 응답의 ETag/Last-Modified로 조건부 요청을 보내
+# 바뀌지 않은 페이지는 304 응답만 받고 디스크에 저장해 둔 본문을 돌려준다.
+
+_session = None
+_lock = threading.Lock()
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    # requests.Session에는 기본 타임아웃이 없으므로, timeout 없이 보낸 요청도 무한정 기다리지 않게 한다
+    def send(self, request, timeout=None, **kwargs):
+        return super().send(request, timeout=HTTP_TIMEOUT_SECONDS if timeout is None else timeout, **kwargs)
+
+def get_session():
+    global _session
+    with _lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = TimeoutHTTPAdapter(pool_connections=FETCH_MAX_WORKERS, pool_maxsize=FETCH_MAX_WORKERS)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update({"User-Agent": HTTP_USER_AGENT, "Accept-Encoding": "gzip, deflate"})
+            _session = session
+    return _session
+
+def _cache_path(url):
+    return os.path.join(HTTP_CACHE_DIR, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json")
+
+def _load_cached(url):
+    path = _cache_path(url)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError) as e:
+        logging.warning(f"Ignoring unreadable HTTP cache entry {path}: {e}")
+        return None
+    return entry if entry.get("url") == url else None
+
+def _save_cached(url, response):
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag is None and last_modified is None:
+        return
+    os.makedirs(HTTP_CACHE_DIR, exist_ok=True)
+    entry = {"url": url, "etag": etag, "last_modified": last_modified, "body": response.text}
+    atomic_write(_cache_path(url), lambda f: json.dump(entry, f, ensure_ascii=False), mode="w", encoding="utf-8")
+
+def get_text(url, headers=None, timeout=HTTP_TIMEOUT_SECONDS):
+    """GET 요청 본문을 반환한다. 저장된 검증자가 있으면 조건부 요청을 보내고 304면 저장된 본문을 쓴다."""
+    cached = _load_cached(url)
+    request_headers = dict(headers or {})
+    if cached is not None:
+        if cached.get("etag"):
+            request_headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            request_headers["If-Modified-Since"] = cached["last_modified"]
+
+    response = get_session().get(url, headers=request_headers, timeout=timeout)
+    if response.status_code == 304 and cached is not None:
+        logging.info(f"Not modified: {url}")
+        return cached["body"]
+    if response.status_code != 200:
+        raise Exception(f"Failed to fetch page: {response.status_code}")
+    _save_cached(url, response)
+    return response.text
@@ -0,0 +1,51 @@
+import pandas as pd
+
+from utils.constants import PREFETCH_RUN_AT
+
+# 미국 장 마감 기준 시각 계산.
+# 가격 캐시가 최신인지와 프리페치 실행 시각은 서버 시간대의 날짜가 아니라 뉴욕 장 마감(PREFETCH_RUN_AT) 기준으로 정한다.
+
+MARKET_TZ = "America/New_York"
+
+def market_now():
+    return pd.Timestamp.now(tz=MARKET_TZ)
+
+def last_session_close(now=None):
+    # now 이전의 가장 최근 평일 PREFETCH_RUN_AT 시각 (미국 동부 시간)
+    now = market_now() if now is None else now
+    hour, minute = map(int, PREFETCH_RUN_AT.split(":"))
+    candidate = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if candidate > now:
+        candidate -= pd.Timedelta(days=1)
+    while candidate.weekday() >= 5:
+        candidate -= pd.Timedelta(days=1)
+    return candidate
+
+def next_session_close(now=None):
+    now = market_now() if now is None else now
+    hour, minute = map(int, PREFETCH_RUN_AT.split(":"))
+    candidate = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if candidate <= now:
+        candidate += pd.Timedelta(days=1)
+    while candidate.weekday() >= 5:
+        candidate += pd.Timedelta(days=1)
+    return candidate
+
+def session_str(now=None):
+    """now 시점의 최신 가격이 반영하는 장 마감 날짜 (YYYYMMDD). 다음 장 마감이 지나야 바뀐다."""
+    return last_session_close(now).strftime("%Y%m%d")
+
+def fetched_str(now=None):
+    """가격 저장소 헤더에 남기는 조회 시각 (미국 동부 시간 ISO 문자열)."""
+    return (market_now() if now is None else now).isoformat()
+
+def is_fresh(fetched, now=None):
+    """fetched(조회 시각 문자열)가 가장 최근 장 마감 이후면 True.
+    시간대 없는 예전 형식(서버 날짜 YYYYMMDD, 레거시 CSV의 마지막 봉 날짜)은 장 마감 전후를 알 수 없으므로 한 번 다시 받는다."""
+    if not fetched:
+        return False
+    try:
+        fetched = pd.Timestamp(fetched)
+    except ValueError:
+        return False
+    return fetched.tz is not None and fetched >= last_session_close(now)
@@ -0,0 +1,54 @@
+import time
+import threading
+from collections import OrderedDict
+
+# 여러 Streamlit 세션이 함께 쓰는 프로세스 단위 LRU 캐시.
+# 메모리 예산(바이트)을 넘으면 가장 오래 안 쓴 항목부터, TTL이 지나면 조회 시점에 제거한다.
+
+class MemoryCache:
+    def __init__(self, max_bytes, ttl_seconds):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.current_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, nbytes, expires_at = entry
+            if time.monotonic() >= expires_at:
+                self._pop(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value, nbytes):
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+            if nbytes > self.max_bytes:
+                return
+            self._entries[key] = (value, nbytes, time.monotonic() + self.ttl_seconds)
+            self.current_bytes += nbytes
+            while self.current_bytes > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+
+    def discard(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def _pop(self, key):
+        _, nbytes, _ = self._entries.pop(key)
+        self.current_bytes -= nbytes
+
+def frame_nbytes(df):
+    return int(df.memory_usage(index=True, deep=False).sum())
@@ -0,0 +1,51 @@
+import threading
+
+# 같은 키에 대한 동시 요청을 하나로 합친다.
+# 먼저 들어온 호출(leader)만 실제 조회를 하고, 나머지는 그 결과(또는 예외)를 함께 받는다.
+
+class Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+    def wait(self):
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+class SingleFlight:
+    def __init__(self):
+        self._flights = {}
+        self._lock = threading.Lock()
+
+    def begin(self, key):
+        """(flight, leader 여부)를 반환한다. leader는 반드시 finish를 호출해야 한다."""
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                return flight, False
+            flight = Flight()
+            self._flights[key] = flight
+            return flight, True
+
+    def finish(self, key, flight, result=None, error=None):
+        flight.result = result
+        flight.error = error
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+        flight.done.set()
+
+    def do(self, key, fn, *args, **kwargs):
+        flight, leader = self.begin(key)
+        if not leader:
+            return flight.wait()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            self.finish(key, flight, error=e)
+            raise
+        self.finish(key, flight, result=result)
+        return result
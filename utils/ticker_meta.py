@@ -0,0 +1,89 @@
+import os
+import json
+import time
+import logging
+import threading
+
+from utils.constants import TICKER_META_FILE, TICKER_META_TTL_DAYS, QUOTE_TTL_SECONDS
+from services.market_data.provider import get_provider
+from services.market_data.resilient_provider import is_stale
+from utils.data_utils import fetch_ticker_info
+from utils.file_utils import atomic_write
+from utils.memory_cache import MemoryCache
+from utils.single_flight import SingleFlight
+
+# .info 는 가장 느린 호출이므로 잘 바뀌지 않는 필드는 파일에 며칠간 보관하고,
+# 현재가처럼 자주 바뀌는 값은 짧은 TTL의 메모리 캐시에서 가져온다.
+META_FIELDS = ("shortName", "longName", "quoteType", "exchange", "sector", "currency")
+
+_quotes = MemoryCache(max_bytes=1024 * 1024, ttl_seconds=QUOTE_TTL_SECONDS)
+_meta = None
+_flights = SingleFlight()
+_lock = threading.Lock()
+
+def _load_meta():
+    global _meta
+    if _meta is None:
+        _meta = {}
+        if os.path.exists(TICKER_META_FILE):
+            try:
+                with open(TICKER_META_FILE, "r", encoding="utf-8") as f:
+                    _meta = json.load(f)
+            except Exception as e:
+                logging.warning(f"Ignoring unreadable ticker meta file: {e}")
+    return _meta
+
+def _save_meta(meta):
+    atomic_write(
+        TICKER_META_FILE,
+        lambda f: json.dump(meta, f, ensure_ascii=False, indent=2),
+        mode="w", encoding="utf-8"
+    )
+
+def _remember_quote(ticker, price):
+    if price is not None:
+        _quotes.put(ticker, float(price), 64)
+
+def get_ticker_meta(ticker):
+    with _lock:
+        entry = _load_meta().get(ticker)
+    if entry and time.time() - entry["fetched_at"] < TICKER_META_TTL_DAYS * 86400:
+        return entry["fields"]
+
+    try:
+        info = _flights.do((ticker, "info"), fetch_ticker_info, ticker)
+    except Exception as e:
+        logging.warning(f"Failed to fetch info for {ticker}: {e}")
+        return entry["fields"] if entry else {}
+    fields = {key: info[key] for key in META_FIELDS if info.get(key) is not None}
+    if is_stale(info):
+        # 마지막 성공 응답이면 파일/현재가 캐시에 새 값처럼 남기지 않는다
+        return entry["fields"] if entry else fields
+    _remember_quote(ticker, info.get("regularMarketPrice"))
+    with _lock:
+        meta = _load_meta()
+        meta[ticker] = {"fetched_at": time.time(), "fields": fields}
+        _save_meta(meta)
+    return fields
+
+def get_quote(ticker):
+    price = _quotes.get(ticker)
+    if price is not None:
+        return price
+    try:
+        quote = get_provider().quote(ticker)
+    except Exception as e:
+        logging.warning(f"Failed to fetch quote for {ticker}: {e}")
+        return None
+    price = quote["last_price"]
+    if not is_stale(quote):
+        _remember_quote(ticker, price)
+    return price
+
+def get_ticker_info(ticker):
+    """.info 대신 쓰는 조회 함수. 메타데이터 필드와 regularMarketPrice만 채운 dict를 반환한다."""
+    info = dict(get_ticker_meta(ticker))
+    price = get_quote(ticker)
+    if price is not None:
+        info["regularMarketPrice"] = price
+    return info